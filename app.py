@@ -1,4 +1,7 @@
+import logging
+import uuid
 from dash import Dash, dcc
+from flask import Response, g, jsonify, request
 from flask_caching import Cache
 import dash_mantine_components as dmc
 from sidebar.layout import create_sidebar
@@ -8,70 +11,191 @@ from dashboard.callbacks import register_dashboard_callbacks
 from components.header import create_header
 from components.footer import create_footer
 from services.data_service import DataService
+from services.result_store import ResultStore
+from services.figure_cache import FigureCache
+from services.warmup import AccessLog, CacheWarmer
+from utils import metrics, tracing
 from config import (
     APP_NAME, APP_TITLE, CACHE_CONFIG, THEME,
     SIDEBAR_WIDTH, HEADER_HEIGHT, FOOTER_HEIGHT,
     GOOGLE_CLOUD_CREDENTIALS, PROJECT_ID,
-    DATASET_ID, TABLES_IDS, DATA_SOURCE_URL, GITHUB_REPO_URL
+    DATASET_ID, TABLES_IDS, DATA_SOURCE_URL, GITHUB_REPO_URL,
+    QUERY_BACKEND, PARQUET_DATA_DIR, PRELOAD_AGGREGATES, TOP_MOVIES_INDEX,
+    WARMUP_ENABLED, WARMUP_TOP_K, ACCESS_LOG_PATH, ACCESS_LOG_MAX_ENTRIES,
+    TOP_N_MOVIES, MIN_VOTES_THRESHOLD, MIN_YEAR, MAX_YEAR, MIN_RATING, MAX_RATING,
+    RUNTIME_MIN, RUNTIME_MAX, GENRES, CONSOLIDATED_CALLBACKS, ASYNC_CALLBACKS,
+    TRACE_SAMPLE_RATE, TRACE_EXPORTER, TRACE_PATH, TRACE_MAX_SPANS, RESULT_STORE_TTL, RESULT_STORE_MAX_BYTES,
+    FIGURE_CACHE_MAX_BYTES, FIGURE_CACHE_TTL
 )
 
 # Initialize Dash app
-app = Dash(__name__, title=APP_NAME)
+app = Dash(__name__, title=APP_NAME, use_async=ASYNC_CALLBACKS)
 server = app.server
 
+# Trace a sample of requests, linking the spans of each by its request ID
+tracing.TRACER.configure(
+    exporter=tracing.FileExporter(TRACE_PATH) if TRACE_EXPORTER == "file" else tracing.InMemoryExporter(TRACE_MAX_SPANS),
+    sample_rate=TRACE_SAMPLE_RATE,
+)
+
 # Initialize in-memory cache
 cache = Cache(app.server, config=CACHE_CONFIG)
 
+# Expose the memory held by byte-bounded cache backends
+if hasattr(cache.cache, "stats"):
+    cache_stats = cache.cache.stats
+    metrics.REGISTRY.callback("imdb_cache_bytes", "Bytes held by the cache", lambda: cache_stats()["bytes"])
+    metrics.REGISTRY.callback("imdb_cache_max_bytes", "Byte budget of the cache", lambda: cache_stats()["max_bytes"])
+    metrics.REGISTRY.callback("imdb_cache_entries", "Entries held by the cache", lambda: cache_stats()["entries"])
+    metrics.REGISTRY.callback("imdb_cache_evictions_total", "Entries evicted to stay within the byte budget", lambda: cache_stats()["evictions"], kind="counter")
+    metrics.REGISTRY.callback("imdb_cache_compression_ratio", "Uncompressed over stored bytes of the cached entries", lambda: cache_stats()["compression_ratio"])
+
 # Initialize data querying service
 data_service = DataService(
     credentials=GOOGLE_CLOUD_CREDENTIALS,
     project_id=PROJECT_ID,
     dataset_id=DATASET_ID,
     tables_ids=TABLES_IDS,
-    cache_instance=cache
+    cache_instance=cache,
+    backend=QUERY_BACKEND,
+    parquet_dir=PARQUET_DATA_DIR,
+    preload_aggregates=PRELOAD_AGGREGATES,
+    top_movies_index=TOP_MOVIES_INDEX
 )
 
-# Configure Mantine theme and AppShell layout
-app.layout = dmc.MantineProvider(
-    theme=THEME,
-    children=[
-        dcc.Location(id="url", refresh=False),
-        dmc.AppShell(
-            [
-                dmc.AppShellHeader(
-                    create_header(
-                        burger_menu_id="burger-menu",
-                        app_title=APP_TITLE
-                    )
-                ),
-                dmc.AppShellNavbar(
-                    id="navbar",
-                    children=create_sidebar(),
-                    p=0
-                ),
-                dmc.AppShellMain(create_dashboard()),
-                dmc.AppShellFooter(create_footer(
-                    data_source_url=DATA_SOURCE_URL,
-                    github_repo_url=GITHUB_REPO_URL
-                ))
-            ],
-            header={"height": HEADER_HEIGHT},
-            footer={"height": FOOTER_HEIGHT},
-            navbar={
-                "width": SIDEBAR_WIDTH,
-                "breakpoint": "sm",
-                "collapsed": {"mobile": True}
-            },
-            padding="md",
-            id="appshell"
-        )
+# Keep the chart data server-side, the dcc.Stores only hold handles to it
+result_store = ResultStore(RESULT_STORE_MAX_BYTES, timeout=RESULT_STORE_TTL)
+metrics.REGISTRY.callback("imdb_result_store_bytes", "Bytes held by the chart result store", lambda: result_store.stats()["bytes"])
+
+# Reuse the figures rendered for the same chart data
+figure_cache = FigureCache(FIGURE_CACHE_MAX_BYTES, timeout=FIGURE_CACHE_TTL) if FIGURE_CACHE_MAX_BYTES else None
+if figure_cache:
+    metrics.REGISTRY.callback("imdb_figure_cache_bytes", "Bytes held by the figure cache", lambda: figure_cache.stats()["bytes"])
+    metrics.REGISTRY.callback("imdb_figure_cache_entries", "Figures held by the figure cache", lambda: figure_cache.stats()["entries"])
+
+# Record requested filter states so the next boot can prefetch the most frequent ones
+access_log = AccessLog(ACCESS_LOG_PATH, max_entries=ACCESS_LOG_MAX_ENTRIES)
+
+# Warm up the cache in the background; the readiness endpoint reports progress
+cache_warmer = CacheWarmer(data_service, top_n_movies=TOP_N_MOVIES, min_votes=MIN_VOTES_THRESHOLD)
+if WARMUP_ENABLED:
+    default_filters = {
+        "year_range": [MIN_YEAR, MAX_YEAR],
+        "rating_range": [MIN_RATING, MAX_RATING],
+        "runtime_range": [RUNTIME_MIN, RUNTIME_MAX],
+    }
+    filter_states = [
+        {**default_filters, "genres": []},
+        {**default_filters, "genres": GENRES},  # Sidebar's initial selection
     ]
-)
+    try:
+        access_log.compact()
+        filter_states += access_log.most_frequent(WARMUP_TOP_K)
+    except OSError as e:
+        logging.warning(f"Could not read access log, warming up default filters only: {e}")
+    cache_warmer.start(filter_states)
+
+
+@server.before_request
+def start_request_trace():
+    """Start the trace of a request, reusing the caller's X-Request-ID if it sent one."""
+    g.request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    g.trace_token = tracing.TRACER.start_trace(g.request_id, path=request.path)
+
+
+@server.teardown_request
+def end_request_trace(exc):
+    token = g.pop("trace_token", None)
+    if token is not None:
+        tracing.TRACER.end_trace(token)
+
+
+@server.after_request
+def set_request_id(response):
+    if "request_id" in g:
+        response.headers["X-Request-ID"] = g.request_id
+    return response
+
+
+@server.route("/ready")
+def ready():
+    """Readiness probe: 200 once the cache warm-up has finished, 503 before."""
+    is_ready = not WARMUP_ENABLED or cache_warmer.is_ready
+    return jsonify(cache_warmer.progress()), 200 if is_ready else 503
+
+
+@server.route("/bigquery/jobs")
+def bigquery_jobs():
+    """Most expensive query shapes among the recent BigQuery jobs."""
+    by = request.args.get("by", "total_bytes_billed")
+    try:
+        summary = data_service.job_ledger.summary(top_n=request.args.get("top", 10, type=int), by=by)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(summary)
+
+
+@server.route("/traces")
+def traces():
+    """Recent spans of the in-memory exporter, optionally of one request (?request_id=...)."""
+    exporter = tracing.TRACER.exporter
+    if not isinstance(exporter, tracing.InMemoryExporter):
+        return jsonify({"error": "Spans are exported to a file"}), 404
+    return jsonify(exporter.spans(request.args.get("request_id")))
+
+
+@server.route("/metrics")
+def prometheus_metrics():
+    """Cache and query metrics in the Prometheus text format."""
+    return Response(metrics.REGISTRY.render(), mimetype="text/plain; version=0.0.4")
+
+
+# Configure Mantine theme and AppShell layout
+def serve_layout():
+    """Build the page layout, served anew on every page load so each tab gets its own session ID."""
+    return dmc.MantineProvider(
+        theme=THEME,
+        children=[
+            dcc.Location(id="url", refresh=False),
+            dmc.AppShell(
+                [
+                    dmc.AppShellHeader(
+                        create_header(
+                            burger_menu_id="burger-menu",
+                            app_title=APP_TITLE
+                        )
+                    ),
+                    dmc.AppShellNavbar(
+                        id="navbar",
+                        children=create_sidebar(),
+                        p=0
+                    ),
+                    dmc.AppShellMain(create_dashboard()),
+                    dmc.AppShellFooter(create_footer(
+                        data_source_url=DATA_SOURCE_URL,
+                        github_repo_url=GITHUB_REPO_URL
+                    ))
+                ],
+                header={"height": HEADER_HEIGHT},
+                footer={"height": FOOTER_HEIGHT},
+                navbar={
+                    "width": SIDEBAR_WIDTH,
+                    "breakpoint": "sm",
+                    "collapsed": {"mobile": True}
+                },
+                padding="md",
+                id="appshell"
+            )
+        ]
+    )
+
+
+app.layout = serve_layout
 
 
 # Register callback functions
-register_sidebar_callbacks(app, data_service)
-register_dashboard_callbacks(app, data_service)
+register_sidebar_callbacks(app, data_service, use_async=ASYNC_CALLBACKS)
+register_dashboard_callbacks(app, data_service, result_store, figure_cache=figure_cache, access_log=access_log, consolidated=CONSOLIDATED_CALLBACKS, use_async=ASYNC_CALLBACKS)
 
 if __name__ == "__main__":
     from config import DEBUG, PORT
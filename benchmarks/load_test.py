@@ -0,0 +1,373 @@
+"""
+Load test replaying dashboard sessions: each simulated session loads the dashboard, then
+drags the sliders, picks year ranges and toggles genres, sending the _dash-update-component
+requests a browser would, callback after callback as their inputs change.
+
+By default the sessions drive benchmarks.stand_in_app in process through the Flask test
+client, with at most workers * threads requests handled at once like gunicorn's gthread
+workers. The simulated workers share one process, so one cache and one GIL; run the app
+under gunicorn and pass --url to measure real workers.
+
+Usage:
+    python -m benchmarks.load_test [--sessions 20] [--actions 10] [--workers 2] [--threads 8] [--output load_test_results.json]
+    gunicorn benchmarks.stand_in_app:server --workers 2 --threads 8 --bind 127.0.0.1:8000
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --workers 2 --threads 8
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+UPDATE_PATH = "/_dash-update-component"
+ACTIONS = ("year_range", "rating_range", "runtime_range", "genres")
+
+class _Pool:
+    """Requests in flight against the workers * threads slots of the server."""
+
+    def __init__(self, capacity: int, enforce: bool):
+        """
+        Args:
+            capacity (int): Requests the server handles at once
+            enforce (bool): Wait for a free slot before sending, when the server is simulated in process
+        """
+        self.capacity = capacity
+        self._slots = threading.BoundedSemaphore(capacity) if enforce else None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.saturated_seconds = 0.0
+        self._saturated_since = None
+
+    @contextmanager
+    def slot(self):
+        """Hold a slot while a request is handled, yielding the seconds waited for it and whether all slots were busy."""
+        start = time.perf_counter()
+        queued = self.in_flight >= self.capacity
+        if self._slots is not None:
+            queued = not self._slots.acquire(blocking=False)
+            if queued:
+                self._slots.acquire()
+        wait = time.perf_counter() - start
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            if self.in_flight == self.capacity:
+                self._saturated_since = time.perf_counter()
+        try:
+            yield wait, queued
+        finally:
+            with self._lock:
+                if self.in_flight == self.capacity and self._saturated_since is not None:
+                    self.saturated_seconds += time.perf_counter() - self._saturated_since
+                    self._saturated_since = None
+                self.in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+class InProcessTransport:
+    """Sends requests to a Flask app through its test client."""
+
+    def __init__(self, server, pool: _Pool):
+        self.server = server
+        self.pool = pool
+
+    def get_json(self, path: str):
+        return self.server.test_client().get(path).get_json()
+
+    def get_cookies(self, path: str) -> list[str]:
+        """Get a page, returning the cookies it sets."""
+        return self.server.test_client().get(path).headers.getlist("Set-Cookie")
+
+    def post(self, path: str, payload: dict, cookie: str) -> tuple[int, dict | None, float, bool]:
+        """Post JSON with a cookie, returning the status, the JSON body, the seconds waited for a slot and whether all were busy."""
+        with self.pool.slot() as (wait, queued):
+            response = self.server.test_client().post(path, json=payload, headers={"Cookie": cookie})
+            body = response.get_json(silent=True) if response.status_code == 200 else None
+            return response.status_code, body, wait, queued
+
+class HttpTransport:
+    """Sends requests to a running server over HTTP."""
+
+    def __init__(self, url: str, pool: _Pool, timeout: float = 60.0):
+        self.url = url.rstrip("/")
+        self.pool = pool
+        self.timeout = timeout
+
+    def get_json(self, path: str):
+        with urllib.request.urlopen(self.url + path, timeout=self.timeout) as response:
+            return json.load(response)
+
+    def get_cookies(self, path: str) -> list[str]:
+        with urllib.request.urlopen(self.url + path, timeout=self.timeout) as response:
+            return response.headers.get_all("Set-Cookie") or []
+
+    def post(self, path: str, payload: dict, cookie: str) -> tuple[int, dict | None, float, bool]:
+        request = urllib.request.Request(
+            self.url + path,
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json", "Cookie": cookie},
+        )
+        with self.pool.slot() as (wait, queued):
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    body = json.load(response) if response.status == 200 else None
+                    return response.status, body, wait, queued
+            except urllib.error.HTTPError as e:
+                return e.code, None, wait, queued
+
+class Callback:
+    """A callback of the app, as listed by /_dash-dependencies."""
+
+    def __init__(self, dependency: dict):
+        self.key = dependency["output"]
+        # Multi-output keys look like "..a.figure...b.visible.."
+        parts = self.key[2:-2].split("...") if self.key.startswith("..") else [self.key]
+        self.outputs = [tuple(part.rsplit(".", 1)) for part in parts]
+        self.multi = self.key.startswith("..")
+        self.inputs = [(dep["id"], dep["property"]) for dep in dependency["inputs"]]
+        self.state = [(dep["id"], dep["property"]) for dep in dependency["state"]]
+        self.prevent_initial_call = dependency.get("prevent_initial_call", False)
+        self.label = ".".join(self.outputs[0])
+
+    def payload(self, values: dict, changed: set) -> dict:
+        """Build the _dash-update-component request body from the current property values."""
+        outputs = [{"id": id, "property": prop} for id, prop in self.outputs]
+        return {
+            "output": self.key,
+            "outputs": outputs if self.multi else outputs[0],
+            "inputs": [{"id": id, "property": prop, "value": values.get((id, prop))} for id, prop in self.inputs],
+            "state": [{"id": id, "property": prop, "value": values.get((id, prop))} for id, prop in self.state],
+            "changedPropIds": [f"{id}.{prop}" for id, prop in self.inputs if (id, prop) in changed],
+        }
+
+def layout_values(node, values: dict | None = None) -> dict:
+    """Collect the (id, property) -> value pairs of the components of a serialized layout."""
+    values = {} if values is None else values
+    if isinstance(node, list):
+        for child in node:
+            layout_values(child, values)
+    elif isinstance(node, dict):
+        props = node.get("props") if "type" in node else None
+        if isinstance(props, dict):
+            if isinstance(props.get("id"), str):
+                values.update({(props["id"], prop): value for prop, value in props.items() if prop != "children"})
+            for value in props.values():
+                layout_values(value, values)
+    return values
+
+class Session:
+    """One simulated browser session of the dashboard."""
+
+    def __init__(self, transport, callbacks: list[Callback], layout: dict, executor: ThreadPoolExecutor, records: list, rng: random.Random):
+        self.transport = transport
+        self.callbacks = callbacks
+        self.values = dict(layout)
+        self.executor = executor
+        self.records = records
+        self.rng = rng
+        self.cookie = ""
+
+    def load(self) -> None:
+        """Get the page and its layout, keeping the cookies and the tab's session ID, then fire the initial callbacks like the page does once loaded."""
+        self.cookie = "; ".join(cookie.split(";", 1)[0] for cookie in self.transport.get_cookies("/"))
+        self.values.update(layout_values(self.transport.get_json("/_dash-layout")))
+        self.values[("url", "pathname")] = "/"
+        initial = [cb for cb in self.callbacks if not cb.prevent_initial_call]
+        self._fire({key for cb in initial for key in cb.inputs}, initial_call=True)
+
+    def act(self, action: str) -> None:
+        """Change one filter like a user would and fire the callbacks depending on it."""
+        if action == "genres":
+            options = self.values.get(("genre-filter", "data")) or []
+            genres = [option["value"] if isinstance(option, dict) else option for option in options]
+            genres = [genre for genre in genres if isinstance(genre, str)]
+            if not genres:
+                return
+            selected = list(self.values.get(("genre-filter", "value")) or [])
+            genre = self.rng.choice(genres)
+            selected = [g for g in selected if g != genre] if genre in selected else selected + [genre]
+            self._set(("genre-filter", "value"), selected)
+        elif action == "year_range":
+            min_year = int(self.values[("year-range-filter", "minDate")][:4])
+            max_year = int(self.values[("year-range-filter", "maxDate")][:4])
+            start = self.rng.randint(min_year, max_year)
+            end = self.rng.randint(start, max_year)
+            self._set(("year-range-filter", "value"), [f"{start}-01-01", f"{end}-01-01"])
+        elif action == "rating_range":
+            self._set(("rating-range-filter", "value"), self._drag("rating-range-filter"))
+        elif action == "runtime_range":
+            self._set(("runtime-range-filter", "value"), self._drag("runtime-range-filter"))
+
+    def _drag(self, slider_id: str) -> list:
+        """Move one handle of a range slider, released at a step of the slider."""
+        min_value, max_value, step = (self.values[(slider_id, prop)] for prop in ("min", "max", "step"))
+        low, high = self.values.get((slider_id, "value")) or [min_value, max_value]
+        handle = self.rng.randrange(2)
+        value = round(min_value + self.rng.randint(0, round((max_value - min_value) / step)) * step, 6)
+        low, high = (min(value, high), high) if handle == 0 else (low, max(value, low))
+        return [low, high]
+
+    def _set(self, key, value) -> None:
+        self.values[key] = value
+        self._fire({key})
+
+    def _fire(self, changed: set, initial_call: bool = False) -> None:
+        """Fire the callbacks of changed inputs, then those of the outputs they update, until none is left."""
+        while changed:
+            triggered = [cb for cb in self.callbacks if any(key in changed for key in cb.inputs)]
+            if initial_call:
+                triggered = [cb for cb in triggered if not cb.prevent_initial_call]
+            if not triggered:
+                return
+            # Like the renderer, wait for callbacks updating an input before firing a callback
+            pending_outputs = {key for cb in triggered for key in cb.outputs}
+            ready = [cb for cb in triggered if not any(key in pending_outputs and key not in cb.outputs for key in cb.inputs)] or triggered
+            deferred = [cb for cb in triggered if cb not in ready]
+
+            updates = list(self.executor.map(lambda cb: self._call(cb, changed), ready))
+            next_changed = {key for cb in deferred for key in cb.inputs if key in changed}
+            for update in updates:
+                self.values.update(update)
+                next_changed.update(update)
+            changed = next_changed
+
+    def _call(self, callback: Callback, changed: set) -> dict:
+        """Send one callback request, recording its latency, and return the properties it updated."""
+        start = time.perf_counter()
+        record = {"callback": callback.label, "status": None, "wait": 0.0, "queued": False}
+        try:
+            status, body, record["wait"], record["queued"] = self.transport.post(UPDATE_PATH, callback.payload(self.values, changed), self.cookie)
+            record["status"] = status
+        except Exception as e:
+            record["error"] = type(e).__name__
+            return {}
+        finally:
+            record["latency"] = time.perf_counter() - start
+            self.records.append(record)
+        if status != 200 or not body:
+            return {}
+        return {(id, prop): value for id, props in body.get("response", {}).items() for prop, value in props.items()}
+
+def _percentile(values: list[float], percent: float) -> float | None:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    values = sorted(values)
+    return values[max(math.ceil(percent / 100 * len(values)) - 1, 0)]
+
+def summarize(records: list[dict], duration: float, pool: _Pool) -> dict:
+    """Latency percentiles per callback, throughput and saturation of the server's slots."""
+    callbacks = {}
+    for label in sorted({record["callback"] for record in records}):
+        calls = [record for record in records if record["callback"] == label]
+        latencies = [record["latency"] for record in calls]
+        callbacks[label] = {
+            "requests": len(calls),
+            "updated": sum(record["status"] == 200 for record in calls),
+            "prevented": sum(record["status"] == 204 for record in calls),
+            "errors": sum(record["status"] not in (200, 204) for record in calls),
+            "p50": _percentile(latencies, 50),
+            "p95": _percentile(latencies, 95),
+            "p99": _percentile(latencies, 99),
+            "max": max(latencies),
+        }
+    waits = [record["wait"] for record in records]
+    return {
+        "requests": len(records),
+        "duration": duration,
+        "throughput": len(records) / duration if duration else None,
+        "callbacks": callbacks,
+        "pool": {
+            "capacity": pool.capacity,
+            "max_in_flight": pool.max_in_flight,
+            "saturated_ratio": pool.saturated_seconds / duration if duration else None,
+            "queued_ratio": sum(record["queued"] for record in records) / len(records) if records else None,
+            "wait_p50": _percentile(waits, 50),
+            "wait_p95": _percentile(waits, 95),
+            "wait_p99": _percentile(waits, 99),
+        },
+    }
+
+def run(transport, sessions: int, actions: int, think_time: float, ramp_up: float, seed: int = 0) -> tuple[list[dict], float]:
+    """
+    Run the simulated sessions concurrently.
+
+    Returns:
+        tuple: Records of all callback requests and the wall time in seconds
+    """
+    callbacks = [Callback(dependency) for dependency in transport.get_json("/_dash-dependencies")]
+    layout = layout_values(transport.get_json("/_dash-layout"))
+    records = []
+
+    def _session(index: int):
+        rng = random.Random(seed + index)
+        time.sleep(rng.uniform(0, ramp_up))
+        session = Session(transport, callbacks, layout, callback_executor, records, rng)
+        session.load()
+        for _ in range(actions):
+            time.sleep(rng.uniform(0.5, 1.5) * think_time)
+            session.act(rng.choice(ACTIONS))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions * len(callbacks), thread_name_prefix="load-test-callback") as callback_executor, \
+            ThreadPoolExecutor(max_workers=sessions, thread_name_prefix="load-test-session") as session_executor:
+        for future in [session_executor.submit(_session, index) for index in range(sessions)]:
+            future.result()
+    return records, time.perf_counter() - start
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Base URL of a running server, instead of the stand-in app in process")
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent simulated sessions")
+    parser.add_argument("--actions", type=int, default=10, help="Filter changes per session after the first load")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Mean seconds between two filter changes of a session")
+    parser.add_argument("--ramp-up", type=float, default=2.0, help="Seconds over which the sessions start")
+    parser.add_argument("--workers", type=int, default=2, help="Gunicorn workers of the server")
+    parser.add_argument("--threads", type=int, default=8, help="Gunicorn threads per worker")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="load_test_results.json", help="JSON file the report is written to")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        transport = HttpTransport(args.url, _Pool(args.workers * args.threads, enforce=False))
+    else:
+        from benchmarks.stand_in_app import server
+        transport = InProcessTransport(server, _Pool(args.workers * args.threads, enforce=True))
+
+    records, duration = run(transport, args.sessions, args.actions, args.think_time, args.ramp_up, args.seed)
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "target": args.url or "in_process",
+        "sessions": args.sessions,
+        "actions": args.actions,
+        "think_time": args.think_time,
+        "workers": args.workers,
+        "threads": args.threads,
+        **summarize(records, duration, transport.pool),
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for label, stats in report["callbacks"].items():
+        print(
+            f"{label:<40} {stats['requests']:>6} req {stats['errors']:>4} err"
+            f"  p50 {stats['p50'] * 1000:8.1f} ms  p95 {stats['p95'] * 1000:8.1f} ms  p99 {stats['p99'] * 1000:8.1f} ms"
+        )
+    pool = report["pool"]
+    print(
+        f"{report['requests']} requests in {duration:.1f}s ({report['throughput']:.1f}/s), "
+        f"max {pool['max_in_flight']}/{pool['capacity']} in flight, saturated {pool['saturated_ratio']:.0%} of the time, "
+        f"{pool['queued_ratio']:.0%} of requests queued"
+    )
+    print(f"Wrote the report to {args.output}")
+    return report
+
+if __name__ == "__main__":
+    main()
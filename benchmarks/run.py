@@ -0,0 +1,162 @@
+"""
+Offline benchmarks of the data, serialization and chart paths on synthetic data.
+
+Usage:
+    python -m benchmarks.run [--scales 10k 1m 10m] [--repeat 5] [--output benchmark_results.json]
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+import polars as pl
+from config import TOP_N_MOVIES, MIN_VOTES_THRESHOLD
+from services.data_service import DataService
+from services.result_store import ResultStore
+from utils import tracing
+from utils.cache import deserialize_cache_data
+from utils.serialize import df_to_base64_ipc, df_from_base64_ipc
+from utils.sharded_lru_cache import ShardedLRUCache
+from components.bar_chart import create_bar_chart
+from components.area_chart import create_area_chart
+from components.combo_chart import create_combo_chart
+from components.dual_axis_line_chart import create_dual_axis_line_chart
+from benchmarks.synthetic import write_tables
+from benchmarks.stand_in import StandInClient, stand_in_results
+
+SCALES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+TABLES_IDS = {
+    "movies_details": "movies_details",
+    "year_genre_aggregates": "year_genre_aggregates",
+    "yearly_aggregates": "yearly_aggregates",
+    "runtime_distribution": "runtime_distribution",
+}
+
+# Filters of the benchmarked calls, close to the dashboard's defaults
+YEAR_RANGE = (1990, 2020)
+GENRES = ["Comedy", "Drama"]
+RATING_RANGE = (0.0, 10.0)
+RUNTIME_RANGE = (0, 300)
+CALLS = {
+    "get_top_movies": (YEAR_RANGE, GENRES, RATING_RANGE, RUNTIME_RANGE, TOP_N_MOVIES, MIN_VOTES_THRESHOLD),
+    "get_year_range": (),
+    "get_unique_genres": (),
+    "get_genre_trends": (YEAR_RANGE, GENRES),
+    "get_runtime_distribution": (RUNTIME_RANGE,),
+    "get_yearly_trends": (YEAR_RANGE,),
+}
+
+def _time(func, repeat: int) -> dict:
+    """Time func, after one warm-up call, and summarize the durations in seconds."""
+    func()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return {
+        "repeat": repeat,
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "mean": statistics.fmean(durations),
+        "max": max(durations),
+    }
+
+def _data_service(client=None, **kwargs) -> DataService:
+    with patch("services.data_service.get_bigquery_client", return_value=client):
+        return DataService({}, "benchmark", "synthetic", TABLES_IDS, **kwargs)
+
+def benchmark_scale(scale: str, repeat: int) -> list[dict]:
+    """Run all benchmarks on synthetic tables with the given number of movies."""
+    n_movies = SCALES[scale]
+    results = []
+
+    def add(group: str, name: str, func, **extra):
+        result = {"scale": scale, "n_movies": n_movies, "group": group, "name": name, **extra, **_time(func, repeat)}
+        results.append(result)
+        print(f"{scale:>4} {group:<24} {name:<44} median {result['median'] * 1000:9.3f} ms")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_tables(data_dir, n_movies)
+
+        parquet_service = _data_service(backend="parquet", parquet_dir=data_dir)
+        client = StandInClient(stand_in_results(parquet_service.tables, parquet_service.backend, CALLS.items()))
+        warehouse_service = _data_service(client)
+        cached_service = _data_service(client, cache_instance=ShardedLRUCache())
+
+        frames = {}
+        for method_name, args in CALLS.items():
+            add("data_service.parquet", method_name, lambda: getattr(parquet_service, method_name)(*args))
+            add("data_service.stand_in", method_name, lambda: getattr(warehouse_service, method_name)(*args))
+            add("data_service.cache_hit", method_name, lambda: getattr(cached_service, method_name)(*args))
+            frames[method_name] = getattr(warehouse_service, method_name)(*args)
+
+    for method_name in ("get_top_movies", "get_genre_trends", "get_runtime_distribution", "get_yearly_trends"):
+        df = frames[method_name]
+        payload = df_to_base64_ipc(df)
+        store = json.dumps({"cache_key": "benchmark", "data": payload})
+        add("serialize", f"df_to_base64_ipc.{method_name}", lambda: df_to_base64_ipc(df), rows=len(df), bytes=len(payload))
+        add("serialize", f"df_from_base64_ipc.{method_name}", lambda: df_from_base64_ipc(payload), rows=len(df), bytes=len(payload))
+        add("serialize", f"deserialize_cache_data.{method_name}", lambda: deserialize_cache_data(store), bytes=len(store))
+        result_store = ResultStore()
+        handle = result_store.put("benchmark", df)
+        add("result_store", f"put.{method_name}", lambda: result_store.put("benchmark", df), rows=len(df))
+        add("result_store", f"get.{method_name}", lambda: result_store.get(handle), rows=len(df))
+
+    # Same arguments as the render callbacks
+    charts = {
+        "create_bar_chart": lambda: create_bar_chart(
+            df=frames["get_top_movies"], x_col='average_rating', y_col='movie_title', color_col='total_votes', horizontal=True,
+            hover_name='movie_title', hover_data=['average_rating', 'total_votes', "genres", "release_year", "runtime_minutes", "is_adult"]
+        ),
+        "create_area_chart": lambda: create_area_chart(
+            df=frames["get_genre_trends"], x_col='release_year', y_col='total_movies', color_col='genre',
+            hover_name='genre', hover_data=['total_movies', 'average_rating', 'total_votes']
+        ),
+        "create_combo_chart": lambda: create_combo_chart(
+            df=frames["get_runtime_distribution"], x_col='runtime_bin', y_bar_col='total_movies', y_line_col='average_rating',
+            hover_name='runtime_bin', hover_data_bar=['total_movies', 'min_runtime', 'max_runtime'],
+            hover_data_line=['average_rating', 'min_runtime', 'max_runtime']
+        ),
+        "create_dual_axis_line_chart": lambda: create_dual_axis_line_chart(
+            df=frames["get_yearly_trends"], x_col='release_year', y1_col='total_movies', y2_col='average_rating',
+            hover_name='release_year', hover_data=['total_movies', 'average_rating']
+        ),
+    }
+    for name, func in charts.items():
+        add("chart", name, func)
+    return results
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", choices=SCALES, default=list(SCALES), help="Numbers of synthetic movies")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file the results are written to")
+    args = parser.parse_args(argv)
+
+    tracing.TRACER.configure(sample_rate=0.0)
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "polars": pl.__version__,
+        "machine": platform.machine(),
+        "results": [result for scale in args.scales for result in benchmark_scale(scale, args.repeat)],
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(report['results'])} results to {args.output}")
+    return report
+
+if __name__ == "__main__":
+    main()
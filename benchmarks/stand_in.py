@@ -0,0 +1,96 @@
+"""
+Stand-in BigQuery client answering the app's queries with precomputed results,
+optionally after an injected latency, so the warehouse path runs without credentials.
+"""
+import random
+import time
+import pyarrow as pa
+from config import TOP_N_MOVIES, MIN_VOTES_THRESHOLD, MIN_YEAR, MAX_YEAR, MIN_RATING, MAX_RATING, RUNTIME_MIN, RUNTIME_MAX
+from services.bigquery_backend import BigQueryBackend
+from services.query_builder import Query
+
+# One call per query shape the app can run, with the widest filters: a shape's result is
+# returned whatever the filter values, so results filtered further locally aren't empty
+YEAR_RANGE = (MIN_YEAR, MAX_YEAR)
+GENRES = ["Comedy", "Drama"]
+RATING_RANGE = (float(MIN_RATING), float(MAX_RATING))
+RUNTIME_RANGE = (RUNTIME_MIN, RUNTIME_MAX)
+QUERY_SHAPES = [
+    ("get_top_movies", (YEAR_RANGE, GENRES, RATING_RANGE, RUNTIME_RANGE, TOP_N_MOVIES, MIN_VOTES_THRESHOLD)),
+    ("get_top_movies", (YEAR_RANGE, [], RATING_RANGE, RUNTIME_RANGE, TOP_N_MOVIES, MIN_VOTES_THRESHOLD)),
+    ("get_top_movies", (YEAR_RANGE, GENRES, RATING_RANGE, None, TOP_N_MOVIES, MIN_VOTES_THRESHOLD)),
+    ("get_top_movies", (YEAR_RANGE, [], RATING_RANGE, None, TOP_N_MOVIES, MIN_VOTES_THRESHOLD)),
+    ("get_year_range", ()),
+    ("get_unique_genres", ()),
+    ("get_genre_trends", (YEAR_RANGE, GENRES)),
+    ("get_genre_trends", (YEAR_RANGE, [])),
+    ("get_runtime_distribution", (RUNTIME_RANGE,)),
+    ("get_yearly_trends", (YEAR_RANGE,)),
+]
+
+class StandInJob:
+    """Query job returning a precomputed result once its latency has elapsed."""
+
+    def __init__(self, table: pa.Table, latency: float = 0.0):
+        self._table = table
+        self._ready_at = time.monotonic() + latency
+        self.job_id = None
+        self.cache_hit = self.total_bytes_processed = self.total_bytes_billed = self.slot_millis = None
+        self.created = self.started = self.ended = None
+
+    def done(self) -> bool:
+        return time.monotonic() >= self._ready_at
+
+    def result(self):
+        remaining = self._ready_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        return self
+
+    def cancel(self) -> bool:
+        self._ready_at = time.monotonic()
+        return True
+
+    @property
+    def total_rows(self) -> int:
+        return self._table.num_rows
+
+    def to_arrow(self, bqstorage_client=None, create_bqstorage_client=False) -> pa.Table:
+        return self._table
+
+class StandInClient:
+    """BigQuery client answering each query shape with a precomputed Arrow result."""
+
+    def __init__(self, results: dict[str, pa.Table] | None = None, latency: float = 0.0, jitter: float = 0.0):
+        """
+        Args:
+            results (dict): Query fingerprint -> result table
+            latency (float): Seconds each job takes to finish
+            jitter (float): Maximum seconds added at random to the latency of each job
+        """
+        self.results = results or {}
+        self.latency = latency
+        self.jitter = jitter
+
+    def query(self, sql: str, job_config=None) -> StandInJob:
+        latency = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        return StandInJob(self.results[Query(sql).fingerprint], latency)
+
+def stand_in_results(tables: dict, local_backend, calls=QUERY_SHAPES) -> dict[str, pa.Table]:
+    """
+    Run each call once on a local backend and key its result by the warehouse query fingerprint.
+
+    Args:
+        tables (dict): Fully qualified warehouse tables, as in DataService.tables
+        local_backend: Backend running the calls locally, e.g. a ParquetBackend
+        calls (list): (method name, args) pairs, one per query shape
+
+    Returns:
+        dict: Query fingerprint -> result table
+    """
+    # Executing a query returns the query itself, to get the fingerprint of each call
+    query_builder = BigQueryBackend(tables, lambda query: query)
+    return {
+        getattr(query_builder, method_name)(*args).fingerprint: getattr(local_backend, method_name)(*args).to_arrow()
+        for method_name, args in calls
+    }
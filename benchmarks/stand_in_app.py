@@ -0,0 +1,49 @@
+"""
+The dashboard app querying a stand-in BigQuery client over synthetic tables, for load tests.
+
+Usage:
+    gunicorn benchmarks.stand_in_app:server --workers 2 --threads 8
+
+Environment:
+    LOAD_TEST_MOVIES: Number of synthetic movies (default 10000)
+    LOAD_TEST_LATENCY: Seconds each query job takes (default 0.2)
+    LOAD_TEST_JITTER: Maximum seconds added at random to each job (default 0.1)
+"""
+import os
+import tempfile
+from unittest.mock import patch
+
+# The warehouse path is the one under load; warm-up and preloading would hide its latency
+for name, value in {
+    "QUERY_BACKEND": "bigquery",
+    "WARMUP_ENABLED": "False",
+    "PRELOAD_AGGREGATES": "False",
+    "TOP_MOVIES_INDEX": "False",
+    "PROJECT_ID": "load-test",
+    "DATASET_ID": "synthetic",
+    "MOVIES_DETAILS_TABLE_ID": "movies_details",
+    "YEAR_GENRE_AGGREGATES_TABLE_ID": "year_genre_aggregates",
+    "YEARLY_AGGREGATES_TABLE_ID": "yearly_aggregates",
+    "RUNTIME_DISTRIBUTION_TABLE_ID": "runtime_distribution",
+    "TRACE_SAMPLE_RATE": "0",
+    "ACCESS_LOG_PATH": os.path.join(tempfile.mkdtemp(prefix="load-test-"), "access_log.jsonl"),
+}.items():
+    os.environ.setdefault(name, value)
+
+from services.parquet_backend import ParquetBackend
+from benchmarks.stand_in import StandInClient, stand_in_results
+from benchmarks.synthetic import write_tables
+
+N_MOVIES = int(os.getenv("LOAD_TEST_MOVIES", 10000))
+LATENCY = float(os.getenv("LOAD_TEST_LATENCY", 0.2))
+JITTER = float(os.getenv("LOAD_TEST_JITTER", 0.1))
+
+client = StandInClient(latency=LATENCY, jitter=JITTER)
+with patch("services.data_service.get_bigquery_client", return_value=client):
+    from app import app, data_service
+
+with tempfile.TemporaryDirectory() as data_dir:
+    write_tables(data_dir, N_MOVIES)
+    client.results.update(stand_in_results(data_service.tables, ParquetBackend(data_dir, data_service.tables.keys())))
+
+server = app.server
@@ -0,0 +1,190 @@
+"""
+Seeded synthetic IMDb dataset matching the four warehouse tables, written as Parquet
+snapshots the parquet query backend can serve (QUERY_BACKEND=parquet, PARQUET_DATA_DIR).
+
+movies_details is generated in chunks, so tens of millions of movies fit in memory, and the
+aggregate tables are summed from the same chunks, so they agree with it.
+
+Usage:
+    python -m benchmarks.synthetic --movies 10000000 [--seed 0] [--output-dir data]
+"""
+import argparse
+import os
+import numpy as np
+import polars as pl
+import pyarrow.parquet as pq
+from config import MIN_YEAR, MAX_YEAR, RUNTIME_MAX
+
+# Relative frequency of each genre among movies' genres, roughly as on IMDb
+GENRE_WEIGHTS = {
+    "Drama": 24, "Comedy": 14, "Documentary": 9, "Romance": 6, "Action": 6, "Thriller": 6,
+    "Crime": 5, "Horror": 5, "Adventure": 4, "Mystery": 3, "Family": 3, "Fantasy": 2,
+    "Biography": 2, "History": 2, "Music": 2, "Sci-Fi": 2, "Animation": 1.5, "War": 1.5,
+    "Sport": 1, "Western": 1, "Musical": 1,
+}
+GENRES = sorted(GENRE_WEIGHTS)
+GENRE_COUNT_WEIGHTS = (0.45, 0.35, 0.20)  # Movies with 1, 2 and 3 genres
+RUNTIME_BIN_MINUTES = 30
+UNRATED_SHARE = 0.1  # Movies without ratings nor votes
+ADULT_SHARE = 0.015
+CHUNK_SIZE = 1_000_000
+
+DETAILS_SCHEMA = {
+    "movie_title": pl.String,
+    "release_year": pl.Int64,
+    "genres": pl.String,
+    "runtime_minutes": pl.Int64,
+    "is_adult": pl.Int64,
+    "average_rating": pl.Float64,
+    "total_votes": pl.Int64,
+}
+
+def _movies_chunk(rng: np.random.Generator, start: int, size: int) -> pl.DataFrame:
+    """Generate size movies of movies_details, numbered from start."""
+    # Many more movies are released each year than a century ago
+    years = np.arange(MIN_YEAR, MAX_YEAR + 1)
+    year_weights = np.exp((years - MIN_YEAR) / 25)
+    genre_weights = np.array([GENRE_WEIGHTS[genre] for genre in GENRES], dtype=float)
+    genre_names = pl.Series(GENRES)
+
+    # Long-tailed votes: most movies get a few dozen, a few get millions
+    total_votes = np.clip(rng.lognormal(3.5, 1.9, size), 5, 3_000_000).astype(np.int64)
+    # Popular movies are rated a little higher
+    ratings = np.round(np.clip(rng.normal(5.9, 1.2, size) + 0.2 * np.log10(total_votes), 1, 10), 1)
+    rated = rng.random(size) >= UNRATED_SHARE
+
+    return pl.DataFrame({
+        "id": np.arange(start, start + size),
+        "release_year": rng.choice(years, size, p=year_weights / year_weights.sum()),
+        "genre_count": rng.choice(len(GENRE_COUNT_WEIGHTS), size, p=GENRE_COUNT_WEIGHTS) + 1,
+        **{f"genre_{i}": genre_names.gather(rng.choice(len(GENRES), size, p=genre_weights / genre_weights.sum())) for i in range(3)},
+        "runtime_minutes": np.clip(rng.lognormal(np.log(92), 0.25, size), 1, RUNTIME_MAX - 1).astype(np.int64),
+        "is_adult": (rng.random(size) < ADULT_SHARE).astype(np.int64),
+        "average_rating": np.where(rated, ratings, np.nan),
+        "total_votes": total_votes,
+        "rated": rated,
+    }).select(
+        pl.format("Movie {}", "id").alias("movie_title"),
+        "release_year",
+        # Comma separated and sorted like IMDb's genres, without repeats
+        pl.concat_list("genre_0", "genre_1", "genre_2").list.head("genre_count").list.unique().list.sort().list.join(",").alias("genres"),
+        "runtime_minutes",
+        "is_adult",
+        pl.col("average_rating").fill_nan(None),
+        pl.when("rated").then("total_votes").alias("total_votes"),
+    ).cast(DETAILS_SCHEMA)
+
+def _partial_aggregates(details: pl.DataFrame) -> dict[str, pl.DataFrame]:
+    """Counts and sums of the rated movies of a chunk, per key of each aggregate table."""
+    rated = details.filter(pl.col("average_rating").is_not_null())
+    sums = [pl.len().alias("total_movies"), pl.col("average_rating").sum().alias("rating_sum"), pl.col("total_votes").sum()]
+    return {
+        "year_genre_aggregates": (
+            rated.select("release_year", pl.col("genres").str.split(",").alias("genre"), "average_rating", "total_votes")
+            .explode("genre")
+            .group_by("release_year", "genre")
+            .agg(sums)
+        ),
+        "yearly_aggregates": rated.group_by("release_year").agg(sums),
+        "runtime_distribution": (
+            rated.with_columns((pl.col("runtime_minutes") // RUNTIME_BIN_MINUTES * RUNTIME_BIN_MINUTES).alias("min_runtime"))
+            .group_by("min_runtime")
+            .agg(sums)
+        ),
+    }
+
+def _aggregate_tables(partials: list[dict[str, pl.DataFrame]]) -> dict[str, pl.DataFrame]:
+    """Combine the chunks' partial aggregates into the aggregate tables."""
+    keys = {"year_genre_aggregates": ["release_year", "genre"], "yearly_aggregates": ["release_year"], "runtime_distribution": ["min_runtime"]}
+    totals = {
+        table_name: (
+            pl.concat([partial[table_name] for partial in partials])
+            .group_by(key)
+            .agg(pl.col("total_movies", "rating_sum", "total_votes").sum())
+            .with_columns(
+                pl.col("total_movies").cast(pl.Int64),
+                (pl.col("rating_sum") / pl.col("total_movies")).round(2).alias("average_rating"),
+            )
+            .sort(key)
+        )
+        for table_name, key in keys.items()
+    }
+    return {
+        "year_genre_aggregates": totals["year_genre_aggregates"].select("release_year", "genre", "total_movies", "average_rating", "total_votes"),
+        "yearly_aggregates": totals["yearly_aggregates"].select("release_year", "total_movies", "average_rating"),
+        "runtime_distribution": totals["runtime_distribution"].select(
+            pl.format("{}-{}", "min_runtime", pl.col("min_runtime") + RUNTIME_BIN_MINUTES).alias("runtime_bin"),
+            "total_movies",
+            "average_rating",
+            pl.col("min_runtime").cast(pl.Int64),
+            (pl.col("min_runtime") + RUNTIME_BIN_MINUTES).cast(pl.Int64).alias("max_runtime"),
+        ),
+    }
+
+def generate(n_movies: int, seed: int = 0, chunk_size: int = CHUNK_SIZE):
+    """
+    Generate movies_details in chunks.
+
+    Args:
+        n_movies (int): Number of movies
+        seed (int): Random seed; the same seed and chunk size give the same movies
+        chunk_size (int): Movies per chunk
+
+    Yields:
+        pl.DataFrame: Next chunk of movies_details
+    """
+    for index, start in enumerate(range(0, n_movies, chunk_size)):
+        rng = np.random.default_rng([seed, index])
+        yield _movies_chunk(rng, start, min(chunk_size, n_movies - start))
+
+def make_tables(n_movies: int, seed: int = 0, chunk_size: int = CHUNK_SIZE) -> dict[str, pl.DataFrame]:
+    """
+    Build the four warehouse tables in memory.
+
+    Returns:
+        dict: Table name -> DataFrame, with the aggregate tables computed from movies_details
+    """
+    chunks = list(generate(n_movies, seed, chunk_size))
+    return {"movies_details": pl.concat(chunks), **_aggregate_tables([_partial_aggregates(chunk) for chunk in chunks])}
+
+def write_tables(data_dir: str, n_movies: int, seed: int = 0, chunk_size: int = CHUNK_SIZE) -> dict[str, str]:
+    """
+    Write the four warehouse tables as <table_name>.parquet snapshots, one chunk of movies in memory at a time.
+
+    Returns:
+        dict: Table name -> Parquet file path
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    paths = {table_name: os.path.join(data_dir, f"{table_name}.parquet") for table_name in ("movies_details", "year_genre_aggregates", "yearly_aggregates", "runtime_distribution")}
+    partials = []
+    writer = None
+    try:
+        for chunk in generate(n_movies, seed, chunk_size):
+            table = chunk.to_arrow()
+            if writer is None:
+                writer = pq.ParquetWriter(paths["movies_details"], table.schema)
+            writer.write_table(table)
+            partials.append(_partial_aggregates(chunk))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    for table_name, df in _aggregate_tables(partials).items():
+        df.write_parquet(paths[table_name])
+    return paths
+
+def main(argv=None) -> dict[str, str]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=1_000_000, help="Number of movies")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Movies generated at a time")
+    parser.add_argument("--output-dir", default="data", help="Directory the Parquet snapshots are written to")
+    args = parser.parse_args(argv)
+
+    paths = write_tables(args.output_dir, args.movies, args.seed, args.chunk_size)
+    for table_name, path in paths.items():
+        print(f"{table_name:<24} {path}")
+    return paths
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
-from typing import Any
-import plotly.express as px
 import plotly.graph_objects as go
 import polars as pl
 from config import PRIMARY_COLOR, COLOR_DISCRETE_SEQUENCE
-from utils.chart_styles import apply_common_styles, format_hover_template
+from utils.chart_styles import common_layout, column_values, custom_data, format_hover_template
+from utils.tracing import traced
 
+@traced("create_area_chart")
 def create_area_chart(
     df: pl.DataFrame,
     x_col: str,
@@ -39,33 +39,35 @@ def create_area_chart(
     hover_data = hover_data if hover_data else [y_col]
     hovertemplate, custom_data_cols = format_hover_template(hover_name, hover_data)
 
-    base_args: dict[str, Any] = dict(data_frame=df, x=x_col, y=y_col, title=title)
-    if custom_data_cols:
-        base_args['custom_data'] = custom_data_cols
+    layout = common_layout(title, x_col, y_col)
+
+    # One trace per color group, in order of appearance
     if color_col:
+        groups = df.partition_by(color_col, maintain_order=True)
         chart_colors = color_sequence or COLOR_DISCRETE_SEQUENCE
-        base_args['color'] = color_col
-        base_args['color_discrete_sequence'] = chart_colors
-    
-    fig = px.area(**base_args)
-    
-    # Set area color and line for single area charts
-    if not color_col:
-        fig.update_traces(
-            fillcolor=PRIMARY_COLOR,
-            line_color=PRIMARY_COLOR
-        )
+        layout['legend_title_text'] = color_col
+    else:
+        groups = [df]
 
-    
-    # Implement custom styling
-    fig.update_traces(
-        line_width=line_width,
-        hovertemplate=hovertemplate
-    )
-    
-    if not stacked and color_col:
-        fig.update_traces(stackgroup=None)
-    
-    fig = apply_common_styles(fig, title, x_col, y_col)
+    traces = []
+    for i, group in enumerate(groups):
+        if color_col:
+            name = group[color_col][0]
+            color = chart_colors[i % len(chart_colors)]
+            style = dict(name=str(name), legendgroup=str(name), showlegend=True, line=dict(color=color, width=line_width))
+        else:
+            # Set area color and line for single area charts
+            style = dict(name='', showlegend=False, fillcolor=PRIMARY_COLOR, line=dict(color=PRIMARY_COLOR, width=line_width))
+
+        traces.append(go.Scatter(
+            x=column_values(group, x_col),
+            y=column_values(group, y_col),
+            mode='lines',
+            orientation='v',
+            stackgroup='1' if stacked or not color_col else None,
+            customdata=custom_data(group, custom_data_cols),
+            hovertemplate=hovertemplate,
+            **style,
+        ))
 
-    return fig
+    return go.Figure(traces, layout)
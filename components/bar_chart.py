@@ -1,10 +1,10 @@
-from typing import Any
-import plotly.express as px
 import plotly.graph_objects as go
 import polars as pl
-from config import PRIMARY_COLOR, ACCENT_COLOR, COLOR_CONTINUOUS_SCALE
-from utils.chart_styles import apply_common_styles, format_hover_template
+from config import PRIMARY_COLOR, COLOR_CONTINUOUS_SCALE
+from utils.chart_styles import common_layout, column_values, custom_data, format_hover_template
+from utils.tracing import traced
 
+@traced("create_bar_chart")
 def create_bar_chart(df: pl.DataFrame, x_col: str, y_col: str, title: str = "",
                     color_col: str | None = None, color_sequence: list | None = None, hover_name: str | None = None,
                     hover_data: list | None = None, horizontal: bool = False) -> go.Figure: 
@@ -16,8 +16,8 @@ def create_bar_chart(df: pl.DataFrame, x_col: str, y_col: str, title: str = "",
         x_col (str): Column name for x-axis
         y_col (str): Column name for y-axis
         title (str): Chart title
-        color_col (str): Column name for color mapping
-        color_sequence (list): Custom color sequence
+        color_col (str): Numeric column name mapped onto the continuous color scale
+        color_sequence (list): Custom continuous color scale
         hover_name (str): Column name for hover label (sets hovertext)
         hover_data (list): Additional columns to show in hover tooltip
         horizontal (bool): Whether to create horizontal bars
@@ -29,33 +29,27 @@ def create_bar_chart(df: pl.DataFrame, x_col: str, y_col: str, title: str = "",
     hover_data = hover_data if hover_data else ([x_col] if horizontal else [y_col]) # default to secondary axis label if not provided
     hovertemplate, custom_data_cols = format_hover_template(hover_name, hover_data)
 
-    # Set orientation based on horizontal flag
-    orientation = 'h' if horizontal else 'v'
-
-    base_args: dict[str, Any] = dict(data_frame=df, x=x_col, y=y_col, title=title, orientation=orientation)
-    if custom_data_cols:
-        base_args['custom_data'] = custom_data_cols
-    if color_col:
-        chart_colors = color_sequence or COLOR_CONTINUOUS_SCALE
-        base_args['color'] = color_col
-        base_args['color_continuous_scale'] = chart_colors
-
-    fig = px.bar(**base_args)
+    layout = common_layout(title, x_col, y_col, barmode='relative')
 
     # Set bar color for single color bars
-    if not color_col:
-        fig.update_traces(
-            marker_color=PRIMARY_COLOR
+    marker = dict(color=PRIMARY_COLOR)
+    if color_col:
+        marker = dict(color=column_values(df, color_col), coloraxis='coloraxis')
+        layout['coloraxis'] = dict(
+            colorscale=color_sequence or COLOR_CONTINUOUS_SCALE,
+            colorbar_title_text=color_col,
         )
 
-    # Set bar border style
-    fig.update_traces(
-        marker_line_color=ACCENT_COLOR,
-        marker_line_width=1,
+    # Bar border and common styling come from the chart template
+    trace = go.Bar(
+        x=column_values(df, x_col),
+        y=column_values(df, y_col),
+        orientation='h' if horizontal else 'v',
+        marker=marker,
+        customdata=custom_data(df, custom_data_cols),
+        hovertemplate=hovertemplate,
+        name='',
+        showlegend=False,
     )
-    
-    # Implement custom styling
-    fig.update_traces(hovertemplate=hovertemplate)
-    fig = apply_common_styles(fig, title, x_col, y_col)
 
-    return fig
+    return go.Figure(trace, layout)
@@ -1,8 +1,10 @@
 import plotly.graph_objects as go
 import polars as pl
-from config import PRIMARY_COLOR, SECONDARY_COLOR, ACCENT_COLOR
-from utils.chart_styles import apply_common_styles, format_hover_template, format_label
+from config import PRIMARY_COLOR, SECONDARY_COLOR
+from utils.chart_styles import common_layout, column_values, custom_data, format_hover_template, format_label
+from utils.tracing import traced
 
+@traced("create_combo_chart")
 def create_combo_chart(
     df: pl.DataFrame,
     x_col: str,
@@ -52,43 +54,32 @@ def create_combo_chart(
     hovertemplate_bar, custom_data_cols_bar = format_hover_template(hover_name, hover_data_bar)
     hovertemplate_line, custom_data_cols_line = format_hover_template(hover_name, hover_data_line)
     
-    # Create figure with secondary y-axis if needed
-    fig = go.Figure()
-    
-    # Add bar trace
-    fig.add_trace(
-        go.Bar(
-            x=df[x_col],
-            y=df[y_bar_col],
-            name=bar_name,
-            marker_color=bar_color,
-            marker_line_color=ACCENT_COLOR,
-            marker_line_width=1,
-            customdata=df.select(custom_data_cols_bar).to_numpy(),
-            hovertemplate=hovertemplate_bar,
-            yaxis='y'
-        )
+    x = column_values(df, x_col)
+
+    # Bar trace, its border comes from the chart template
+    bar = go.Bar(
+        x=x,
+        y=column_values(df, y_bar_col),
+        name=bar_name,
+        marker_color=bar_color,
+        customdata=custom_data(df, custom_data_cols_bar),
+        hovertemplate=hovertemplate_bar,
+        yaxis='y'
     )
-    
-    # Add line trace
-    fig.add_trace(
-        go.Scatter(
-            x=df[x_col],
-            y=df[y_line_col],
-            name=line_name,
-            mode='lines+markers',
-            line=dict(color=line_color, width=line_width),
-            marker=dict(size=8, color=line_color),
-            customdata=df.select(custom_data_cols_line).to_numpy(),
-            hovertemplate=hovertemplate_line,
-            yaxis='y2' if secondary_y else 'y'
-        )
+
+    # Line trace
+    line = go.Scatter(
+        x=x,
+        y=column_values(df, y_line_col),
+        name=line_name,
+        mode='lines+markers',
+        line=dict(color=line_color, width=line_width),
+        marker=dict(size=8, color=line_color),
+        customdata=custom_data(df, custom_data_cols_line),
+        hovertemplate=hovertemplate_line,
+        yaxis='y2' if secondary_y else 'y'
     )
-    
-    # Apply common styles
-    if secondary_y:
-        fig = apply_common_styles(fig, title, x_col, y_bar_col, y_line_col)
-    else:
-        fig = apply_common_styles(fig, title, x_col, y_bar_col)
-    
-    return fig
+
+    # Create figure with secondary y-axis if needed
+    layout = common_layout(title, x_col, y_bar_col, y_line_col if secondary_y else "")
+    return go.Figure([bar, line], layout)
@@ -1,8 +1,10 @@
 import plotly.graph_objects as go
 import polars as pl
 from config import PRIMARY_COLOR, SECONDARY_COLOR
-from utils.chart_styles import apply_common_styles, format_hover_template, format_label
+from utils.chart_styles import common_layout, column_values, custom_data, format_hover_template, format_label
+from utils.tracing import traced
 
+@traced("create_dual_axis_line_chart")
 def create_dual_axis_line_chart(
     df: pl.DataFrame,
     x_col: str,
@@ -42,38 +44,30 @@ def create_dual_axis_line_chart(
     hover_data = hover_data if hover_data else [y1_col, y2_col]
     hovertemplate, custom_data_cols = format_hover_template(hover_name, hover_data)
     
-    # Create figure with secondary y-axis
-    fig = go.Figure()
-    
-    # Add primary trace (left y-axis)
-    fig.add_trace(
-        go.Scatter(
-            x=df[x_col],
-            y=df[y1_col],
-            name=y1_label,
-            mode='lines',
-            line=dict(color=y1_color, width=line_width),
-            hovertemplate=hovertemplate,
-            customdata=df.select(custom_data_cols).to_numpy() if custom_data_cols else None
-        )
+    x = column_values(df, x_col)
+    customdata = custom_data(df, custom_data_cols)
+
+    # Primary trace (left y-axis)
+    y1_trace = go.Scatter(
+        x=x,
+        y=column_values(df, y1_col),
+        name=y1_label,
+        mode='lines',
+        line=dict(color=y1_color, width=line_width),
+        hovertemplate=hovertemplate,
+        customdata=customdata
     )
-    
-    # Add secondary trace (right y-axis)
-    fig.add_trace(
-        go.Scatter(
-            x=df[x_col],
-            y=df[y2_col],
-            name=y2_label,
-            mode='lines',
-            line=dict(color=y2_color, width=line_width),
-            yaxis='y2',
-            hovertemplate=hovertemplate,
-            customdata=df.select(custom_data_cols).to_numpy() if custom_data_cols else None
-        )
+
+    # Secondary trace (right y-axis)
+    y2_trace = go.Scatter(
+        x=x,
+        y=column_values(df, y2_col),
+        name=y2_label,
+        mode='lines',
+        line=dict(color=y2_color, width=line_width),
+        yaxis='y2',
+        hovertemplate=hovertemplate,
+        customdata=customdata
     )
-    
 
-    fig = apply_common_styles(fig, title, x_col, y1_col, y2_col)
-    
-    
-    return fig
+    return go.Figure([y1_trace, y2_trace], common_layout(title, x_col, y1_col, y2_col))
@@ -31,6 +31,13 @@ MAX_DATE = datetime(MAX_YEAR, 1, 1)
 GENRES = ["Action", "Comedy", "Drama", "Thriller", "Horror"]
 RUNTIME_MIN = 0
 RUNTIME_MAX = 300
+RATING_STEP = 0.1 # Slider steps, filter values are quantized to them
+RUNTIME_STEP = 1
+
+# Callback Configuration
+CONSOLIDATED_CALLBACKS = os.getenv("CONSOLIDATED_CALLBACKS", "False").lower() == "true" # One fetch callback for all charts
+ASYNC_CALLBACKS = os.getenv("ASYNC_CALLBACKS", "False").lower() == "true" # Async data fetching callbacks (requires asgiref)
+CANCEL_SUPERSEDED_QUERIES = os.getenv("CANCEL_SUPERSEDED_QUERIES", "True").lower() == "true" # Cancel a chart's query when the same browser tab requests newer data
 
 # Layout Configuration
 CHART_HEIGHT = 500
@@ -143,6 +150,11 @@ GOOGLE_CLOUD_CREDENTIALS = {
     "universe_domain": os.getenv("UNIVERSE_DOMAIN"),
 }
 PROJECT_ID = os.getenv("PROJECT_ID")
+BQ_STORAGE_API_MIN_ROWS = int(os.getenv("BQ_STORAGE_API_MIN_ROWS", 50000)) # Smaller results are downloaded over REST
+QUERY_POLL_INTERVAL = 0.1 # Seconds between the first status polls of an async query job
+QUERY_MAX_POLL_INTERVAL = 2.0 # Polling backs off up to this interval
+JOB_LEDGER_MAX_ENTRIES = 1000 # Most recent BigQuery job statistics kept in memory
+JOB_LEDGER_PATH = os.getenv("JOB_LEDGER_PATH") or None # Optional JSON lines file all job statistics are appended to
 DATASET_ID = os.getenv("DATASET_ID")
 MOVIES_DETAILS_TABLE_ID = os.getenv("MOVIES_DETAILS_TABLE_ID")
 YEAR_GENRE_AGGREGATES_TABLE_ID = os.getenv("YEAR_GENRE_AGGREGATES_TABLE_ID")
@@ -155,6 +167,22 @@ TABLES_IDS = {
     "runtime_distribution": RUNTIME_DISTRIBUTION_TABLE_ID,
 }
 
+# Query backend Configuration
+QUERY_BACKEND = os.getenv("QUERY_BACKEND", "bigquery") # "bigquery" or "parquet" (local snapshots)
+PARQUET_DATA_DIR = os.getenv("PARQUET_DATA_DIR", "data") # Directory with <table_name>.parquet snapshots
+
+# Warm-up Configuration
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "True").lower() == "true" # Prefetch likely queries before reporting ready
+WARMUP_TOP_K = 20 # Most frequent filter states from the access log to prefetch
+ACCESS_LOG_PATH = os.getenv("ACCESS_LOG_PATH", "access_log.jsonl")
+ACCESS_LOG_MAX_ENTRIES = 10000
+
+# Tracing Configuration
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", 0.01)) # Fraction of requests traced, 0 disables tracing
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "memory") # "memory" (served at /traces) or "file"
+TRACE_PATH = os.getenv("TRACE_PATH", "traces.jsonl") # File spans are appended to with the file exporter
+TRACE_MAX_SPANS = 10000 # Most recent spans kept by the memory exporter
+
 # Configure logging with output to console and file
 logging.basicConfig(
     level=logging.DEBUG if DEBUG else logging.INFO,
@@ -168,7 +196,46 @@ logging.basicConfig(
 # Cache Configuration
 FCD_TTL = 60 * 60 * 12 # 12 hours for frequently changing data
 SCD_TTL = 60 * 60 * 24 * 7 # 1 week for slowly changing data
+PRELOAD_AGGREGATES = os.getenv("PRELOAD_AGGREGATES", "False").lower() == "true" # Keep aggregate tables in memory
+AGGREGATES_REFRESH_INTERVAL = FCD_TTL
+TOP_MOVIES_INDEX = os.getenv("TOP_MOVIES_INDEX", "False").lower() == "true" # Keep an in-memory top movies index
+TOP_MOVIES_INDEX_REFRESH_INTERVAL = FCD_TTL
+CACHE_STALE_GRACE = 60 * 60 * 24 # Seconds an expired result is still served while it is refreshed in the background
+CACHE_TTL_JITTER = 0.1 # Cache expiries are randomly spread by +/- 10%
+CACHE_REFRESH_WORKERS = 2 # Threads refreshing stale results in the background
+CACHE_MAX_PENDING_REFRESHES = 32
+BUNDLE_WORKERS = 8 # Threads fetching the charts of a dashboard bundle concurrently
+IN_FLIGHT_WAIT_TIMEOUT = 30 # Seconds to wait for an identical in-flight query before running it again
+RESULT_STORE_TTL = 60 * 60 # Seconds chart results are kept server-side for the render callbacks (fetched again once gone)
+RESULT_STORE_MAX_BYTES = int(os.getenv("RESULT_STORE_MAX_BYTES", 128 * 1024 ** 2)) # Budget of the chart results kept per process
+FIGURE_CACHE_MAX_BYTES = int(os.getenv("FIGURE_CACHE_MAX_BYTES", 64 * 1024 ** 2)) # Budget of the rendered figures kept per process, 0 disables it
+FIGURE_CACHE_TTL = FCD_TTL
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "lru") # lru (per process, byte bounded), simple or arrow_file (shared by the workers of a host)
+LRU_CACHE_MAX_BYTES = int(os.getenv("LRU_CACHE_MAX_BYTES", 512 * 1024 ** 2))
+LRU_CACHE_SHARDS = 16
+CACHE_COMPRESSION = os.getenv("CACHE_COMPRESSION") or None # lz4 or zstd to keep large cached results compressed
+CACHE_COMPRESSION_MIN_BYTES = 64 * 1024
+ARROW_CACHE_DIR = os.getenv("ARROW_CACHE_DIR", "cache")
+ARROW_CACHE_MAX_BYTES = int(os.getenv("ARROW_CACHE_MAX_BYTES", 1024 ** 3))
 CACHE_CONFIG = {
     "CACHE_TYPE": "SimpleCache",
     "CACHE_DEFAULT_TIMEOUT": FCD_TTL
-}
\ No newline at end of file
+}
+if CACHE_BACKEND == "lru":
+    CACHE_CONFIG = {
+        "CACHE_TYPE": "utils.sharded_lru_cache.ShardedLRUCache",
+        "CACHE_OPTIONS": {
+            "max_bytes": LRU_CACHE_MAX_BYTES,
+            "shards": LRU_CACHE_SHARDS,
+            "compression": CACHE_COMPRESSION,
+            "compression_threshold": CACHE_COMPRESSION_MIN_BYTES,
+        },
+        "CACHE_DEFAULT_TIMEOUT": FCD_TTL
+    }
+elif CACHE_BACKEND == "arrow_file":
+    CACHE_CONFIG = {
+        "CACHE_TYPE": "utils.arrow_file_cache.ArrowFileCache",
+        "CACHE_DIR": ARROW_CACHE_DIR,
+        "CACHE_OPTIONS": {"max_bytes": ARROW_CACHE_MAX_BYTES},
+        "CACHE_DEFAULT_TIMEOUT": FCD_TTL
+    }
\ No newline at end of file
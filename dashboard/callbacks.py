@@ -1,20 +1,207 @@
 import logging
-from dash import Input, Output, State
+import time
+from dash import Input, Output, State, no_update
 from dash.exceptions import PreventUpdate
-from config import TOP_N_MOVIES, MIN_VOTES_THRESHOLD
+from config import TOP_N_MOVIES, MIN_VOTES_THRESHOLD, CANCEL_SUPERSEDED_QUERIES
 from components.empty_chart import create_empty_chart
 from components.area_chart import create_area_chart
 from components.bar_chart import create_bar_chart
 from components.combo_chart import create_combo_chart
 from components.dual_axis_line_chart import create_dual_axis_line_chart
-from utils.serialize import df_to_base64_ipc, df_from_base64_ipc
-from utils.cache import create_cache_key, deserialize_cache_data
+from utils.cache import deserialize_cache_data
 from utils.validation import validate_date_range
+from utils import tracing
+from services.job_tracker import QueryCancelledError
+from services.filter_spec import FilterSpec
 
-def register_dashboard_callbacks(app, data_service):
-    """Register callbacks for charts with frontend caching using dcc.Store"""
-    
-    # ========== DATA FETCHING CALLBACKS (Cache in dcc.Store with IPC) =========
+CHART_STORES = {
+    "top_movies": "top-movies-cache",
+    "genre_trends": "genre-trends-cache",
+    "runtime_distribution": "runtime-distribution-cache",
+    "yearly_trends": "yearly-trends-cache",
+}
+
+# Filters each chart depends on, i.e. the FilterSpec fields of its cache key
+CHART_FILTERS = {
+    "top_movies": ("year_range", "genres", "rating_range", "runtime_range"),
+    "genre_trends": ("year_range", "genres"),
+    "runtime_distribution": ("runtime_range",),
+    "yearly_trends": ("year_range",),
+}
+
+def _filter_spec(data_service, year_range=None, selected_genres=None, rating_range=None, runtime_range=None):
+    """Build the canonical FilterSpec of the sidebar inputs, clamping years to the data bounds like DataService does."""
+    year_bounds = data_service.year_bounds() if year_range else None
+    return FilterSpec.from_inputs(year_range, selected_genres, rating_range, runtime_range, year_bounds=year_bounds)
+
+def _session_id(session_id):
+    """Return the browser tab's session ID from its session-id store, or None if superseded queries aren't cancelled."""
+    return session_id if CANCEL_SUPERSEDED_QUERIES else None
+
+def _fetch_latest(data_service, session_id, chart, fetch, *args, **kwargs):
+    """Fetch a chart's data as the latest request of the tab, resolving as a no-op once superseded."""
+    try:
+        with data_service.job_tracker.track(_session_id(session_id), chart):
+            return fetch(*args, **kwargs)
+    except QueryCancelledError:
+        logging.info(f"Request for {chart.replace('_', ' ')} data superseded by a newer one")
+        raise PreventUpdate
+
+def _chart_filters(spec):
+    """Filters of a FilterSpec in the form DataService.get_dashboard_bundle takes."""
+    return {
+        "year_range": spec.year_range,
+        "selected_genres": list(spec.genres),
+        "rating_threshold": spec.rating_range,
+        "runtime_range": spec.runtime_range,
+        "limit": TOP_N_MOVIES,
+        "min_votes": MIN_VOTES_THRESHOLD,
+    }
+
+def _store_payload(result_store, chart, df, cache_key, filters, cached_data, generation=0):
+    """
+    Keep a chart's DataFrame in the result store and return its handle for the dcc.Store, keeping the previous one (no_update) on empty results.
+
+    The handle's version comes from the data generation read before the fetch, so a refresh
+    finishing during the fetch can't label the older data with the newer version.
+    """
+    label = chart.replace("_", " ")
+    if df.is_empty():
+        logging.warning(f"{label.capitalize()} data is empty.")
+        # Keep previous cache if available
+        if cached_data and cached_data.get("version"):
+            return no_update
+        return {
+            "cache_key": cache_key,
+            "version": None,
+            "error": "No data available"
+        }
+
+    return {
+        **result_store.put(cache_key, df, generation=generation),
+        # Lets the render callback fetch the data again if the result store doesn't have it
+        "chart": chart,
+        "filters": filters,
+        # Lets the render callback trace the dcc.Store round trip
+        "stored_at": time.time(),
+        "trace_id": tracing.TRACER.trace_id,
+    }
+
+def _load_result(result_store, data_service, handle):
+    """Read a chart's DataFrame from the result store, fetching it again if it was evicted or stored by another worker."""
+    df = result_store.get(handle)
+    if df is None:
+        chart = handle["chart"]
+        logging.info(f"{chart.replace('_', ' ').capitalize()} data not in the result store, fetching it again")
+        df = data_service.get_dashboard_bundle(handle["filters"], charts=[chart])[chart]
+        result_store.put(handle["cache_key"], df, version=handle["version"])
+    return df
+
+def _record_store_round_trip(cached_data, chart):
+    """Trace the time from a chart's data being stored to its render callback running."""
+    if cached_data.get("stored_at"):
+        tracing.record("dcc_store_round_trip", cached_data["stored_at"], chart=chart, fetch_trace_id=cached_data.get("trace_id"))
+
+def _plan_bundle(data_service, date_range, selected_genres, rating_range, runtime_range, stores, access_log=None):
+    """
+    Work out which charts a filter change invalidates.
+
+    Returns:
+        tuple: (filters for get_dashboard_bundle, charts to fetch, cache key per chart, deserialized store per chart)
+
+    Raises:
+        PreventUpdate: If every chart store is still valid
+    """
+    try:
+        year_range = validate_date_range(date_range)
+    except PreventUpdate:
+        year_range = None
+
+    spec = _filter_spec(data_service, year_range, selected_genres, rating_range, runtime_range)
+    cache_keys = {
+        chart: spec.cache_key(*fields) for chart, fields in CHART_FILTERS.items()
+        # Without a valid year range only the runtime distribution can be fetched
+        if year_range is not None or "year_range" not in fields
+    }
+    cached_stores = {chart: deserialize_cache_data(store) for chart, store in zip(CHART_STORES, stores)}
+    charts = [
+        chart for chart, cache_key in cache_keys.items()
+        if not (cached_stores[chart] and cached_stores[chart].get("cache_key") == cache_key)
+    ]
+    if not charts:
+        logging.info("Using cached dashboard data")
+        raise PreventUpdate
+
+    logging.info(f"Fetching dashboard data for {', '.join(charts)}")
+    if access_log and "top_movies" in charts:
+        access_log.record(spec.year_range, spec.genres, spec.rating_range, spec.runtime_range)
+
+    return _chart_filters(spec), charts, cache_keys, cached_stores
+
+def _bundle_outputs(result_store, frames, filters, cache_keys, cached_stores, generation=0):
+    """Build the store outputs of a bundle, leaving the stores of charts that weren't fetched untouched."""
+    return [
+        _store_payload(result_store, chart, frames[chart], cache_keys[chart], filters, cached_stores[chart], generation)
+        if chart in frames else no_update
+        for chart in CHART_STORES
+    ]
+
+def _render_figure(figure_cache, chart, handle, build):
+    """Build a chart's figure, or reuse the one cached for the same data."""
+    return figure_cache.get_or_build(chart, handle, build) if figure_cache else build()
+
+def register_dashboard_callbacks(app, data_service, result_store, figure_cache=None, access_log=None, consolidated=False, use_async=False):
+    """
+    Register callbacks for charts, with the chart data kept in a server-side ResultStore
+    and only its handle in each chart's dcc.Store. With a FigureCache, the render callbacks
+    reuse the figures already built for the same data.
+
+    With consolidated=True a single callback fetches the data of every chart affected by a
+    filter change through DataService.get_dashboard_bundle, instead of one callback per chart.
+    With use_async=True that callback is async and awaits DataService.aget_dashboard_bundle.
+    """
+    if use_async:
+        _register_bundle_fetch_callback(app, data_service, result_store, access_log, use_async=True)
+    elif consolidated:
+        _register_bundle_fetch_callback(app, data_service, result_store, access_log)
+    else:
+        _register_chart_fetch_callbacks(app, data_service, result_store, access_log)
+    _register_render_callbacks(app, data_service, result_store, figure_cache)
+
+def _register_bundle_fetch_callback(app, data_service, result_store, access_log=None, use_async=False):
+    """Register one callback filling all chart stores with concurrently fetched data."""
+    callback = app.callback(
+        [Output(store_id, "data") for store_id in CHART_STORES.values()],
+        [Input("year-range-filter", "value"),
+         Input("genre-filter", "value"),
+         Input("rating-range-filter", "value"),
+         Input("runtime-range-filter", "value")],
+        [State("session-id", "data")] + [State(store_id, "data") for store_id in CHART_STORES.values()],
+    )
+
+    if use_async:
+        @callback
+        @tracing.traced("callback.fetch_dashboard")
+        async def fetch_dashboard(date_range, selected_genres, rating_range, runtime_range, session_id, *stores):
+            """Fetch the data of the charts whose cache key changed in one bundle."""
+            filters, charts, cache_keys, cached_stores = _plan_bundle(data_service, date_range, selected_genres, rating_range, runtime_range, stores, access_log)
+            generation = data_service.data_generation
+            frames = await data_service.aget_dashboard_bundle(filters, charts=charts, session_id=_session_id(session_id))
+            return _bundle_outputs(result_store, frames, filters, cache_keys, cached_stores, generation)
+    else:
+        @callback
+        @tracing.traced("callback.fetch_dashboard")
+        def fetch_dashboard(date_range, selected_genres, rating_range, runtime_range, session_id, *stores):
+            """Fetch the data of the charts whose cache key changed in one bundle."""
+            filters, charts, cache_keys, cached_stores = _plan_bundle(data_service, date_range, selected_genres, rating_range, runtime_range, stores, access_log)
+            generation = data_service.data_generation
+            frames = data_service.get_dashboard_bundle(filters, charts=charts, session_id=_session_id(session_id))
+            return _bundle_outputs(result_store, frames, filters, cache_keys, cached_stores, generation)
+
+def _register_chart_fetch_callbacks(app, data_service, result_store, access_log=None):
+    """Register one data fetching callback per chart."""
+
+    # ========== DATA FETCHING CALLBACKS (Handles in dcc.Store, data in the ResultStore) =========
     
     @app.callback(
         Output("top-movies-cache", "data"),
@@ -22,12 +209,15 @@ def register_dashboard_callbacks(app, data_service):
          Input("genre-filter", "value"),
          Input("rating-range-filter", "value"),
          Input("runtime-range-filter", "value")],
-        [State("top-movies-cache", "data")],
+        [State("top-movies-cache", "data"),
+         State("session-id", "data")],
     )
-    def fetch_top_movies(date_range, selected_genres, rating_range, runtime_range, cached_data):
+    @tracing.traced("callback.fetch_top_movies")
+    def fetch_top_movies(date_range, selected_genres, rating_range, runtime_range, cached_data, session_id):
         """Fetch top movies data using cache with timestamp validation."""
         year_range = validate_date_range(date_range)
-        cache_key = create_cache_key(year_range, selected_genres, rating_range, runtime_range)
+        spec = _filter_spec(data_service, year_range, selected_genres, rating_range, runtime_range)
+        cache_key = spec.cache_key(*CHART_FILTERS["top_movies"])
         cached_data = deserialize_cache_data(cached_data)
         
         # Check if cache is valid
@@ -36,49 +226,29 @@ def register_dashboard_callbacks(app, data_service):
             raise PreventUpdate
 
         logging.info("Fetching top movies data")
+        if access_log:
+            access_log.record(spec.year_range, spec.genres, spec.rating_range, spec.runtime_range)
 
-        top_movies_df = data_service.get_top_movies(
-            year_range, selected_genres, rating_range, runtime_range=runtime_range, limit=TOP_N_MOVIES, min_votes=MIN_VOTES_THRESHOLD
+        generation = data_service.data_generation
+        top_movies_df = _fetch_latest(
+            data_service, session_id, "top_movies", data_service.get_top_movies,
+            spec.year_range, list(spec.genres), spec.rating_range, runtime_range=spec.runtime_range, limit=TOP_N_MOVIES, min_votes=MIN_VOTES_THRESHOLD
         )
-        
-        if top_movies_df.is_empty():
-            logging.warning("Top movies data is empty.")
-            # Keep previous cache if available
-            if cached_data and cached_data.get("data"):
-                raise PreventUpdate
-            return {
-                "cache_key": cache_key,
-                "data": None,
-                "error": "No data available"
-            }
-        
-        try:
-            serialized_data = df_to_base64_ipc(top_movies_df)
-            return {
-                "cache_key": cache_key,
-                "data": serialized_data
-            }
-        except Exception as e:
-            logging.error(f"Error serializing top movies data: {e}")
-            # Keep previous cache on serialization error
-            if cached_data and cached_data.get("data"):
-                raise PreventUpdate
-            return {
-                "cache_key": cache_key,
-                "data": None,
-                "error": str(e)
-            }
+        return _store_payload(result_store, "top_movies", top_movies_df, cache_key, _chart_filters(spec), cached_data, generation)
     
     @app.callback(
         Output("genre-trends-cache", "data"),
         [Input("year-range-filter", "value"),
          Input("genre-filter", "value")],
-        [State("genre-trends-cache", "data")],
+        [State("genre-trends-cache", "data"),
+         State("session-id", "data")],
     )
-    def fetch_genre_trends(date_range, selected_genres, cached_data):
+    @tracing.traced("callback.fetch_genre_trends")
+    def fetch_genre_trends(date_range, selected_genres, cached_data, session_id):
         """Fetch genre trends data using cache."""
         year_range = validate_date_range(date_range)
-        cache_key = create_cache_key(year_range, selected_genres)
+        spec = _filter_spec(data_service, year_range, selected_genres)
+        cache_key = spec.cache_key(*CHART_FILTERS["genre_trends"])
         cached_data = deserialize_cache_data(cached_data)
         
         if cached_data and cached_data.get("cache_key") == cache_key:
@@ -87,42 +257,21 @@ def register_dashboard_callbacks(app, data_service):
         
         logging.info("Fetching genre trends data")
         
-        year_genre_df = data_service.get_genre_trends(year_range, selected_genres)
-        
-        if year_genre_df.is_empty():
-            logging.warning("Genre trends data is empty.")
-            if cached_data and cached_data.get("data"):
-                raise PreventUpdate
-            return {
-                "cache_key": cache_key,
-                "data": None,
-                "error": "No data available"
-            }
-        
-        try:
-            serialized_data = df_to_base64_ipc(year_genre_df)
-            return {
-                "cache_key": cache_key,
-                "data": serialized_data
-            }
-        except Exception as e:
-            logging.error(f"Error serializing genre trends data: {e}")
-            if cached_data and cached_data.get("data"):
-                raise PreventUpdate
-            return {
-                "cache_key": cache_key,
-                "data": None,
-                "error": str(e)
-            }
+        generation = data_service.data_generation
+        year_genre_df = _fetch_latest(data_service, session_id, "genre_trends", data_service.get_genre_trends, spec.year_range, list(spec.genres))
+        return _store_payload(result_store, "genre_trends", year_genre_df, cache_key, _chart_filters(spec), cached_data, generation)
         
     @app.callback(
         Output("runtime-distribution-cache", "data"),
         [Input("runtime-range-filter", "value")],
-        [State("runtime-distribution-cache", "data")],
+        [State("runtime-distribution-cache", "data"),
+         State("session-id", "data")],
     )
-    def fetch_runtime_distribution(runtime_range, cached_data):
+    @tracing.traced("callback.fetch_runtime_distribution")
+    def fetch_runtime_distribution(runtime_range, cached_data, session_id):
         """Fetch runtime distribution data using cache."""
-        cache_key = create_cache_key(runtime_range)
+        spec = _filter_spec(data_service, runtime_range=runtime_range)
+        cache_key = spec.cache_key(*CHART_FILTERS["runtime_distribution"])
         cached_data = deserialize_cache_data(cached_data)
         
         if cached_data and cached_data.get("cache_key") == cache_key:
@@ -131,43 +280,22 @@ def register_dashboard_callbacks(app, data_service):
         
         logging.info("Fetching runtime distribution data")
         
-        runtime_dist_df = data_service.get_runtime_distribution(runtime_range)
-        
-        if runtime_dist_df.is_empty():
-            logging.warning("Runtime distribution data is empty.")
-            if cached_data and cached_data.get("data"):
-                raise PreventUpdate
-            return {
-                "cache_key": cache_key,
-                "data": None,
-                "error": "No data available"
-            }
-
-        try:
-            serialized_data = df_to_base64_ipc(runtime_dist_df)
-            return {
-                "cache_key": cache_key,
-                "data": serialized_data
-            }
-        except Exception as e:
-            logging.error(f"Error serializing runtime distribution data: {e}")
-            if cached_data and cached_data.get("data"):
-                raise PreventUpdate
-            return {
-                "cache_key": cache_key,
-                "data": None,
-                "error": str(e)
-            }
+        generation = data_service.data_generation
+        runtime_dist_df = _fetch_latest(data_service, session_id, "runtime_distribution", data_service.get_runtime_distribution, spec.runtime_range)
+        return _store_payload(result_store, "runtime_distribution", runtime_dist_df, cache_key, _chart_filters(spec), cached_data, generation)
         
     @app.callback(
         Output("yearly-trends-cache", "data"),
         [Input("year-range-filter", "value")],
-        [State("yearly-trends-cache", "data")],
+        [State("yearly-trends-cache", "data"),
+         State("session-id", "data")],
     )
-    def fetch_yearly_trends(date_range, cached_data):
+    @tracing.traced("callback.fetch_yearly_trends")
+    def fetch_yearly_trends(date_range, cached_data, session_id):
         """Fetch yearly trends data using cache."""
         year_range = validate_date_range(date_range)
-        cache_key = create_cache_key(year_range)
+        spec = _filter_spec(data_service, year_range)
+        cache_key = spec.cache_key(*CHART_FILTERS["yearly_trends"])
         cached_data = deserialize_cache_data(cached_data)
         
         if cached_data and cached_data.get("cache_key") == cache_key:
@@ -176,35 +304,14 @@ def register_dashboard_callbacks(app, data_service):
         
         logging.info("Fetching yearly trends data")
         
-        yearly_trends_df = data_service.get_yearly_trends(year_range)
-        
-        if yearly_trends_df.is_empty():
-            logging.warning("Yearly trends data is empty.")
-            if cached_data and cached_data.get("data"):
-                raise PreventUpdate
-            return {
-                "cache_key": cache_key,
-                "data": None,
-                "error": "No data available"
-            }
-        
-        try:
-            serialized_data = df_to_base64_ipc(yearly_trends_df)
-            return {
-                "cache_key": cache_key,
-                "data": serialized_data
-            }
-        except Exception as e:
-            logging.error(f"Error serializing yearly trends data: {e}")
-            if cached_data and cached_data.get("data"):
-                raise PreventUpdate
-            return {
-                "cache_key": cache_key,
-                "data": None,
-                "error": str(e)
-            }
-        
-    # ========== CHART RENDERING CALLBACKS (Read from dcc.Store with IPC) =========
+        generation = data_service.data_generation
+        yearly_trends_df = _fetch_latest(data_service, session_id, "yearly_trends", data_service.get_yearly_trends, spec.year_range)
+        return _store_payload(result_store, "yearly_trends", yearly_trends_df, cache_key, _chart_filters(spec), cached_data, generation)
+
+def _register_render_callbacks(app, data_service, result_store, figure_cache=None):
+    """Register the callbacks rendering each chart from the result its dcc.Store refers to."""
+
+    # ========== CHART RENDERING CALLBACKS (Read from the ResultStore) =========
     
     @app.callback(
         [Output("top-movies-chart", "figure"),
@@ -212,35 +319,35 @@ def register_dashboard_callbacks(app, data_service):
         [Input("top-movies-cache", "data")],
         [State("top-movies-chart", "figure")]
     )
+    @tracing.traced("callback.render_top_movies")
     def render_top_movies(cached_data, current_figure):
-        """Render top movies chart from cached IPC data."""
+        """Render top movies chart from its stored result."""
         cached_data = deserialize_cache_data(cached_data)
 
         if not cached_data:
             return create_empty_chart("Loading..."), True
         
         # Check for errors
-        if cached_data.get("error") and not cached_data.get("data"):
+        if cached_data.get("error") and not cached_data.get("version"):
             error_msg = cached_data.get("error", "Unknown error")
             logging.warning(f"Rendering empty chart due to error: {error_msg}")
             return create_empty_chart("Error rendering chart"), False
         
         # No data in cache
-        if not cached_data.get("data"):
+        if not cached_data.get("version"):
             return create_empty_chart("No data available"), False
         
+        _record_store_round_trip(cached_data, "top_movies")
         try:
-            top_movies_df = df_from_base64_ipc(cached_data["data"])
-            
-            fig = create_bar_chart(
-                df=top_movies_df,
+            fig = _render_figure(figure_cache, "top_movies", cached_data, lambda: create_bar_chart(
+                df=_load_result(result_store, data_service, cached_data),
                 x_col='average_rating',
                 y_col='movie_title',
                 color_col='total_votes',
                 horizontal=True,
                 hover_name='movie_title',
                 hover_data=['average_rating', 'total_votes', "genres", "release_year", "runtime_minutes", "is_adult"]
-            )
+            ))
             return fig, False
         except Exception as e:
             logging.error(f"Error rendering top movies chart: {e}")
@@ -255,32 +362,32 @@ def register_dashboard_callbacks(app, data_service):
         [Input("genre-trends-cache", "data")],
         [State("genre-trends-chart", "figure")]
     )
+    @tracing.traced("callback.render_genre_trends")
     def render_genre_trends(cached_data, current_figure):
-        """Render genre trends chart from cached IPC data."""
+        """Render genre trends chart from its stored result."""
         cached_data = deserialize_cache_data(cached_data)
         
         if not cached_data:
             return create_empty_chart("Loading..."), True
         
-        if cached_data.get("error") and not cached_data.get("data"):
+        if cached_data.get("error") and not cached_data.get("version"):
             error_msg = cached_data.get("error", "Unknown error")
             logging.warning(f"Rendering empty chart due to error: {error_msg}")
             return create_empty_chart("Error rendering chart"), False
         
-        if not cached_data.get("data"):
+        if not cached_data.get("version"):
             return create_empty_chart("No data available"), False
         
+        _record_store_round_trip(cached_data, "genre_trends")
         try:
-            year_genre_df = df_from_base64_ipc(cached_data["data"])
-            
-            fig = create_area_chart(
-                df=year_genre_df,
+            fig = _render_figure(figure_cache, "genre_trends", cached_data, lambda: create_area_chart(
+                df=_load_result(result_store, data_service, cached_data),
                 x_col='release_year',
                 y_col='total_movies',
                 color_col='genre',
                 hover_name='genre',
                 hover_data=['total_movies', 'average_rating', 'total_votes']
-            )
+            ))
             return fig, False
         except Exception as e:
             logging.error(f"Error rendering genre trends chart: {e}")
@@ -294,33 +401,33 @@ def register_dashboard_callbacks(app, data_service):
         [Input("runtime-distribution-cache", "data")],
         [State("runtime-distribution-chart", "figure")]
     )
+    @tracing.traced("callback.render_runtime_distribution")
     def render_runtime_distribution(cached_data, current_figure):
-        """Render runtime distribution chart from cached IPC data."""
+        """Render runtime distribution chart from its stored result."""
         cached_data = deserialize_cache_data(cached_data)
         
         if not cached_data:
             return create_empty_chart("Loading..."), True
         
-        if cached_data.get("error") and not cached_data.get("data"):
+        if cached_data.get("error") and not cached_data.get("version"):
             error_msg = cached_data.get("error", "Unknown error")
             logging.warning(f"Rendering empty chart due to error: {error_msg}")
             return create_empty_chart("Error rendering chart"), False
         
-        if not cached_data.get("data"):
+        if not cached_data.get("version"):
             return create_empty_chart("No data available"), False
         
+        _record_store_round_trip(cached_data, "runtime_distribution")
         try:
-            runtime_dist_df = df_from_base64_ipc(cached_data["data"])
-            
-            fig = create_combo_chart(
-                df=runtime_dist_df,
+            fig = _render_figure(figure_cache, "runtime_distribution", cached_data, lambda: create_combo_chart(
+                df=_load_result(result_store, data_service, cached_data),
                 x_col='runtime_bin',
                 y_bar_col='total_movies',
                 y_line_col='average_rating',
                 hover_name='runtime_bin',
                 hover_data_bar=['total_movies', 'min_runtime', 'max_runtime'],
                 hover_data_line=['average_rating', 'min_runtime', 'max_runtime']
-            )
+            ))
             return fig, False
         except Exception as e:
             logging.error(f"Error rendering runtime distribution chart: {e}")
@@ -334,32 +441,32 @@ def register_dashboard_callbacks(app, data_service):
         [Input("yearly-trends-cache", "data")],
         [State("yearly-trends-chart", "figure")]
     )
+    @tracing.traced("callback.render_yearly_trends")
     def render_yearly_trends(cached_data, current_figure):
-        """Render yearly trends chart from cached IPC data."""
+        """Render yearly trends chart from its stored result."""
         cached_data = deserialize_cache_data(cached_data)
         
         if not cached_data:
             return create_empty_chart("Loading..."), True
         
-        if cached_data.get("error") and not cached_data.get("data"):
+        if cached_data.get("error") and not cached_data.get("version"):
             error_msg = cached_data.get("error", "Unknown error")
             logging.warning(f"Rendering empty chart due to error: {error_msg}")
             return create_empty_chart("Error rendering chart"), False
         
-        if not cached_data.get("data"):
+        if not cached_data.get("version"):
             return create_empty_chart("No data available"), False
         
+        _record_store_round_trip(cached_data, "yearly_trends")
         try:
-            yearly_trends_df = df_from_base64_ipc(cached_data["data"])
-            
-            fig = create_dual_axis_line_chart(
-                df=yearly_trends_df,
+            fig = _render_figure(figure_cache, "yearly_trends", cached_data, lambda: create_dual_axis_line_chart(
+                df=_load_result(result_store, data_service, cached_data),
                 x_col='release_year',
                 y1_col='total_movies',
                 y2_col='average_rating',
                 hover_name='release_year',
                 hover_data=['total_movies', 'average_rating']
-            )
+            ))
             return fig, False
         except Exception as e:
             logging.error(f"Error rendering yearly trends chart: {e}")
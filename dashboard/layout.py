@@ -1,3 +1,4 @@
+import uuid
 import dash_mantine_components as dmc
 from dash import dcc
 from config import CHART_HEIGHT, THEME, TOP_N_MOVIES, MIN_VOTES_THRESHOLD
@@ -6,7 +7,10 @@ from components.chart_card import create_chart_card
 def create_dashboard():
     return dmc.Stack(
         children=[
-            # Frontend cache (session storage)
+            # ID of this browser tab, new on every page load, to cancel its superseded queries
+            dcc.Store(id='session-id', storage_type='memory', data=uuid.uuid4().hex),
+
+            # Handles of the chart results kept server-side (session storage)
             dcc.Store(id='top-movies-cache', storage_type='session'),
             dcc.Store(id='genre-trends-cache', storage_type='session'),
             dcc.Store(id='runtime-distribution-cache', storage_type='session'),
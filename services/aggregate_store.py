@@ -0,0 +1,50 @@
+import logging
+import polars as pl
+from services.memory_store import MemoryStore
+
+# Table name -> (columns kept in memory, sort key columns)
+AGGREGATE_TABLES = {
+    "year_genre_aggregates": (["release_year", "genre", "total_movies", "average_rating", "total_votes"], ["release_year", "genre"]),
+    "yearly_aggregates": (["release_year", "total_movies", "average_rating"], ["release_year"]),
+    "runtime_distribution": (["runtime_bin", "total_movies", "average_rating", "min_runtime", "max_runtime"], ["min_runtime"]),
+}
+
+class AggregateStore(MemoryStore):
+    """
+    Memory-resident copies of the small aggregate tables.
+
+    Tables are loaded whole once per refresh interval, sorted by their key columns
+    and sliced locally with binary search instead of querying the backend per filter.
+    """
+
+    def _build(self) -> dict[str, pl.DataFrame]:
+        tables = {}
+        for table_name, (columns, sort_by) in AGGREGATE_TABLES.items():
+            df = self._load_table(table_name, columns)
+            tables[table_name] = df.select(columns).sort(sort_by).rechunk()
+        logging.info(f"Loaded aggregate tables into memory ({sum(df.estimated_size() for df in tables.values())} bytes)")
+        return tables
+
+    @staticmethod
+    def _slice_sorted(df: pl.DataFrame, column: str, lower, upper) -> pl.DataFrame:
+        """Slice the rows with lower <= column <= upper from a frame sorted by column."""
+        start = df[column].search_sorted(lower, side="left")
+        end = df[column].search_sorted(upper, side="right")
+        return df.slice(start, max(end - start, 0))
+
+    def get_genre_trends(self, year_range: tuple[int, int], selected_genres: list[str]) -> pl.DataFrame:
+        """Get year/genre aggregates within the year range, optionally limited to some genres."""
+        df = self._slice_sorted(self._get_state()["year_genre_aggregates"], "release_year", year_range[0], year_range[1])
+        if selected_genres:
+            df = df.filter(pl.col("genre").is_in(selected_genres))
+        return df
+
+    def get_runtime_distribution(self, runtime_range: tuple[int, int]) -> pl.DataFrame:
+        """Get the runtime bins fully contained in the runtime range."""
+        # Bins starting after the upper bound can't end inside the range
+        df = self._slice_sorted(self._get_state()["runtime_distribution"], "min_runtime", runtime_range[0], runtime_range[1])
+        return df.filter(pl.col("max_runtime") <= runtime_range[1])
+
+    def get_yearly_trends(self, year_range: tuple[int, int]) -> pl.DataFrame:
+        """Get yearly aggregates within the year range."""
+        return self._slice_sorted(self._get_state()["yearly_aggregates"], "release_year", year_range[0], year_range[1])
@@ -0,0 +1,82 @@
+import argparse
+import os
+import polars as pl
+from config import GOOGLE_CLOUD_CREDENTIALS, PROJECT_ID, DATASET_ID, TABLES_IDS, PARQUET_DATA_DIR
+from services.query_backend import QueryBackend
+from services.query_builder import (
+    top_movies_query, year_range_query, unique_genres_query, genre_trends_query,
+    runtime_distribution_query, yearly_trends_query, table_query
+)
+
+class BigQueryBackend(QueryBackend):
+    """Query backend that runs parameterized SQL against the BigQuery warehouse tables."""
+
+    def __init__(self, tables: dict, execute_query):
+        """
+        Args:
+            tables (dict): Mapping of table name to fully qualified BigQuery table ID
+            execute_query (callable): Function that runs a Query and returns a Polars DataFrame.
+                With a coroutine function, the query methods return awaitables instead.
+        """
+        self.tables = tables
+        self._execute_query = execute_query
+
+    def get_top_movies(self, year_range: tuple[int, int], selected_genres: list[str], rating_threshold: tuple[float, float], runtime_range: tuple[int, int] | None, limit: int, min_votes: int) -> pl.DataFrame:
+        return self._execute_query(top_movies_query(
+            self.tables['movies_details'], year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes
+        ))
+
+    def get_year_range(self) -> pl.DataFrame:
+        return self._execute_query(year_range_query(self.tables['movies_details']))
+
+    def get_unique_genres(self) -> pl.DataFrame:
+        return self._execute_query(unique_genres_query(self.tables['year_genre_aggregates']))
+
+    def get_genre_trends(self, year_range: tuple[int, int], selected_genres: list[str]) -> pl.DataFrame:
+        return self._execute_query(genre_trends_query(self.tables['year_genre_aggregates'], year_range, selected_genres))
+
+    def get_runtime_distribution(self, runtime_range: tuple[int, int]) -> pl.DataFrame:
+        return self._execute_query(runtime_distribution_query(self.tables['runtime_distribution'], runtime_range))
+
+    def get_yearly_trends(self, year_range: tuple[int, int]) -> pl.DataFrame:
+        return self._execute_query(yearly_trends_query(self.tables['yearly_aggregates'], year_range))
+
+    def load_table(self, table_name: str, columns: list[str]) -> pl.DataFrame:
+        return self._execute_query(table_query(self.tables[table_name], columns))
+
+    def export_parquet_snapshots(self, data_dir: str) -> list[str]:
+        """
+        Export full copies of the warehouse tables as Parquet files for ParquetBackend.
+
+        Args:
+            data_dir (str): Directory where <table_name>.parquet files are written
+
+        Returns:
+            list[str]: Paths of the written snapshot files
+        """
+        os.makedirs(data_dir, exist_ok=True)
+        paths = []
+        for table_name, full_table_id in self.tables.items():
+            path = os.path.join(data_dir, f"{table_name}.parquet")
+            self._execute_query(table_query(full_table_id)).write_parquet(path)
+            paths.append(path)
+        return paths
+
+def main(argv=None) -> list[str]:
+    """Export the warehouse tables configured in the environment as Parquet snapshots for QUERY_BACKEND=parquet."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="Write <table_name>.parquet snapshots of the warehouse tables")
+    export.add_argument("--dir", default=PARQUET_DATA_DIR, help="Directory the Parquet snapshots are written to")
+    args = parser.parse_args(argv)
+
+    # The DataService builds on this module, so it's only imported when run as a script
+    from services.data_service import DataService
+    data_service = DataService(GOOGLE_CLOUD_CREDENTIALS, PROJECT_ID, DATASET_ID, TABLES_IDS)
+    paths = data_service.warehouse.export_parquet_snapshots(args.dir)
+    for path in paths:
+        print(path)
+    return paths
+
+if __name__ == "__main__":
+    main()
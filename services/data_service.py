@@ -1,191 +1,738 @@
+import asyncio
+import contextvars
 import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import polars as pl
-from config import FCD_TTL, SCD_TTL
-from utils.google_cloud import get_bigquery_client
+from google.cloud import bigquery
+from config import (
+    FCD_TTL, SCD_TTL, BQ_STORAGE_API_MIN_ROWS, AGGREGATES_REFRESH_INTERVAL,
+    TOP_MOVIES_INDEX_REFRESH_INTERVAL, IN_FLIGHT_WAIT_TIMEOUT,
+    CACHE_STALE_GRACE, CACHE_TTL_JITTER, CACHE_REFRESH_WORKERS, CACHE_MAX_PENDING_REFRESHES,
+    BUNDLE_WORKERS, QUERY_POLL_INTERVAL, QUERY_MAX_POLL_INTERVAL, JOB_LEDGER_MAX_ENTRIES, JOB_LEDGER_PATH
+)
+from utils.google_cloud import get_bigquery_client, get_bigquery_storage_client
 from utils.cache import create_cache_key
+from utils.single_flight import SingleFlight, AsyncSingleFlight, InFlightTimeoutError
+from utils import metrics, tracing
+from services.query_backend import QueryBackend
+from services.bigquery_backend import BigQueryBackend
+from services.parquet_backend import ParquetBackend
+from services.aggregate_store import AggregateStore
+from services.memory_store import RETRY_INTERVAL
+from services.semantic_cache import SemanticCache
+from services.top_movies_index import TopMoviesIndex
+from services.query_builder import Query
+from services.filter_spec import canonical_args, takes_years
+from services.job_tracker import JobTracker, QueryCancelledError, current_scope
+from services.job_ledger import JobLedger
+
+QUERY_BACKENDS = ("bigquery", "parquet")
+DASHBOARD_CHARTS = ("top_movies", "genre_trends", "runtime_distribution", "yearly_trends")
+DEFAULT_YEAR_RANGE = (1900, 2025)
+
+CACHE_LOOKUPS = metrics.counter("imdb_cache_lookups_total", "DataService calls by how they were answered (hit, stale, semantic, memory, miss)", ("method", "result"))
+CALL_DURATION = metrics.histogram("imdb_data_service_call_duration_seconds", "Duration of cached DataService calls, hits included", ("method",))
+BACKEND_QUERIES = metrics.counter("imdb_backend_queries_total", "Queries run on a query backend", ("method", "backend", "status"))
+BACKEND_QUERY_DURATION = metrics.histogram("imdb_backend_query_duration_seconds", "Duration of queries run on a query backend", ("method", "backend"))
+BIGQUERY_JOBS = metrics.counter("imdb_bigquery_jobs_total", "BigQuery query jobs by outcome (ok, error, cancelled)", ("status",))
+BIGQUERY_JOB_DURATION = metrics.histogram("imdb_bigquery_job_duration_seconds", "Duration of BigQuery query jobs, submission to downloaded results")
+
+# DataService method whose backend query is running, recorded with its BigQuery jobs
+_current_method = contextvars.ContextVar("current_method", default=None)
 
 class DataService:
-    """Service to fetch data from BigQuery with optional caching."""
+    """
+    Service to fetch data from BigQuery or local Parquet snapshots with optional caching.
+
+    The get_* methods return an empty (or default) result when their query fails, without
+    caching it; pass raise_errors=True to get the error instead.
+    """
     
-    def __init__(self, credentials: dict, project_id: str, dataset_id: str, tables_ids: dict, cache_instance=None):
-        self.client = get_bigquery_client(credentials, project_id)
+    def __init__(self, credentials: dict, project_id: str, dataset_id: str, tables_ids: dict, cache_instance=None, backend: str = "bigquery", parquet_dir: str = "data", preload_aggregates: bool = False, top_movies_index: bool = False):
+        if backend not in QUERY_BACKENDS:
+            raise ValueError(f"Unknown query backend '{backend}', expected one of {QUERY_BACKENDS}")
+
+        try:
+            self.client = get_bigquery_client(credentials, project_id)
+        except RuntimeError as e:
+            # The local backend can run without warehouse credentials, just without fallback
+            if backend == "bigquery":
+                raise
+            logging.warning(f"BigQuery client unavailable, warehouse fallback disabled: {e}")
+            self.client = None
+
+        self._credentials = credentials
+        self._bqstorage_client = None
+        self._bqstorage_available = True
         self.dataset_id = dataset_id
         self.base_path = f"{project_id}.{dataset_id}."
         self.tables = {table_name: f"{self.base_path}{table_id}" for table_name, table_id in tables_ids.items()}
         self.cache = cache_instance
+        self.semantic_cache = SemanticCache(cache_instance) if cache_instance else None
+        self.in_flight = SingleFlight(timeout=IN_FLIGHT_WAIT_TIMEOUT)
+        self.async_in_flight = AsyncSingleFlight(self.in_flight)
+        self.job_tracker = JobTracker()
+        self.job_ledger = JobLedger(max_entries=JOB_LEDGER_MAX_ENTRIES, path=JOB_LEDGER_PATH)
+        self._refresh_executor = ThreadPoolExecutor(max_workers=CACHE_REFRESH_WORKERS, thread_name_prefix="cache-refresh")
+        self._pending_refreshes = set()
+        self._refresh_lock = threading.Lock()
+        self._refreshes = 0
+        self._year_bounds = None
+        self._year_bounds_due = 0.0
+        self._bundle_executor = ThreadPoolExecutor(max_workers=BUNDLE_WORKERS, thread_name_prefix="dashboard-bundle")
+
+        self.warehouse = BigQueryBackend(self.tables, self._execute_query) if self.client else None
+        self.async_warehouse = BigQueryBackend(self.tables, self._aexecute_query) if self.client else None
+        if backend == "parquet":
+            self.backend: QueryBackend = ParquetBackend(parquet_dir, tables_ids.keys())
+            self.fallback_backend = self.warehouse
+        else:
+            self.backend = self.warehouse
+            self.fallback_backend = None
+
+        # Tables can be kept in memory and queried locally
+        load_table = lambda table_name, columns: self._query_backend("load_table", table_name, columns)
+        self.aggregates = AggregateStore(load_table, refresh_interval=AGGREGATES_REFRESH_INTERVAL) if preload_aggregates else None
+        self.top_movies_index = TopMoviesIndex(load_table, refresh_interval=TOP_MOVIES_INDEX_REFRESH_INTERVAL) if top_movies_index else None
 
     def _get_cache_key(self, method_name: str, *args, **kwargs) -> str:
         """Generate cache key for method and arguments."""
         return f"{self.__class__.__name__}.{method_name}:{create_cache_key(*args, **kwargs)}"
 
     def _cache_get_or_set(self, method_name: str, timeout: int, func, *args, **kwargs):
-        """Generic cache get or set method."""
-        if not self.cache:
-            return func(*args, **kwargs)
-        
-        cache_key = self._get_cache_key(method_name, *args, **kwargs)
-        
-        # Try cache first
+        """
+        Generic cache get or set method.
+
+        Results are fresh for `timeout` seconds and kept for CACHE_STALE_GRACE more, during
+        which they are still served while a background refresh replaces them.
+        """
+        start = time.perf_counter()
+        try:
+            if not self.cache:
+                return func(*canonical_args(method_name, args), **kwargs)
+
+            # Equivalent filters (e.g. genres in another order, years beyond the data) share one cache entry and query
+            year_bounds = self.year_bounds() if takes_years(method_name) else None
+            args = canonical_args(method_name, args, year_bounds)
+
+            cache_key = self._get_cache_key(method_name, *args, **kwargs)
+
+            # Try cache first
+            with tracing.span("cache_lookup", method=method_name):
+                cached_result, is_fresh = self.cache.get_many(cache_key, self._fresh_key(cache_key))
+            if cached_result is not None:
+                if is_fresh:
+                    logging.debug(f"Cache HIT for {method_name}")
+                    CACHE_LOOKUPS.inc(method_name, "hit")
+                else:
+                    logging.debug(f"Cache STALE HIT for {method_name}")
+                    CACHE_LOOKUPS.inc(method_name, "stale")
+                    self._schedule_refresh(method_name, cache_key, timeout, func, *args, **kwargs)
+                return cached_result
+
+            # Try to derive the result from a cached result with a wider filter
+            derived_result = self.semantic_cache.lookup(method_name, args)
+            if derived_result is not None:
+                logging.debug(f"Semantic cache HIT for {method_name}")
+                CACHE_LOOKUPS.inc(method_name, "semantic")
+                return derived_result
+
+            # Execute and cache, sharing the result with concurrent callers for the same key
+            CACHE_LOOKUPS.inc(method_name, "miss")
+            try:
+                return self.in_flight.do(cache_key, self._fetch_and_cache, method_name, cache_key, timeout, func, *args, **kwargs)
+            except InFlightTimeoutError as e:
+                logging.warning(f"{e}, running {method_name} directly")
+                return self._fetch_and_cache(method_name, cache_key, timeout, func, *args, **kwargs)
+            except QueryCancelledError:
+                # The shared call may belong to another request that was superseded
+                if self._is_superseded():
+                    raise
+                logging.info(f"Shared {method_name} query was cancelled by a superseded request, running it again")
+                return self._fetch_and_cache(method_name, cache_key, timeout, func, *args, **kwargs)
+        finally:
+            CALL_DURATION.observe(time.perf_counter() - start, method_name)
+
+    @staticmethod
+    def _or_fallback(message: str, fallback, raise_errors: bool, func, *args):
+        """
+        Return func(*args), or fallback if it raises (unless raise_errors).
+
+        Fetches raise on failure instead of returning a fallback themselves, so failed
+        results are never cached and stale results are kept by background refreshes.
+        """
+        try:
+            return func(*args)
+        except Exception as e:
+            if raise_errors:
+                raise
+            logging.error(f"{message}: {e}")
+            return fallback
+
+    @staticmethod
+    async def _aor_fallback(message: str, fallback, raise_errors: bool, coro):
+        """Async _or_fallback for an awaitable."""
+        try:
+            return await coro
+        except Exception as e:
+            if raise_errors:
+                raise
+            logging.error(f"{message}: {e}")
+            return fallback
+
+    @staticmethod
+    def _is_superseded() -> bool:
+        """Check whether the request running in the current context was superseded by a newer one."""
+        scope = current_scope()
+        return scope is not None and scope.superseded
+
+    async def _acache_get_or_set(self, method_name: str, timeout: int, func, *args):
+        """Async _cache_get_or_set for a coroutine function func."""
+        start = time.perf_counter()
+        try:
+            if not self.cache:
+                return await func(*canonical_args(method_name, args))
+
+            year_bounds = await self.ayear_bounds() if takes_years(method_name) else None
+            args = canonical_args(method_name, args, year_bounds)
+
+            cache_key = self._get_cache_key(method_name, *args)
+
+            with tracing.span("cache_lookup", method=method_name):
+                cached_result, is_fresh = self.cache.get_many(cache_key, self._fresh_key(cache_key))
+            if cached_result is not None:
+                if is_fresh:
+                    logging.debug(f"Cache HIT for {method_name}")
+                    CACHE_LOOKUPS.inc(method_name, "hit")
+                else:
+                    logging.debug(f"Cache STALE HIT for {method_name}")
+                    CACHE_LOOKUPS.inc(method_name, "stale")
+                    # Refresh threads have no event loop, so they run the coroutine in their own
+                    self._schedule_refresh(method_name, cache_key, timeout, lambda *args: asyncio.run(func(*args)), *args)
+                return cached_result
+
+            derived_result = self.semantic_cache.lookup(method_name, args)
+            if derived_result is not None:
+                logging.debug(f"Semantic cache HIT for {method_name}")
+                CACHE_LOOKUPS.inc(method_name, "semantic")
+                return derived_result
+
+            CACHE_LOOKUPS.inc(method_name, "miss")
+            try:
+                return await self.async_in_flight.do(cache_key, self._afetch_and_cache, method_name, cache_key, timeout, func, *args)
+            except InFlightTimeoutError as e:
+                logging.warning(f"{e}, running {method_name} directly")
+                return await self._afetch_and_cache(method_name, cache_key, timeout, func, *args)
+            except QueryCancelledError:
+                if self._is_superseded():
+                    raise
+                logging.info(f"Shared {method_name} query was cancelled by a superseded request, running it again")
+                return await self._afetch_and_cache(method_name, cache_key, timeout, func, *args)
+        finally:
+            CALL_DURATION.observe(time.perf_counter() - start, method_name)
+
+    async def _afetch_and_cache(self, method_name: str, cache_key: str, timeout: int, func, *args):
+        """Async _fetch_and_cache."""
+        cached_result = self.cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        logging.debug(f"Cache MISS for {method_name}")
+        result = await func(*args)
+        self._store(method_name, cache_key, timeout, result, *args)
+        return result
+
+    @staticmethod
+    def _fresh_key(cache_key: str) -> str:
+        """Key of the marker that exists while the result under cache_key is fresh."""
+        return f"{cache_key}:fresh"
+
+    def _fetch_and_cache(self, method_name: str, cache_key: str, timeout: int, func, *args, **kwargs):
+        """Execute func and cache its result, unless a call that just finished already did."""
         cached_result = self.cache.get(cache_key)
         if cached_result is not None:
-            logging.debug(f"Cache HIT for {method_name}")
             return cached_result
-        
-        # Execute and cache
+
         logging.debug(f"Cache MISS for {method_name}")
         result = func(*args, **kwargs)
-        self.cache.set(cache_key, result, timeout=timeout)
+        self._store(method_name, cache_key, timeout, result, *args)
         return result
 
-    def _execute_query(self, query: str):
-        """Execute a BigQuery SQL query and return results in the specified format."""
+    def _store(self, method_name: str, cache_key: str, timeout: int, result, *args):
+        """Cache a result with jittered soft (fresh) and hard (stale) expiries."""
+        # Jitter keeps results cached together from expiring in the same second
+        jitter = random.uniform(1 - CACHE_TTL_JITTER, 1 + CACHE_TTL_JITTER)
+        self.cache.set(cache_key, result, timeout=int((timeout + CACHE_STALE_GRACE) * jitter))
+        self.cache.set(self._fresh_key(cache_key), True, timeout=max(int(timeout * jitter), 1))
+        self.semantic_cache.register(method_name, args, cache_key, result)
+
+    def _schedule_refresh(self, method_name: str, cache_key: str, timeout: int, func, *args, **kwargs):
+        """Refresh a stale result in the background, at most once per key at a time."""
+        with self._refresh_lock:
+            if cache_key in self._pending_refreshes or len(self._pending_refreshes) >= CACHE_MAX_PENDING_REFRESHES:
+                return
+            self._pending_refreshes.add(cache_key)
+
+        def _refresh():
+            try:
+                result = func(*args, **kwargs)
+                self._store(method_name, cache_key, timeout, result, *args)
+                with self._refresh_lock:
+                    self._refreshes += 1
+                logging.debug(f"Background refresh of {method_name} done")
+            except Exception as e:
+                # Fetches raise on failure, so the stale result keeps being served
+                logging.error(f"Background refresh of {method_name} failed, keeping stale result: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._pending_refreshes.discard(cache_key)
+
+        self._refresh_executor.submit(_refresh)
+
+    @staticmethod
+    def _run_backend_query(backend: QueryBackend, method_name: str, *args) -> pl.DataFrame:
+        """Run a query on a backend, recording its count, outcome and duration."""
+        backend_name = backend.__class__.__name__
+        token = _current_method.set(method_name)
+        start = time.perf_counter()
+        try:
+            with tracing.span("backend_query", method=method_name, backend=backend_name):
+                df = getattr(backend, method_name)(*args)
+        except BaseException:
+            BACKEND_QUERIES.inc(method_name, backend_name, "error")
+            raise
+        finally:
+            _current_method.reset(token)
+        BACKEND_QUERIES.inc(method_name, backend_name, "ok")
+        BACKEND_QUERY_DURATION.observe(time.perf_counter() - start, method_name, backend_name)
+        return df
+
+    @staticmethod
+    async def _arun_backend_query(backend: QueryBackend, method_name: str, *args) -> pl.DataFrame:
+        """Async _run_backend_query for the async warehouse."""
+        backend_name = backend.__class__.__name__
+        token = _current_method.set(method_name)
+        start = time.perf_counter()
+        try:
+            with tracing.span("backend_query", method=method_name, backend=backend_name):
+                df = await getattr(backend, method_name)(*args)
+        except BaseException:
+            BACKEND_QUERIES.inc(method_name, backend_name, "error")
+            raise
+        finally:
+            _current_method.reset(token)
+        BACKEND_QUERIES.inc(method_name, backend_name, "ok")
+        BACKEND_QUERY_DURATION.observe(time.perf_counter() - start, method_name, backend_name)
+        return df
+
+    def _query_backend(self, method_name: str, *args) -> pl.DataFrame:
+        """Run a query on the configured backend, falling back to the warehouse if the local backend fails."""
+        try:
+            return self._run_backend_query(self.backend, method_name, *args)
+        except Exception as e:
+            if self.fallback_backend is None:
+                raise
+            logging.warning(f"{self.backend.__class__.__name__}.{method_name} failed, falling back to BigQuery: {e}")
+            return self._run_backend_query(self.fallback_backend, method_name, *args)
+
+    async def _aquery_backend(self, method_name: str, *args) -> pl.DataFrame:
+        """Async _query_backend: awaits warehouse queries and runs local backend queries in a worker thread."""
+        if self.backend is self.warehouse:
+            return await self._arun_backend_query(self.async_warehouse, method_name, *args)
+        try:
+            return await asyncio.to_thread(self._run_backend_query, self.backend, method_name, *args)
+        except Exception as e:
+            if self.fallback_backend is None:
+                raise
+            logging.warning(f"{self.backend.__class__.__name__}.{method_name} failed, falling back to BigQuery: {e}")
+            return await self._arun_backend_query(self.async_warehouse, method_name, *args)
+
+    def _get_bqstorage_client(self):
+        """Lazily create the BigQuery Storage Read API client, disabling it if it cannot be created."""
+        if self._bqstorage_client is None and self._bqstorage_available:
+            try:
+                self._bqstorage_client = get_bigquery_storage_client(self._credentials)
+            except RuntimeError as e:
+                logging.warning(f"BigQuery Storage API unavailable, using REST downloads: {e}")
+                self._bqstorage_available = False
+        return self._bqstorage_client
+
+    def _query_memory_store(self, store, method_name: str, *args) -> pl.DataFrame | None:
+        """Answer a query from an in-memory store, or return None if it is disabled or unavailable."""
+        if not store:
+            return None
         try:
-            return pl.from_pandas(self.client.query(query).to_dataframe())
+            df = getattr(store, method_name)(*args)
         except Exception as e:
+            logging.warning(f"{store.__class__.__name__} unavailable for {method_name}, querying backend: {e}")
+            return None
+        CACHE_LOOKUPS.inc(method_name, "memory")
+        return df
+
+    def _submit_query(self, query: Query | str):
+        """Submit a query job with its parameters, labelled with the query fingerprint."""
+        if isinstance(query, str):
+            query = Query(query)
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=query.query_parameters(),
+            labels={"query_fingerprint": query.fingerprint},
+        )
+        job = self.client.query(query.sql, job_config=job_config)
+        return job, query.fingerprint
+
+    def _execute_query(self, query: Query | str):
+        """
+        Execute a BigQuery SQL query and return results as a Polars DataFrame.
+
+        Parameterized queries keep the SQL text identical across filter values, so BigQuery's
+        result cache can hit and jobs can be grouped by their query_fingerprint label.
+        Results are downloaded as Arrow record batches, over REST for small results and
+        over the Storage Read API once they reach BQ_STORAGE_API_MIN_ROWS rows.
+        """
+        scope = self._submittable_scope()
+        start = time.perf_counter()
+        try:
+            job, fingerprint = self._submit_query(query)
+            if scope is not None and not scope.attach(job):
+                raise QueryCancelledError("Request superseded while its query was submitted")
+            try:
+                with tracing.span("bigquery_job", fingerprint=fingerprint, job_id=job.job_id):
+                    df = self._download_results(job)
+                duration = time.perf_counter() - start
+                logging.debug(f"Query {fingerprint} returned {len(df)} rows in {duration:.3f}s")
+                BIGQUERY_JOBS.inc("ok")
+                BIGQUERY_JOB_DURATION.observe(duration)
+                self.job_ledger.record(_current_method.get(), fingerprint, job, rows=len(df))
+                return df
+            finally:
+                if scope is not None:
+                    scope.detach(job)
+        except QueryCancelledError:
+            BIGQUERY_JOBS.inc("cancelled")
+            raise
+        except Exception as e:
+            if scope is not None and scope.superseded:
+                BIGQUERY_JOBS.inc("cancelled")
+                raise QueryCancelledError("Query cancelled by a newer request") from e
+            BIGQUERY_JOBS.inc("error")
+            logging.error(f"Error executing query: {e}")
+            raise
+
+    async def _aexecute_query(self, query: Query | str):
+        """
+        Async _execute_query.
+
+        The job is submitted and then polled with a growing interval, so no thread is
+        held while BigQuery runs it; only the short API calls run in worker threads.
+        """
+        scope = self._submittable_scope()
+        start = time.perf_counter()
+        try:
+            job, fingerprint = await asyncio.to_thread(self._submit_query, query)
+            if scope is not None and not scope.attach(job):
+                raise QueryCancelledError("Request superseded while its query was submitted")
+            try:
+                with tracing.span("bigquery_job", fingerprint=fingerprint, job_id=job.job_id):
+                    poll_interval = QUERY_POLL_INTERVAL
+                    while not await asyncio.to_thread(job.done):
+                        if scope is not None and scope.superseded:
+                            raise QueryCancelledError("Query cancelled by a newer request")
+                        await asyncio.sleep(poll_interval)
+                        poll_interval = min(poll_interval * 2, QUERY_MAX_POLL_INTERVAL)
+                    df = await asyncio.to_thread(self._download_results, job)
+                duration = time.perf_counter() - start
+                logging.debug(f"Query {fingerprint} returned {len(df)} rows in {duration:.3f}s")
+                BIGQUERY_JOBS.inc("ok")
+                BIGQUERY_JOB_DURATION.observe(duration)
+                self.job_ledger.record(_current_method.get(), fingerprint, job, rows=len(df))
+                return df
+            finally:
+                if scope is not None:
+                    scope.detach(job)
+        except QueryCancelledError:
+            BIGQUERY_JOBS.inc("cancelled")
+            raise
+        except Exception as e:
+            if scope is not None and scope.superseded:
+                BIGQUERY_JOBS.inc("cancelled")
+                raise QueryCancelledError("Query cancelled by a newer request") from e
+            BIGQUERY_JOBS.inc("error")
             logging.error(f"Error executing query: {e}")
             raise
+
+    @staticmethod
+    def _submittable_scope():
+        """Return the job scope of the current request, raising QueryCancelledError if it was already superseded."""
+        scope = current_scope()
+        if scope is not None and scope.superseded:
+            raise QueryCancelledError("Request superseded before its query was submitted")
+        return scope
+
+    def _download_results(self, job) -> pl.DataFrame:
+        """Download the results of a query job as a Polars DataFrame."""
+        rows = job.result()
+        use_storage_api = rows.total_rows is not None and rows.total_rows >= BQ_STORAGE_API_MIN_ROWS
+        bqstorage_client = self._get_bqstorage_client() if use_storage_api else None
+        arrow_table = rows.to_arrow(bqstorage_client=bqstorage_client, create_bqstorage_client=False)
+        return pl.from_arrow(arrow_table, rechunk=False)
     
     def clear_cache(self):
         """Clear all cached data."""
         if self.cache:
             self.cache.clear()
+            self.semantic_cache.clear()
+            with self._refresh_lock:
+                self._refreshes += 1
+            self._year_bounds_due = 0.0
             logging.info("Cache cleared successfully")
 
-    def get_top_movies(self, year_range: tuple[int, int], selected_genres: list[str], rating_threshold: tuple[float, float], runtime_range: tuple[int, int] = None, limit: int = 10, min_votes: int = 100) -> pl.DataFrame:
+    @property
+    def data_generation(self) -> int:
+        """
+        Number of times this process refreshed its cached results or in-memory tables.
+
+        Results fetched for the same filters within a generation hold the same data, so it
+        versions the chart results the dashboard keeps server-side.
+        """
+        return self._refreshes + sum(store.generation for store in (self.aggregates, self.top_movies_index) if store)
+
+    def get_top_movies(self, year_range: tuple[int, int], selected_genres: list[str], rating_threshold: tuple[float, float], runtime_range: tuple[int, int] = None, limit: int = 10, min_votes: int = 100, raise_errors: bool = False) -> pl.DataFrame:
         """Load top movies data with filters applied."""
+        df = self._query_memory_store(self.top_movies_index, "get_top_movies", year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes)
+        if df is not None:
+            return df.sort(by=["average_rating"])  # ascending for horizontal bar chart
+
         def _fetch(year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes):
-            try:
-                full_table_id = self.tables['movies_details']
-                genre_filter = ""
-                if selected_genres:
-                    genres_str = "', '".join(selected_genres)
-                    genre_filter = f"AND EXISTS (SELECT 1 FROM UNNEST(SPLIT(genres, ',')) AS genre WHERE TRIM(genre) IN ('{genres_str}'))"
-                
-                runtime_filter = ""
-                if runtime_range:
-                    runtime_filter = f"AND runtime_minutes BETWEEN {runtime_range[0]} AND {runtime_range[1]}"
-                
-                query = f"""
-                SELECT 
-                    movie_title, 
-                    release_year, 
-                    genres, 
-                    runtime_minutes, 
-                    CASE 
-                        WHEN is_adult = 1 THEN 'Yes' ELSE 'No'
-                    END as is_adult,
-                    average_rating, 
-                    total_votes
-                FROM `{full_table_id}`
-                WHERE release_year BETWEEN {year_range[0]} AND {year_range[1]}
-                AND average_rating BETWEEN {rating_threshold[0]} AND {rating_threshold[1]}
-                AND total_votes >= {min_votes}
-                {genre_filter}
-                {runtime_filter}
-                ORDER BY average_rating DESC, total_votes DESC
-                LIMIT {limit}
-                """
-                df = self._execute_query(query)
-                df = df.sort(by=["average_rating"])  # ascending for horizontal bar chart
-                return df
-            except Exception as e:
-                logging.error(f"Error loading top movies data: {e}")
-                return pl.DataFrame()
-        
-        return self._cache_get_or_set("get_top_movies", FCD_TTL, _fetch, year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes)
+            df = self._query_backend("get_top_movies", year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes)
+            return df.sort(by=["average_rating"])  # ascending for horizontal bar chart
 
-    def get_year_range(self) -> tuple[int, int]:
+        return self._or_fallback(
+            "Error loading top movies data", pl.DataFrame(), raise_errors,
+            self._cache_get_or_set, "get_top_movies", FCD_TTL, _fetch, year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes
+        )
+
+    def get_year_range(self, raise_errors: bool = False) -> tuple[int, int]:
         """Get the range of years available in movies data."""
         def _fetch():
+            df = self._query_backend("get_year_range")
+            if len(df) == 0 or df["min_year"][0] is None:
+                raise ValueError("No movies to get the year range of")
+            return (int(df["min_year"][0]), int(df["max_year"][0]))
+
+        return self._or_fallback(
+            "Error fetching year range, using default range", DEFAULT_YEAR_RANGE, raise_errors,
+            self._cache_get_or_set, "get_year_range", SCD_TTL, _fetch
+        )
+
+    def year_bounds(self) -> tuple[int, int] | None:
+        """
+        Release years available in the data, or None if they were never fetched.
+
+        Year filters are clamped to them, so every caller (dashboard callbacks, cache warm-up)
+        builds the same cache keys for equivalent year ranges. They're kept in memory and
+        reloaded once per SCD_TTL, so clamping a query doesn't count as a get_year_range call.
+        """
+        if time.monotonic() >= self._year_bounds_due:
             try:
-                full_table_id = self.tables['movies_details']
-                query = f"""
-                SELECT MIN(release_year) AS min_year, MAX(release_year) AS max_year
-                FROM `{full_table_id}`
-                WHERE average_rating IS NOT NULL
-                """
-                df = self._execute_query(query)
-                return (int(df["min_year"][0]), int(df["max_year"][0])) if len(df) > 0 else (1900, 2025)
-            except Exception as e:
-                logging.error(f"Error fetching year range: {e}. Using default range.")
-                return (1900, 2025)
-        
-        return self._cache_get_or_set("get_year_range", SCD_TTL, _fetch)
+                self._keep_year_bounds(self.get_year_range(raise_errors=True))
+            except Exception:
+                self._keep_year_bounds(None)
+        return self._year_bounds
+
+    def _keep_year_bounds(self, year_bounds: tuple[int, int] | None):
+        """Keep loaded year bounds until the next reload, retrying sooner (with the previous bounds) after a failure."""
+        if year_bounds is not None:
+            self._year_bounds = year_bounds
+        self._year_bounds_due = time.monotonic() + (SCD_TTL if year_bounds is not None else RETRY_INTERVAL)
 
-    def get_unique_genres(self) -> list[str]:
+    def get_unique_genres(self, raise_errors: bool = False) -> list[str]:
         """Get list of unique genres from movies table."""
         def _fetch():
-            try:
-                full_table_id = self.tables['year_genre_aggregates']
-                query = f"""
-                SELECT DISTINCT genre
-                FROM `{full_table_id}`
-                ORDER BY genre
-                """
-                df = self._execute_query(query)
-                return df["genre"].to_list() if len(df) > 0 else []
-            except Exception as e:
-                logging.error(f"Error fetching unique genres: {e}")
-                return []
-        
-        return self._cache_get_or_set("get_unique_genres", SCD_TTL, _fetch)
+            df = self._query_backend("get_unique_genres")
+            return df["genre"].to_list() if len(df) > 0 else []
 
-    def get_genre_trends(self, year_range: tuple[int, int], selected_genres: list[str]) -> pl.DataFrame:
+        return self._or_fallback("Error fetching unique genres", [], raise_errors, self._cache_get_or_set, "get_unique_genres", SCD_TTL, _fetch)
+
+    def get_genre_trends(self, year_range: tuple[int, int], selected_genres: list[str], raise_errors: bool = False) -> pl.DataFrame:
         """Get genre popularity trends over time with filters applied."""
-        def _fetch(year_range, selected_genres):
-            try:
-                full_table_id = self.tables['year_genre_aggregates']
-                genre_filter = ""
-                if selected_genres:
-                    genres_str = "', '".join(selected_genres)
-                    genre_filter = f"AND genre IN ('{genres_str}')"
-                
-                query = f"""
-                SELECT release_year, genre, total_movies, average_rating, total_votes
-                FROM `{full_table_id}`
-                WHERE release_year BETWEEN {year_range[0]} AND {year_range[1]}
-                {genre_filter}
-                ORDER BY release_year, genre
-                """
-                return self._execute_query(query)
-            except Exception as e:
-                logging.error(f"Error loading genre trends: {e}")
-                return pl.DataFrame()
-        
-        return self._cache_get_or_set("get_genre_trends", FCD_TTL, _fetch, year_range, selected_genres)
+        df = self._query_memory_store(self.aggregates, "get_genre_trends", year_range, selected_genres)
+        if df is not None:
+            return df
+
+        _fetch = lambda year_range, selected_genres: self._query_backend("get_genre_trends", year_range, selected_genres)
+        return self._or_fallback(
+            "Error loading genre trends", pl.DataFrame(), raise_errors,
+            self._cache_get_or_set, "get_genre_trends", FCD_TTL, _fetch, year_range, selected_genres
+        )
 
-    def get_runtime_distribution(self, runtime_range: tuple[int, int]) -> pl.DataFrame:
+    def get_runtime_distribution(self, runtime_range: tuple[int, int], raise_errors: bool = False) -> pl.DataFrame:
         """Get runtime distribution with filters applied."""
-        def _fetch(runtime_range):
-            try:
-                full_table_id = self.tables['runtime_distribution']
-                query = f"""
-                SELECT runtime_bin, total_movies, average_rating, min_runtime, max_runtime
-                FROM `{full_table_id}`
-                WHERE min_runtime >= {runtime_range[0]} AND max_runtime <= {runtime_range[1]}
-                ORDER BY min_runtime
-                """
-                return self._execute_query(query)
-            except Exception as e:
-                logging.error(f"Error loading runtime distribution: {e}")
-                return pl.DataFrame()
-        
-        return self._cache_get_or_set("get_runtime_distribution", FCD_TTL, _fetch, runtime_range)
+        df = self._query_memory_store(self.aggregates, "get_runtime_distribution", runtime_range)
+        if df is not None:
+            return df
 
-    def get_yearly_trends(self, year_range: tuple[int, int]) -> pl.DataFrame:
+        _fetch = lambda runtime_range: self._query_backend("get_runtime_distribution", runtime_range)
+        return self._or_fallback(
+            "Error loading runtime distribution", pl.DataFrame(), raise_errors,
+            self._cache_get_or_set, "get_runtime_distribution", FCD_TTL, _fetch, runtime_range
+        )
+
+    def get_yearly_trends(self, year_range: tuple[int, int], raise_errors: bool = False) -> pl.DataFrame:
         """Get yearly movie release trends with filters applied."""
-        def _fetch(year_range):
+        df = self._query_memory_store(self.aggregates, "get_yearly_trends", year_range)
+        if df is not None:
+            return df
+
+        _fetch = lambda year_range: self._query_backend("get_yearly_trends", year_range)
+        return self._or_fallback(
+            "Error loading yearly trends", pl.DataFrame(), raise_errors,
+            self._cache_get_or_set, "get_yearly_trends", FCD_TTL, _fetch, year_range
+        )
+
+    def get_dashboard_bundle(self, filters: dict, charts=DASHBOARD_CHARTS, session_id: str | None = None) -> dict[str, pl.DataFrame]:
+        """
+        Fetch the data of several dashboard charts concurrently.
+
+        Args:
+            filters (dict): year_range, selected_genres, rating_threshold, runtime_range, limit and min_votes
+            charts (Iterable[str]): Charts to fetch, any of DASHBOARD_CHARTS (default: all)
+            session_id (str): Session requesting the charts; its earlier requests for them are cancelled
+
+        Returns:
+            dict: Chart name -> DataFrame, without the charts superseded by a newer request
+        """
+        calls = {
+            "top_movies": lambda: self.get_top_movies(
+                filters["year_range"], filters["selected_genres"], filters["rating_threshold"], filters["runtime_range"],
+                filters.get("limit", 10), filters.get("min_votes", 100)
+            ),
+            "genre_trends": lambda: self.get_genre_trends(filters["year_range"], filters["selected_genres"]),
+            "runtime_distribution": lambda: self.get_runtime_distribution(filters["runtime_range"]),
+            "yearly_trends": lambda: self.get_yearly_trends(filters["year_range"]),
+        }
+        def _fetch(chart):
+            with self.job_tracker.track(session_id, chart):
+                return calls[chart]()
+
+        # Each chart gets its own context, so its job scope doesn't leak into the others
+        futures = {chart: self._bundle_executor.submit(contextvars.copy_context().run, _fetch, chart) for chart in charts}
+        frames = {}
+        for chart, future in futures.items():
             try:
-                full_table_id = self.tables['yearly_aggregates']
-                query = f"""
-                SELECT release_year, total_movies, average_rating
-                FROM `{full_table_id}`
-                WHERE release_year BETWEEN {year_range[0]} AND {year_range[1]}
-                ORDER BY release_year
-                """
-                return self._execute_query(query)
-            except Exception as e:
-                logging.error(f"Error loading yearly trends: {e}")
-                return pl.DataFrame()
-        
-        return self._cache_get_or_set("get_yearly_trends", FCD_TTL, _fetch, year_range)
+                frames[chart] = future.result()
+            except QueryCancelledError:
+                logging.info(f"Dropping {chart} from bundle, superseded by a newer request")
+        return frames
+
+    # ========== ASYNC API (for async Dash callbacks) =========
+
+    async def aget_top_movies(self, year_range: tuple[int, int], selected_genres: list[str], rating_threshold: tuple[float, float], runtime_range: tuple[int, int] = None, limit: int = 10, min_votes: int = 100, raise_errors: bool = False) -> pl.DataFrame:
+        """Async get_top_movies."""
+        df = self._query_memory_store(self.top_movies_index, "get_top_movies", year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes)
+        if df is not None:
+            return df.sort(by=["average_rating"])  # ascending for horizontal bar chart
+
+        async def _fetch(year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes):
+            df = await self._aquery_backend("get_top_movies", year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes)
+            return df.sort(by=["average_rating"])  # ascending for horizontal bar chart
+
+        return await self._aor_fallback(
+            "Error loading top movies data", pl.DataFrame(), raise_errors,
+            self._acache_get_or_set("get_top_movies", FCD_TTL, _fetch, year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes)
+        )
+
+    async def aget_year_range(self, raise_errors: bool = False) -> tuple[int, int]:
+        """Async get_year_range."""
+        async def _fetch():
+            df = await self._aquery_backend("get_year_range")
+            if len(df) == 0 or df["min_year"][0] is None:
+                raise ValueError("No movies to get the year range of")
+            return (int(df["min_year"][0]), int(df["max_year"][0]))
+
+        return await self._aor_fallback(
+            "Error fetching year range, using default range", DEFAULT_YEAR_RANGE, raise_errors,
+            self._acache_get_or_set("get_year_range", SCD_TTL, _fetch)
+        )
+
+    async def ayear_bounds(self) -> tuple[int, int] | None:
+        """Async year_bounds."""
+        if time.monotonic() >= self._year_bounds_due:
+            try:
+                self._keep_year_bounds(await self.aget_year_range(raise_errors=True))
+            except Exception:
+                self._keep_year_bounds(None)
+        return self._year_bounds
+
+    async def aget_unique_genres(self, raise_errors: bool = False) -> list[str]:
+        """Async get_unique_genres."""
+        async def _fetch():
+            df = await self._aquery_backend("get_unique_genres")
+            return df["genre"].to_list() if len(df) > 0 else []
+
+        return await self._aor_fallback("Error fetching unique genres", [], raise_errors, self._acache_get_or_set("get_unique_genres", SCD_TTL, _fetch))
+
+    async def aget_genre_trends(self, year_range: tuple[int, int], selected_genres: list[str], raise_errors: bool = False) -> pl.DataFrame:
+        """Async get_genre_trends."""
+        df = self._query_memory_store(self.aggregates, "get_genre_trends", year_range, selected_genres)
+        if df is not None:
+            return df
+
+        _fetch = lambda year_range, selected_genres: self._aquery_backend("get_genre_trends", year_range, selected_genres)
+        return await self._aor_fallback(
+            "Error loading genre trends", pl.DataFrame(), raise_errors,
+            self._acache_get_or_set("get_genre_trends", FCD_TTL, _fetch, year_range, selected_genres)
+        )
+
+    async def aget_runtime_distribution(self, runtime_range: tuple[int, int], raise_errors: bool = False) -> pl.DataFrame:
+        """Async get_runtime_distribution."""
+        df = self._query_memory_store(self.aggregates, "get_runtime_distribution", runtime_range)
+        if df is not None:
+            return df
+
+        _fetch = lambda runtime_range: self._aquery_backend("get_runtime_distribution", runtime_range)
+        return await self._aor_fallback(
+            "Error loading runtime distribution", pl.DataFrame(), raise_errors,
+            self._acache_get_or_set("get_runtime_distribution", FCD_TTL, _fetch, runtime_range)
+        )
+
+    async def aget_yearly_trends(self, year_range: tuple[int, int], raise_errors: bool = False) -> pl.DataFrame:
+        """Async get_yearly_trends."""
+        df = self._query_memory_store(self.aggregates, "get_yearly_trends", year_range)
+        if df is not None:
+            return df
+
+        _fetch = lambda year_range: self._aquery_backend("get_yearly_trends", year_range)
+        return await self._aor_fallback(
+            "Error loading yearly trends", pl.DataFrame(), raise_errors,
+            self._acache_get_or_set("get_yearly_trends", FCD_TTL, _fetch, year_range)
+        )
+
+    async def aget_dashboard_bundle(self, filters: dict, charts=DASHBOARD_CHARTS, session_id: str | None = None) -> dict[str, pl.DataFrame]:
+        """Async get_dashboard_bundle; the chart queries run concurrently on the event loop."""
+        calls = {
+            "top_movies": lambda: self.aget_top_movies(
+                filters["year_range"], filters["selected_genres"], filters["rating_threshold"], filters["runtime_range"],
+                filters.get("limit", 10), filters.get("min_votes", 100)
+            ),
+            "genre_trends": lambda: self.aget_genre_trends(filters["year_range"], filters["selected_genres"]),
+            "runtime_distribution": lambda: self.aget_runtime_distribution(filters["runtime_range"]),
+            "yearly_trends": lambda: self.aget_yearly_trends(filters["year_range"]),
+        }
+        async def _fetch(chart):
+            with self.job_tracker.track(session_id, chart):
+                return await calls[chart]()
+
+        charts = list(charts)
+        results = await asyncio.gather(*(_fetch(chart) for chart in charts), return_exceptions=True)
+        frames = {}
+        for chart, result in zip(charts, results):
+            if isinstance(result, QueryCancelledError):
+                logging.info(f"Dropping {chart} from bundle, superseded by a newer request")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                frames[chart] = result
+        return frames
@@ -0,0 +1,60 @@
+import logging
+from utils import metrics
+from utils.sharded_lru_cache import ShardedLRUCache
+
+FIGURE_CACHE_LOOKUPS = metrics.counter("imdb_figure_cache_lookups_total", "Chart figures requested by the render callbacks, by outcome (hit, miss)", ("chart", "result"))
+
+class FigureCache:
+    """
+    Rendered chart figures, kept as plotly JSON dicts per chart, filter state and data version.
+
+    Renders of the same result (its handle's cache key and version), e.g. going back to
+    earlier filters or another session viewing the same ones, reuse the figure instead of
+    loading the data and building it again. Dash still encodes the returned figure for the
+    response. The figures have their own byte budget, so they never evict query results.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 ** 2, timeout: int = 300, shards: int = 4):
+        """
+        Args:
+            max_bytes (int): Total estimated size of the figures kept
+            timeout (int): Seconds a figure is kept
+            shards (int): Independently locked partitions of the cache
+        """
+        self._cache = ShardedLRUCache(max_bytes=max_bytes, shards=shards, default_timeout=timeout)
+
+    @staticmethod
+    def _key(chart: str, handle: dict) -> str:
+        return f"{chart}:{handle['cache_key']}:{handle['version']}"
+
+    def get_or_build(self, chart: str, handle: dict, build) -> dict:
+        """
+        Return the figure of a chart's result, building and caching it on a miss.
+
+        Args:
+            chart (str): Chart name
+            handle (dict): Result store handle of the chart's data (cache key and data version)
+            build (callable): Builds the figure when it isn't cached
+
+        Returns:
+            dict: The figure's plotly JSON dict, shared with later hits (not to be modified)
+        """
+        key = self._key(chart, handle)
+        figure = self._cache.get(key)
+        if figure is not None:
+            FIGURE_CACHE_LOOKUPS.inc(chart, "hit")
+            return figure
+
+        FIGURE_CACHE_LOOKUPS.inc(chart, "miss")
+        figure = build().to_plotly_json()
+        try:
+            self._cache.set(key, figure)
+        except Exception as e:
+            logging.warning(f"Could not cache {chart.replace('_', ' ')} figure: {e}")
+        return figure
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from config import MIN_RATING, MAX_RATING, RATING_STEP, RUNTIME_STEP
+from utils.cache import create_cache_key
+
+def _quantize(value, step) -> int | float:
+    """Round a value to the nearest multiple of a slider step."""
+    steps = round(float(value) / step)
+    if float(step).is_integer():
+        return int(steps * step)
+    return round(steps * step, 10)  # drop float noise like 7.000000000001
+
+def _clamp(value_range: tuple, bounds: tuple) -> tuple:
+    """Clamp a range to bounds; ranges entirely outside them are kept as they are (they match nothing either way)."""
+    low, high = bounds
+    if value_range[1] < low or value_range[0] > high:
+        return value_range
+    return (max(value_range[0], low), min(value_range[1], high))
+
+def canonical_years(year_range, year_bounds: tuple[int, int] | None = None) -> tuple[int, int] | None:
+    """Integer years, clamped to the release years available in the data when they are known."""
+    if not year_range:
+        return None
+    years = (int(year_range[0]), int(year_range[1]))
+    return _clamp(years, year_bounds) if year_bounds else years
+
+def canonical_genres(selected_genres) -> list[str]:
+    """Deduplicated, sorted genres, so click order doesn't matter."""
+    return sorted(set(selected_genres or []))
+
+def canonical_ratings(rating_range) -> tuple[float, float] | None:
+    if not rating_range:
+        return None
+    ratings = (float(_quantize(rating_range[0], RATING_STEP)), float(_quantize(rating_range[1], RATING_STEP)))
+    return _clamp(ratings, (float(MIN_RATING), float(MAX_RATING)))
+
+def canonical_runtimes(runtime_range) -> tuple[int, int] | None:
+    if not runtime_range:
+        return None
+    return (_quantize(runtime_range[0], RUNTIME_STEP), _quantize(runtime_range[1], RUNTIME_STEP))
+
+# Canonical form of the positional arguments of the DataService methods taking filters
+CANONICAL_ARGS = {
+    "get_top_movies": (canonical_years, canonical_genres, canonical_ratings, canonical_runtimes, int, int),
+    "get_genre_trends": (canonical_years, canonical_genres),
+    "get_runtime_distribution": (canonical_runtimes,),
+    "get_yearly_trends": (canonical_years,),
+}
+
+def takes_years(method_name: str) -> bool:
+    """Whether a DataService method filters on release years."""
+    return canonical_years in CANONICAL_ARGS.get(method_name, ())
+
+def canonical_args(method_name: str, args: tuple, year_bounds: tuple[int, int] | None = None) -> tuple:
+    """
+    Normalize the filter arguments of a DataService method, so equivalent filters share cache keys.
+
+    Args:
+        method_name (str): DataService method
+        args (tuple): Its positional arguments
+        year_bounds (tuple): Release years available in the data, years are clamped to them
+
+    Returns:
+        tuple: Canonical arguments
+    """
+    normalizers = CANONICAL_ARGS.get(method_name)
+    if not normalizers:
+        return args
+    canonical = tuple(
+        canonical_years(arg, year_bounds) if normalize is canonical_years else normalize(arg)
+        for normalize, arg in zip(normalizers, args)
+    )
+    return canonical + args[len(normalizers):]
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """Canonical dashboard filter state, built from the sidebar inputs."""
+    year_range: tuple[int, int] | None
+    genres: tuple[str, ...]
+    rating_range: tuple[float, float] | None
+    runtime_range: tuple[int, int] | None
+
+    @classmethod
+    def from_inputs(cls, year_range=None, selected_genres=None, rating_range=None, runtime_range=None, year_bounds: tuple[int, int] | None = None) -> "FilterSpec":
+        """
+        Build the canonical filter state of the sidebar inputs.
+
+        Args:
+            year_range (tuple): Validated (start, end) release years
+            selected_genres (list): Selected genres in click order
+            rating_range (list): Rating slider value
+            runtime_range (list): Runtime slider value
+            year_bounds (tuple): Release years available in the data (from DataService.year_bounds)
+
+        Returns:
+            FilterSpec: Filter state with sorted genres, ranges quantized to the slider steps
+            and clamped to the data bounds
+        """
+        return cls(
+            canonical_years(year_range, year_bounds),
+            tuple(canonical_genres(selected_genres)),
+            canonical_ratings(rating_range),
+            canonical_runtimes(runtime_range),
+        )
+
+    def cache_key(self, *fields: str) -> str:
+        """Cache key of the given fields, e.g. the filters a chart depends on."""
+        return create_cache_key(*(getattr(self, field) for field in fields))
@@ -0,0 +1,33 @@
+import polars as pl
+
+def top_movies_filter(year_range: tuple[int, int], selected_genres: list[str], rating_threshold: tuple[float, float], runtime_range: tuple[int, int] | None, min_votes: int) -> pl.Expr:
+    """Build the Polars filter expression equivalent to the top movies WHERE clause."""
+    expr = (
+        pl.col("release_year").is_between(year_range[0], year_range[1])
+        & pl.col("average_rating").is_between(rating_threshold[0], rating_threshold[1])
+        & (pl.col("total_votes") >= min_votes)
+    )
+    if selected_genres:
+        expr = expr & (
+            pl.col("genres").str.split(",")
+            .list.eval(pl.element().str.strip_chars().is_in(selected_genres))
+            .list.any()
+        )
+    if runtime_range:
+        expr = expr & pl.col("runtime_minutes").is_between(runtime_range[0], runtime_range[1])
+    return expr
+
+def genre_trends_filter(year_range: tuple[int, int], selected_genres: list[str]) -> pl.Expr:
+    """Build the Polars filter expression equivalent to the genre trends WHERE clause."""
+    expr = pl.col("release_year").is_between(year_range[0], year_range[1])
+    if selected_genres:
+        expr = expr & pl.col("genre").is_in(selected_genres)
+    return expr
+
+def runtime_distribution_filter(runtime_range: tuple[int, int]) -> pl.Expr:
+    """Build the Polars filter expression equivalent to the runtime distribution WHERE clause."""
+    return (pl.col("min_runtime") >= runtime_range[0]) & (pl.col("max_runtime") <= runtime_range[1])
+
+def yearly_trends_filter(year_range: tuple[int, int]) -> pl.Expr:
+    """Build the Polars filter expression equivalent to the yearly trends WHERE clause."""
+    return pl.col("release_year").is_between(year_range[0], year_range[1])
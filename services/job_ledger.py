@@ -0,0 +1,104 @@
+import json
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+SUMMARY_METRICS = ("total_bytes_billed", "total_bytes_processed", "slot_millis", "run_seconds")
+
+def _int(value) -> int | None:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+def _seconds_between(start, end) -> float | None:
+    if isinstance(start, datetime) and isinstance(end, datetime):
+        return (end - start).total_seconds()
+    return None
+
+class JobLedger:
+    """
+    Statistics of the BigQuery jobs run by the app: bytes processed and billed,
+    slot time, cache hits and queue/run times, with the query fingerprint and the
+    DataService method that ran them.
+
+    The most recent entries are kept in memory; all entries can also be appended
+    to a JSON lines file.
+    """
+
+    def __init__(self, max_entries: int = 1000, path: str | None = None):
+        """
+        Args:
+            max_entries (int): Number of most recent jobs kept in memory
+            path (str): File the jobs are also appended to, None to keep them in memory only
+        """
+        self.path = path
+        self._entries = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+        self._file_lock = threading.Lock()
+
+    def record(self, method: str, fingerprint: str, job, rows: int | None = None) -> dict:
+        """Record the statistics of a finished query job."""
+        entry = {
+            "timestamp": time.time(),
+            "method": method,
+            "fingerprint": fingerprint,
+            "job_id": job.job_id if isinstance(job.job_id, str) else None,
+            "cache_hit": job.cache_hit if isinstance(job.cache_hit, bool) else None,
+            "total_bytes_processed": _int(job.total_bytes_processed),
+            "total_bytes_billed": _int(job.total_bytes_billed),
+            "slot_millis": _int(job.slot_millis),
+            "queue_seconds": _seconds_between(job.created, job.started),
+            "run_seconds": _seconds_between(job.started, job.ended),
+            "rows": rows,
+        }
+        with self._lock:
+            self._entries.append(entry)
+        if self.path:
+            try:
+                with self._file_lock, open(self.path, "a") as f:
+                    f.write(json.dumps(entry) + "\n")
+            except OSError as e:
+                logging.warning(f"Could not write job ledger: {e}")
+        return entry
+
+    def entries(self) -> list[dict]:
+        """Return the jobs kept in memory, oldest first."""
+        with self._lock:
+            return list(self._entries)
+
+    def summary(self, top_n: int = 10, by: str = "total_bytes_billed") -> list[dict]:
+        """
+        Aggregate the jobs kept in memory per query shape.
+
+        Args:
+            top_n (int): Number of query shapes returned
+            by (str): Total the shapes are ranked by, one of SUMMARY_METRICS
+
+        Returns:
+            list[dict]: Method, fingerprint, job and cache hit counts, and totals and
+            averages of the job statistics, most expensive shape first
+        """
+        if by not in SUMMARY_METRICS:
+            raise ValueError(f"Unknown summary metric '{by}', expected one of {SUMMARY_METRICS}")
+
+        shapes = {}
+        for entry in self.entries():
+            shape = shapes.setdefault((entry["method"], entry["fingerprint"]), {
+                "method": entry["method"],
+                "fingerprint": entry["fingerprint"],
+                "jobs": 0,
+                "cache_hits": 0,
+                "queue_seconds": 0.0,
+                **{metric: 0 for metric in SUMMARY_METRICS},
+            })
+            shape["jobs"] += 1
+            shape["cache_hits"] += bool(entry["cache_hit"])
+            shape["queue_seconds"] += entry["queue_seconds"] or 0.0
+            for metric in SUMMARY_METRICS:
+                shape[metric] += entry[metric] or 0
+
+        for shape in shapes.values():
+            shape["cache_hit_ratio"] = shape["cache_hits"] / shape["jobs"]
+            shape["avg_queue_seconds"] = shape["queue_seconds"] / shape["jobs"]
+            shape["avg_run_seconds"] = shape["run_seconds"] / shape["jobs"]
+        return sorted(shapes.values(), key=lambda shape: shape[by], reverse=True)[:top_n]
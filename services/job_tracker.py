@@ -0,0 +1,96 @@
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+class QueryCancelledError(BaseException):
+    """
+    Raised when a query is cancelled because a newer request for the same session and chart arrived.
+
+    Like asyncio.CancelledError it derives from BaseException, so the get_* error handlers
+    don't turn it into an empty result that would be cached.
+    """
+
+def _cancel_job(job) -> None:
+    """Cancel a BigQuery job, ignoring jobs that already finished or can't be cancelled."""
+    try:
+        job.cancel()
+        logging.info(f"Cancelled superseded query job {getattr(job, 'job_id', '')}")
+    except Exception as e:
+        logging.warning(f"Could not cancel superseded query job: {e}")
+
+class JobScope:
+    """BigQuery jobs running on behalf of one request of a session's chart."""
+
+    def __init__(self):
+        self.superseded = False
+        self._jobs = set()
+        self._lock = threading.Lock()
+
+    def attach(self, job) -> bool:
+        """Track a submitted job; a job submitted after the scope was superseded is cancelled at once."""
+        with self._lock:
+            if not self.superseded:
+                self._jobs.add(job)
+                return True
+        _cancel_job(job)
+        return False
+
+    def detach(self, job) -> None:
+        """Stop tracking a finished job."""
+        with self._lock:
+            self._jobs.discard(job)
+
+    def supersede(self) -> None:
+        """Mark the request as superseded and cancel its running jobs."""
+        with self._lock:
+            self.superseded = True
+            jobs, self._jobs = self._jobs, set()
+        for job in jobs:
+            _cancel_job(job)
+
+_current_scope: ContextVar[JobScope | None] = ContextVar("job_scope", default=None)
+
+def current_scope() -> JobScope | None:
+    """Return the scope of the request running in the current context, if it is tracked."""
+    return _current_scope.get()
+
+class JobTracker:
+    """
+    Tracks the latest request per session and chart.
+
+    Starting a request supersedes the previous request of the same session and chart,
+    cancelling its BigQuery jobs so only the last filter state of a slider drag is queried.
+    """
+
+    def __init__(self):
+        self._scopes: dict[tuple[str, str], JobScope] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, session_id: str | None, chart: str):
+        """
+        Run the queries of the block as the latest request of a session's chart.
+
+        Requests without a session ID are not tracked and never superseded.
+        """
+        if session_id is None:
+            yield None
+            return
+
+        key = (session_id, chart)
+        scope = JobScope()
+        with self._lock:
+            previous = self._scopes.get(key)
+            self._scopes[key] = scope
+        if previous is not None:
+            previous.supersede()
+
+        token = _current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _current_scope.reset(token)
+            with self._lock:
+                if self._scopes.get(key) is scope:
+                    del self._scopes[key]
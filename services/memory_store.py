@@ -0,0 +1,56 @@
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+
+RETRY_INTERVAL = 60  # Seconds to wait before retrying a failed load
+
+class MemoryStore(ABC):
+    """
+    Base class for data structures built from warehouse tables and kept in memory.
+
+    The state is rebuilt once per refresh interval by a single caller while the
+    other callers keep using the previous state.
+    """
+
+    def __init__(self, load_table, refresh_interval: int):
+        """
+        Args:
+            load_table (callable): Function (table_name, columns) -> pl.DataFrame loading a whole table
+            refresh_interval (int): Seconds before the state is rebuilt
+        """
+        self._load_table = load_table
+        self.refresh_interval = refresh_interval
+        self._state = None
+        self.generation = 0  # Number of states built so far
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _build(self):
+        """Load the source tables and build a new state."""
+
+    def refresh(self):
+        """Build a new state and swap it in at once."""
+        self._state = self._build()
+        self.generation += 1
+
+    def _get_state(self):
+        """Return the current state, rebuilding it when the refresh interval has passed."""
+        if time.monotonic() >= self._next_refresh:
+            # Only one caller rebuilds; the rest keep using the current state if there is one
+            if self._lock.acquire(blocking=self._state is None):
+                try:
+                    if time.monotonic() >= self._next_refresh:
+                        try:
+                            self.refresh()
+                            self._next_refresh = time.monotonic() + self.refresh_interval
+                        except Exception as e:
+                            logging.error(f"Error loading {self.__class__.__name__}: {e}")
+                            self._next_refresh = time.monotonic() + RETRY_INTERVAL
+                finally:
+                    self._lock.release()
+
+        if self._state is None:
+            raise RuntimeError(f"{self.__class__.__name__} is not loaded")
+        return self._state
@@ -0,0 +1,86 @@
+import os
+import polars as pl
+from services.query_backend import QueryBackend
+from services.filters import top_movies_filter, genre_trends_filter, runtime_distribution_filter, yearly_trends_filter
+
+class ParquetBackend(QueryBackend):
+    """Query backend that answers queries locally from Parquet snapshots using Polars lazy scans."""
+
+    def __init__(self, data_dir: str, table_names):
+        """
+        Args:
+            data_dir (str): Directory containing one <table_name>.parquet snapshot per table
+            table_names (Iterable[str]): Names of the snapshotted tables (keys of TABLES_IDS)
+        """
+        self.data_dir = data_dir
+        self.paths = {table_name: os.path.join(data_dir, f"{table_name}.parquet") for table_name in table_names}
+
+    def _scan(self, table_name: str) -> pl.LazyFrame:
+        """Lazily scan a table snapshot, failing fast if it has not been exported."""
+        path = self.paths[table_name]
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Parquet snapshot not found for table '{table_name}': {path}")
+        return pl.scan_parquet(path)
+
+    def get_top_movies(self, year_range: tuple[int, int], selected_genres: list[str], rating_threshold: tuple[float, float], runtime_range: tuple[int, int] | None, limit: int, min_votes: int) -> pl.DataFrame:
+        lf = self._scan('movies_details').filter(
+            top_movies_filter(year_range, selected_genres, rating_threshold, runtime_range, min_votes)
+        )
+        return (
+            lf.sort(["average_rating", "total_votes"], descending=True, nulls_last=True)
+            .head(limit)
+            .select(
+                "movie_title",
+                "release_year",
+                "genres",
+                "runtime_minutes",
+                pl.when(pl.col("is_adult") == 1).then(pl.lit("Yes")).otherwise(pl.lit("No")).alias("is_adult"),
+                "average_rating",
+                "total_votes",
+            )
+            .collect()
+        )
+
+    def get_year_range(self) -> pl.DataFrame:
+        return (
+            self._scan('movies_details')
+            .filter(pl.col("average_rating").is_not_null())
+            .select(
+                pl.col("release_year").min().alias("min_year"),
+                pl.col("release_year").max().alias("max_year"),
+            )
+            .collect()
+        )
+
+    def get_unique_genres(self) -> pl.DataFrame:
+        return self._scan('year_genre_aggregates').select("genre").unique().sort("genre").collect()
+
+    def get_genre_trends(self, year_range: tuple[int, int], selected_genres: list[str]) -> pl.DataFrame:
+        return (
+            self._scan('year_genre_aggregates')
+            .filter(genre_trends_filter(year_range, selected_genres))
+            .select("release_year", "genre", "total_movies", "average_rating", "total_votes")
+            .sort(["release_year", "genre"])
+            .collect()
+        )
+
+    def get_runtime_distribution(self, runtime_range: tuple[int, int]) -> pl.DataFrame:
+        return (
+            self._scan('runtime_distribution')
+            .filter(runtime_distribution_filter(runtime_range))
+            .select("runtime_bin", "total_movies", "average_rating", "min_runtime", "max_runtime")
+            .sort("min_runtime")
+            .collect()
+        )
+
+    def get_yearly_trends(self, year_range: tuple[int, int]) -> pl.DataFrame:
+        return (
+            self._scan('yearly_aggregates')
+            .filter(yearly_trends_filter(year_range))
+            .select("release_year", "total_movies", "average_rating")
+            .sort("release_year")
+            .collect()
+        )
+
+    def load_table(self, table_name: str, columns: list[str]) -> pl.DataFrame:
+        return self._scan(table_name).select(columns).collect()
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+import polars as pl
+
+class QueryBackend(ABC):
+    """
+    Interface for the engines that answer DataService queries.
+
+    Every method returns the raw result as a Polars DataFrame; DataService is
+    responsible for caching, post-processing and error fallbacks.
+    """
+
+    @abstractmethod
+    def get_top_movies(self, year_range: tuple[int, int], selected_genres: list[str], rating_threshold: tuple[float, float], runtime_range: tuple[int, int] | None, limit: int, min_votes: int) -> pl.DataFrame:
+        """Get top movies ordered by average rating and total votes (descending)."""
+
+    @abstractmethod
+    def get_year_range(self) -> pl.DataFrame:
+        """Get a single row with the min_year and max_year of rated movies."""
+
+    @abstractmethod
+    def get_unique_genres(self) -> pl.DataFrame:
+        """Get the distinct genre values ordered alphabetically."""
+
+    @abstractmethod
+    def get_genre_trends(self, year_range: tuple[int, int], selected_genres: list[str]) -> pl.DataFrame:
+        """Get year/genre aggregates ordered by release_year and genre."""
+
+    @abstractmethod
+    def get_runtime_distribution(self, runtime_range: tuple[int, int]) -> pl.DataFrame:
+        """Get the runtime bins fully contained in the runtime range, ordered by min_runtime."""
+
+    @abstractmethod
+    def get_yearly_trends(self, year_range: tuple[int, int]) -> pl.DataFrame:
+        """Get yearly aggregates ordered by release_year."""
+
+    @abstractmethod
+    def load_table(self, table_name: str, columns: list[str]) -> pl.DataFrame:
+        """Load the given columns of a whole table."""
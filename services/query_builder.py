@@ -0,0 +1,143 @@
+import hashlib
+from dataclasses import dataclass, field
+from google.cloud import bigquery
+
+_SCALAR_TYPES = ((bool, "BOOL"), (int, "INT64"), (float, "FLOAT64"), (str, "STRING"))
+
+def _bigquery_type(value) -> str:
+    """Map a Python value to the BigQuery type of its query parameter."""
+    for python_type, bigquery_type in _SCALAR_TYPES:
+        if isinstance(value, python_type):
+            return bigquery_type
+    raise TypeError(f"Unsupported query parameter type: {type(value).__name__}")
+
+@dataclass(frozen=True)
+class Query:
+    """
+    A parameterized BigQuery statement.
+
+    All filter values are passed as parameters, so the SQL text only depends on the
+    shape of the query (which filters are applied) and is identical across values.
+    """
+    sql: str
+    params: dict = field(default_factory=dict)
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of the query shape, for grouping identical statements."""
+        return hashlib.sha1(" ".join(self.sql.split()).encode()).hexdigest()[:16]
+
+    def query_parameters(self) -> list:
+        """Build the BigQuery query parameters."""
+        parameters = []
+        for name, value in sorted(self.params.items()):
+            if isinstance(value, (list, tuple)):
+                element_type = _bigquery_type(value[0]) if value else "STRING"
+                parameters.append(bigquery.ArrayQueryParameter(name, element_type, list(value)))
+            else:
+                parameters.append(bigquery.ScalarQueryParameter(name, _bigquery_type(value), value))
+        return parameters
+
+def _genres(selected_genres) -> list[str]:
+    """Canonical genre list: deduplicated and sorted, so click order doesn't change the query."""
+    return sorted(set(selected_genres or []))
+
+def top_movies_query(table_id: str, year_range: tuple[int, int], selected_genres: list[str], rating_threshold: tuple[float, float], runtime_range: tuple[int, int] | None, limit: int, min_votes: int) -> Query:
+    params = {
+        "year_min": int(year_range[0]),
+        "year_max": int(year_range[1]),
+        "rating_min": float(rating_threshold[0]),
+        "rating_max": float(rating_threshold[1]),
+        "min_votes": int(min_votes),
+        "limit": int(limit),
+    }
+    genre_filter = ""
+    if selected_genres:
+        params["genres"] = _genres(selected_genres)
+        genre_filter = "AND EXISTS (SELECT 1 FROM UNNEST(SPLIT(genres, ',')) AS genre WHERE TRIM(genre) IN UNNEST(@genres))"
+
+    runtime_filter = ""
+    if runtime_range:
+        params["runtime_min"] = int(runtime_range[0])
+        params["runtime_max"] = int(runtime_range[1])
+        runtime_filter = "AND runtime_minutes BETWEEN @runtime_min AND @runtime_max"
+
+    sql = f"""
+    SELECT
+        movie_title,
+        release_year,
+        genres,
+        runtime_minutes,
+        CASE
+            WHEN is_adult = 1 THEN 'Yes' ELSE 'No'
+        END as is_adult,
+        average_rating,
+        total_votes
+    FROM `{table_id}`
+    WHERE release_year BETWEEN @year_min AND @year_max
+    AND average_rating BETWEEN @rating_min AND @rating_max
+    AND total_votes >= @min_votes
+    {genre_filter}
+    {runtime_filter}
+    ORDER BY average_rating DESC, total_votes DESC
+    LIMIT @limit
+    """
+    return Query(sql, params)
+
+def year_range_query(table_id: str) -> Query:
+    sql = f"""
+    SELECT MIN(release_year) AS min_year, MAX(release_year) AS max_year
+    FROM `{table_id}`
+    WHERE average_rating IS NOT NULL
+    """
+    return Query(sql)
+
+def unique_genres_query(table_id: str) -> Query:
+    sql = f"""
+    SELECT DISTINCT genre
+    FROM `{table_id}`
+    ORDER BY genre
+    """
+    return Query(sql)
+
+def genre_trends_query(table_id: str, year_range: tuple[int, int], selected_genres: list[str]) -> Query:
+    params = {"year_min": int(year_range[0]), "year_max": int(year_range[1])}
+    genre_filter = ""
+    if selected_genres:
+        params["genres"] = _genres(selected_genres)
+        genre_filter = "AND genre IN UNNEST(@genres)"
+
+    sql = f"""
+    SELECT release_year, genre, total_movies, average_rating, total_votes
+    FROM `{table_id}`
+    WHERE release_year BETWEEN @year_min AND @year_max
+    {genre_filter}
+    ORDER BY release_year, genre
+    """
+    return Query(sql, params)
+
+def runtime_distribution_query(table_id: str, runtime_range: tuple[int, int]) -> Query:
+    sql = f"""
+    SELECT runtime_bin, total_movies, average_rating, min_runtime, max_runtime
+    FROM `{table_id}`
+    WHERE min_runtime >= @runtime_min AND max_runtime <= @runtime_max
+    ORDER BY min_runtime
+    """
+    return Query(sql, {"runtime_min": int(runtime_range[0]), "runtime_max": int(runtime_range[1])})
+
+def yearly_trends_query(table_id: str, year_range: tuple[int, int]) -> Query:
+    sql = f"""
+    SELECT release_year, total_movies, average_rating
+    FROM `{table_id}`
+    WHERE release_year BETWEEN @year_min AND @year_max
+    ORDER BY release_year
+    """
+    return Query(sql, {"year_min": int(year_range[0]), "year_max": int(year_range[1])})
+
+def table_query(table_id: str, columns: list[str] | None = None) -> Query:
+    """Select whole columns of a table (all columns by default)."""
+    sql = f"""
+    SELECT {', '.join(columns) if columns else '*'}
+    FROM `{table_id}`
+    """
+    return Query(sql)
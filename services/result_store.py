@@ -0,0 +1,77 @@
+import hashlib
+import logging
+import polars as pl
+from utils import metrics
+from utils.sharded_lru_cache import ShardedLRUCache
+
+RESULT_STORE_LOOKUPS = metrics.counter("imdb_result_store_lookups_total", "Chart results read by the render callbacks, by outcome (hit, miss)", ("result",))
+
+def result_version(cache_key: str, generation: int = 0) -> str:
+    """
+    Version of a chart result, from its filters' cache key and the data generation it was fetched in.
+
+    Fetching the same filters again within a generation gives the same version, so going
+    back to earlier filters reuses their rendered figures. Unlike a hash of the rows, it
+    costs the same for any size of result.
+    """
+    return hashlib.sha1(f"{cache_key}:{generation}".encode()).hexdigest()[:12]
+
+class ResultStore:
+    """
+    Server-side store of the chart DataFrames, so the dashboard's dcc.Stores only hold a
+    small handle (cache key and version) instead of the serialized data.
+
+    Frames are kept by reference in a byte-bounded in-process cache of their own, so they
+    share memory with the DataService's cached results instead of being serialized into
+    the app cache a second time and counted against its budget. A handle whose frame was
+    evicted, expired or stored by another worker process reads as None and the chart's
+    data has to be fetched again.
+    """
+
+    def __init__(self, max_bytes: int = 128 * 1024 ** 2, timeout: int = 3600, shards: int = 4):
+        """
+        Args:
+            max_bytes (int): Total estimated size of the frames kept
+            timeout (int): Seconds a frame is kept
+            shards (int): Independently locked partitions of the cache
+        """
+        self.cache = ShardedLRUCache(max_bytes=max_bytes, shards=shards, default_timeout=timeout)
+
+    @staticmethod
+    def _key(handle: dict) -> str:
+        return f"{handle['cache_key']}:{handle['version']}"
+
+    def put(self, cache_key: str, df: pl.DataFrame, generation: int = 0, version: str | None = None) -> dict:
+        """
+        Store a chart's DataFrame.
+
+        Args:
+            cache_key (str): Cache key of the filters the data was fetched for
+            generation (int): DataService.data_generation from before the data was fetched
+            version (str): Version of the handle to store the frame under, result_version() of the generation by default
+
+        Returns:
+            dict: Handle to read the frame back with get()
+        """
+        handle = {"cache_key": cache_key, "version": version or result_version(cache_key, generation)}
+        try:
+            if not self.cache.set(self._key(handle), df):
+                logging.warning(f"Result {cache_key} was not kept by the result store")
+        except Exception as e:
+            logging.error(f"Error storing result {cache_key}: {e}")
+        return handle
+
+    def get(self, handle: dict | None) -> pl.DataFrame | None:
+        """Return the DataFrame of a handle, or None if it isn't stored (anymore)."""
+        if not handle or not handle.get("version"):
+            return None
+        try:
+            df = self.cache.get(self._key(handle))
+        except Exception as e:
+            logging.error(f"Error reading result {handle['cache_key']}: {e}")
+            df = None
+        RESULT_STORE_LOOKUPS.inc("hit" if df is not None else "miss")
+        return df
+
+    def stats(self) -> dict:
+        return self.cache.stats()
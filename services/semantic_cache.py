@@ -0,0 +1,179 @@
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+import polars as pl
+from services.filters import top_movies_filter, genre_trends_filter, runtime_distribution_filter, yearly_trends_filter
+
+MAX_ENTRIES_PER_METHOD = 256
+
+def _range_contains(outer, inner) -> bool:
+    """Check whether the closed range inner lies within outer (an empty inner range always does)."""
+    return inner[0] > inner[1] or (outer[0] <= inner[0] and inner[1] <= outer[1])
+
+def _genres_contain(outer: frozenset, inner: frozenset) -> bool:
+    """Check whether an 'any of these genres' filter is at least as wide as another (empty means all genres)."""
+    return not outer or (bool(inner) and inner <= outer)
+
+@dataclass(frozen=True)
+class TopMoviesPredicate:
+    year_range: tuple
+    genres: frozenset
+    rating_threshold: tuple
+    runtime_range: tuple | None
+    limit: int
+    min_votes: int
+
+    @classmethod
+    def from_args(cls, year_range, selected_genres, rating_threshold, runtime_range, limit, min_votes):
+        return cls(
+            tuple(year_range), frozenset(selected_genres or []), tuple(rating_threshold),
+            tuple(runtime_range) if runtime_range else None, limit, min_votes
+        )
+
+    def contains(self, other: "TopMoviesPredicate") -> bool:
+        """Check whether every row matching other also matches this predicate (ignoring the limit)."""
+        runtime_contained = self.runtime_range is None or (
+            other.runtime_range is not None and _range_contains(self.runtime_range, other.runtime_range)
+        )
+        return (
+            _range_contains(self.year_range, other.year_range)
+            and _range_contains(self.rating_threshold, other.rating_threshold)
+            and runtime_contained
+            and other.min_votes >= self.min_votes
+            and _genres_contain(self.genres, other.genres)
+        )
+
+    def answer(self, df: pl.DataFrame, other: "TopMoviesPredicate") -> pl.DataFrame | None:
+        """Derive other's top movies from this predicate's cached top movies, if they are enough."""
+        if not self.contains(other):
+            return None
+        matches = df.sort(["average_rating", "total_votes"], descending=True, nulls_last=True).filter(
+            top_movies_filter(other.year_range, list(other.genres), other.rating_threshold, other.runtime_range, other.min_votes)
+        )
+        # The cached rows are the best rows of this predicate, so the ones passing the stricter
+        # filter are also the best rows of other. They answer it if there are at least other.limit
+        # of them, or if the cached result was not truncated by its own limit.
+        if len(matches) < other.limit and len(df) >= self.limit:
+            return None
+        return matches.head(other.limit).sort(by=["average_rating"])  # ascending for horizontal bar chart
+
+@dataclass(frozen=True)
+class GenreTrendsPredicate:
+    year_range: tuple
+    genres: frozenset
+
+    @classmethod
+    def from_args(cls, year_range, selected_genres):
+        return cls(tuple(year_range), frozenset(selected_genres or []))
+
+    def contains(self, other: "GenreTrendsPredicate") -> bool:
+        return _range_contains(self.year_range, other.year_range) and _genres_contain(self.genres, other.genres)
+
+    def answer(self, df: pl.DataFrame, other: "GenreTrendsPredicate") -> pl.DataFrame | None:
+        if not self.contains(other):
+            return None
+        return df.filter(genre_trends_filter(other.year_range, list(other.genres)))
+
+@dataclass(frozen=True)
+class RuntimeDistributionPredicate:
+    runtime_range: tuple
+
+    @classmethod
+    def from_args(cls, runtime_range):
+        return cls(tuple(runtime_range))
+
+    def contains(self, other: "RuntimeDistributionPredicate") -> bool:
+        return _range_contains(self.runtime_range, other.runtime_range)
+
+    def answer(self, df: pl.DataFrame, other: "RuntimeDistributionPredicate") -> pl.DataFrame | None:
+        if not self.contains(other):
+            return None
+        return df.filter(runtime_distribution_filter(other.runtime_range))
+
+@dataclass(frozen=True)
+class YearlyTrendsPredicate:
+    year_range: tuple
+
+    @classmethod
+    def from_args(cls, year_range):
+        return cls(tuple(year_range))
+
+    def contains(self, other: "YearlyTrendsPredicate") -> bool:
+        return _range_contains(self.year_range, other.year_range)
+
+    def answer(self, df: pl.DataFrame, other: "YearlyTrendsPredicate") -> pl.DataFrame | None:
+        if not self.contains(other):
+            return None
+        return df.filter(yearly_trends_filter(other.year_range))
+
+PREDICATES = {
+    "get_top_movies": TopMoviesPredicate,
+    "get_genre_trends": GenreTrendsPredicate,
+    "get_runtime_distribution": RuntimeDistributionPredicate,
+    "get_yearly_trends": YearlyTrendsPredicate,
+}
+
+class SemanticCache:
+    """
+    Index of the filter predicates behind cached DataService results.
+
+    A request whose predicate is contained in the predicate of a cached result
+    is answered by filtering that cached frame locally instead of querying again.
+    """
+
+    def __init__(self, cache, max_entries_per_method: int = MAX_ENTRIES_PER_METHOD):
+        """
+        Args:
+            cache: Cache instance holding the results (get by key)
+            max_entries_per_method (int): Number of most recent predicates remembered per method
+        """
+        self.cache = cache
+        self.max_entries_per_method = max_entries_per_method
+        self._entries: dict[str, OrderedDict] = {method_name: OrderedDict() for method_name in PREDICATES}
+        self._lock = threading.Lock()
+
+    def register(self, method_name: str, args: tuple, cache_key: str, result) -> None:
+        """Remember the predicate behind a result that was just cached under cache_key."""
+        if method_name not in PREDICATES or not isinstance(result, pl.DataFrame) or not result.columns:
+            return
+        predicate = PREDICATES[method_name].from_args(*args)
+        with self._lock:
+            entries = self._entries[method_name]
+            entries[cache_key] = predicate
+            entries.move_to_end(cache_key)
+            while len(entries) > self.max_entries_per_method:
+                entries.popitem(last=False)
+
+    def lookup(self, method_name: str, args: tuple) -> pl.DataFrame | None:
+        """Answer a request from a cached result with a containing predicate, or return None."""
+        if method_name not in PREDICATES:
+            return None
+        predicate = PREDICATES[method_name].from_args(*args)
+        with self._lock:
+            candidates = [(key, cached) for key, cached in reversed(self._entries[method_name].items()) if cached.contains(predicate)]
+
+        for cache_key, cached_predicate in candidates:
+            df = self.cache.get(cache_key)
+            if df is None:
+                self._forget(method_name, cache_key)
+                continue
+            try:
+                result = cached_predicate.answer(df, predicate)
+            except Exception as e:
+                logging.warning(f"Could not derive {method_name} result from cached entry: {e}")
+                continue
+            if result is not None:
+                return result
+        return None
+
+    def _forget(self, method_name: str, cache_key: str) -> None:
+        """Drop a predicate whose cached result has expired or been evicted."""
+        with self._lock:
+            self._entries[method_name].pop(cache_key, None)
+
+    def clear(self) -> None:
+        """Forget all predicates."""
+        with self._lock:
+            for entries in self._entries.values():
+                entries.clear()
@@ -0,0 +1,189 @@
+import heapq
+import logging
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+import numpy as np
+import polars as pl
+from services.memory_store import MemoryStore
+
+MOVIES_COLUMNS = ["movie_title", "release_year", "genres", "runtime_minutes", "is_adult", "average_rating", "total_votes"]
+ROWS_PER_PARTITION = 3000  # Rows a global scan checks in about the time it takes to merge one partition
+INITIAL_CHUNK_SIZE = 256
+
+class Partition(NamedTuple):
+    ranks: np.ndarray  # Ascending global ranks, i.e. sorted by (average_rating DESC, total_votes DESC)
+    rating_min: float
+    rating_max: float
+    votes_max: int
+    runtime_min: float
+    runtime_max: float
+
+class IndexState(NamedTuple):
+    movies: pl.DataFrame  # Result rows ordered by rank
+    neg_ratings: np.ndarray  # Negated ratings by rank (ascending, for binary search)
+    votes: np.ndarray
+    runtimes: np.ndarray  # NaN for unknown runtimes
+    release_years: np.ndarray
+    genre_bits: np.ndarray  # Bitmask of each movie's genres
+    genre_ids: dict[str, int]  # Bit position of each genre (at most 64)
+    years: list[int]  # Sorted years with at least one partition
+    year_partitions: dict[int, list[Partition]]  # One partition per votes tier
+    year_genre_partitions: dict[tuple[int, str], list[Partition]]
+
+def _build_partitions(ranked: pl.DataFrame, keys: list[str]) -> dict:
+    """Group ranked rows into partitions per key and votes tier, with their min/max statistics."""
+    grouped = ranked.group_by(keys + ["votes_tier"]).agg(
+        pl.col("rank").sort(),
+        pl.col("average_rating").min().alias("rating_min"),
+        pl.col("average_rating").max().alias("rating_max"),
+        pl.col("total_votes").max().alias("votes_max"),
+        pl.col("runtime_minutes").min().alias("runtime_min"),
+        pl.col("runtime_minutes").max().alias("runtime_max"),
+    )
+    partitions = {}
+    for row in grouped.iter_rows(named=True):
+        key = tuple(row[k] for k in keys) if len(keys) > 1 else row[keys[0]]
+        partitions.setdefault(key, []).append(Partition(
+            np.asarray(row["rank"], dtype=np.uint32), row["rating_min"], row["rating_max"], row["votes_max"],
+            row["runtime_min"] if row["runtime_min"] is not None else np.nan,
+            row["runtime_max"] if row["runtime_max"] is not None else np.nan,
+        ))
+    return partitions
+
+def _first_matches(rows, limit: int, row_filter) -> np.ndarray:
+    """Return the first limit rows passing row_filter, scanning rows in growing chunks."""
+    found = []
+    count = 0
+    position, size = 0, INITIAL_CHUNK_SIZE
+    while position < len(rows) and count < limit:
+        chunk = rows[position:position + size]
+        if isinstance(chunk, range):
+            chunk = np.arange(chunk.start, chunk.stop)
+        chunk = chunk[row_filter(chunk)]
+        found.append(chunk)
+        count += len(chunk)
+        position += size
+        size *= 2
+    return np.concatenate(found)[:limit] if found else np.empty(0, dtype=np.int64)
+
+class TopMoviesIndex(MemoryStore):
+    """
+    In-memory top-K index over movies_details.
+
+    Movies are ranked once by (average_rating DESC, total_votes DESC) and partitioned
+    by release year and by (release year, genre). A query merges the rank lists of the
+    matching partitions with a heap and stops as soon as limit rows pass the filters.
+    """
+
+    def _build(self) -> IndexState:
+        df = (
+            self._load_table("movies_details", MOVIES_COLUMNS)
+            # Rows without these values can never match the rating, votes or year filters
+            .drop_nulls(["release_year", "average_rating", "total_votes"])
+            .sort(["average_rating", "total_votes"], descending=True)
+            .with_columns(
+                pl.when(pl.col("is_adult") == 1).then(pl.lit("Yes")).otherwise(pl.lit("No")).alias("is_adult")
+            )
+            .select(MOVIES_COLUMNS)
+            .rechunk()
+        )
+        # Partitioning by order of magnitude of votes lets min_votes skip whole partitions
+        ranked = df.with_row_index("rank").with_columns(
+            votes_tier=pl.col("total_votes").clip(1).log10().floor().cast(pl.Int8)
+        )
+        year_partitions = _build_partitions(ranked, ["release_year"])
+        movie_genres = (
+            ranked.with_columns(genre=pl.col("genres").str.split(",").list.eval(pl.element().str.strip_chars()))
+            .explode("genre")
+            .drop_nulls("genre")
+            .unique(["rank", "genre"])
+        )
+        year_genre_partitions = _build_partitions(movie_genres, ["release_year", "genre"])
+
+        genre_ids = {genre: bit for bit, genre in enumerate(sorted(movie_genres["genre"].unique().to_list())[:64])}
+        bit_genres = movie_genres.filter(pl.col("genre").is_in(list(genre_ids)))
+        genre_bits = np.zeros(len(df), dtype=np.uint64)
+        np.bitwise_or.at(
+            genre_bits,
+            bit_genres["rank"].to_numpy(),
+            np.left_shift(np.uint64(1), bit_genres["genre"].replace_strict(genre_ids, return_dtype=pl.UInt64).to_numpy()),
+        )
+        logging.info(f"Built top movies index ({len(df)} movies, {len(year_genre_partitions)} year/genre partitions)")
+
+        return IndexState(
+            movies=df,
+            neg_ratings=-df["average_rating"].to_numpy(),
+            votes=df["total_votes"].to_numpy(),
+            runtimes=df["runtime_minutes"].cast(pl.Float64).fill_null(np.nan).to_numpy(),
+            release_years=df["release_year"].to_numpy(),
+            genre_bits=genre_bits,
+            genre_ids=genre_ids,
+            years=sorted(year_partitions),
+            year_partitions=year_partitions,
+            year_genre_partitions=year_genre_partitions,
+        )
+
+    @staticmethod
+    def _prefer_global_scan(state: IndexState, partitions: list[Partition], limit: int) -> bool:
+        """Estimate whether scanning the global ranking is cheaper than merging the partitions."""
+        partition_rows = sum(len(partition.ranks) for partition in partitions)
+        # A global scan finds limit matches after about limit * total / partition rows
+        return limit * len(state.movies) < partition_rows * len(partitions) * ROWS_PER_PARTITION
+
+    def get_top_movies(self, year_range: tuple[int, int], selected_genres: list[str], rating_threshold: tuple[float, float], runtime_range: tuple[int, int] | None, limit: int, min_votes: int) -> pl.DataFrame:
+        """Get top movies ordered by average rating and total votes (descending)."""
+        state = self._get_state()
+
+        # Ratings don't increase with rank, so the rating threshold is a window of ranks
+        start = int(np.searchsorted(state.neg_ratings, -rating_threshold[1], side="left"))
+        stop = int(np.searchsorted(state.neg_ratings, -rating_threshold[0], side="right"))
+        years = state.years[bisect_left(state.years, year_range[0]):bisect_right(state.years, year_range[1])]
+
+        if selected_genres:
+            genres = set(selected_genres)
+            candidates = [partition for year in years for genre in genres for partition in state.year_genre_partitions.get((year, genre), [])]
+        else:
+            candidates = [partition for year in years for partition in state.year_partitions[year]]
+
+        # Keep the partitions whose statistics allow a match
+        partitions = [
+            partition for partition in candidates
+            if partition.votes_max >= min_votes
+            and partition.rating_max >= rating_threshold[0] and partition.rating_min <= rating_threshold[1]
+            and (not runtime_range or (partition.runtime_min <= runtime_range[1] and partition.runtime_max >= runtime_range[0]))
+        ]
+
+        def row_filter(rows: np.ndarray, check_partition: bool = False) -> np.ndarray:
+            mask = state.votes[rows] >= min_votes
+            if runtime_range:
+                runtimes = state.runtimes[rows]
+                mask &= (runtimes >= runtime_range[0]) & (runtimes <= runtime_range[1])
+            if check_partition:
+                release_years = state.release_years[rows]
+                mask &= (release_years >= year_range[0]) & (release_years <= year_range[1])
+                if selected_genres:
+                    mask &= (state.genre_bits[rows] & genre_mask) != 0
+            return mask
+
+        if limit <= 0 or not partitions:
+            result_ranks = []
+        elif self._prefer_global_scan(state, partitions, limit) and all(genre in state.genre_ids for genre in selected_genres or []):
+            # Wide filters: scan the global ranking, checking year and genres per row
+            genre_mask = np.uint64(sum(1 << state.genre_ids[genre] for genre in set(selected_genres or [])))
+            result_ranks = _first_matches(range(start, stop), limit, lambda rows: row_filter(rows, check_partition=True)).tolist()
+        else:
+            # Narrow filters: take the first matches inside each partition's rank window, then
+            # k-way merge them. Multi-genre movies appear in several year/genre partitions.
+            partition_matches = [
+                _first_matches(partition.ranks[partition.ranks.searchsorted(start):partition.ranks.searchsorted(stop)], limit, row_filter)
+                for partition in partitions
+            ]
+            result_ranks = []
+            for rank in heapq.merge(*(matches.tolist() for matches in partition_matches)):
+                if result_ranks and result_ranks[-1] == rank:
+                    continue
+                result_ranks.append(rank)
+                if len(result_ranks) == limit:
+                    break
+
+        return state.movies[result_ranks] if result_ranks else state.movies.clear()
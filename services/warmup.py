@@ -0,0 +1,180 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, gunicorn doesn't run there
+    fcntl = None
+
+class AccessLog:
+    """
+    Append-only JSON lines log of the dashboard filter states requested by users.
+
+    All gunicorn workers share the file, so appends and compaction take an advisory lock
+    on a `<path>.lock` file next to it.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        """
+        Args:
+            path (str): File the filter states are appended to
+            max_entries (int): Number of most recent entries kept when the log is compacted
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _file_lock(self, blocking: bool = True):
+        """Hold the lock shared by all processes using the log; yields False if not blocking and another holds it."""
+        if fcntl is None:
+            yield True
+            return
+        with open(f"{self.path}.lock", "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def record(self, year_range, selected_genres, rating_range, runtime_range) -> None:
+        """Append a filter state to the log."""
+        entry = json.dumps({
+            "year_range": list(year_range),
+            "genres": list(selected_genres or []),
+            "rating_range": list(rating_range),
+            "runtime_range": list(runtime_range) if runtime_range else None,
+        })
+        try:
+            with self._lock, self._file_lock(), open(self.path, "a") as f:
+                f.write(entry + "\n")
+        except OSError as e:
+            logging.warning(f"Could not write access log: {e}")
+
+    def read(self) -> list[dict]:
+        """Read the most recent entries, skipping malformed lines."""
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path) as f:
+            for line in f.readlines()[-self.max_entries:]:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return entries
+
+    def compact(self) -> bool:
+        """
+        Rewrite the log keeping only the most recent entries.
+
+        Every worker calls this at boot; only one process compacts at a time and the others
+        skip it, while appends wait for the rewritten file.
+
+        Returns:
+            bool: Whether the log was compacted (False if another process is compacting it)
+        """
+        with self._lock, self._file_lock(blocking=False) as locked:
+            if not locked:
+                logging.info("Access log is being compacted by another process, skipping")
+                return False
+            entries = self.read()
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.writelines(json.dumps(entry) + "\n" for entry in entries)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return True
+
+    def most_frequent(self, k: int) -> list[dict]:
+        """Return the k most frequently requested filter states."""
+        counts = Counter(json.dumps(entry, sort_keys=True) for entry in self.read())
+        return [json.loads(entry) for entry, _ in counts.most_common(k)]
+
+class CacheWarmer:
+    """Prefetches DataService results for likely filter states and tracks the progress."""
+
+    def __init__(self, data_service, top_n_movies: int, min_votes: int):
+        """
+        Args:
+            data_service (DataService): Service whose cache is warmed
+            top_n_movies (int): Limit used by the top movies chart
+            min_votes (int): Minimum votes used by the top movies chart
+        """
+        self.data_service = data_service
+        self.top_n_movies = top_n_movies
+        self.min_votes = min_votes
+        self.status = "pending"
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def _tasks(self, filter_states: list[dict]) -> list:
+        """Build the list of DataService calls needed to render the given filter states."""
+        tasks = [(self.data_service.get_year_range,), (self.data_service.get_unique_genres,)]
+        seen = set()
+        for state in filter_states:
+            key = json.dumps(state, sort_keys=True)
+            if key in seen:
+                continue
+            seen.add(key)
+            year_range = tuple(state["year_range"])
+            tasks += [
+                (self.data_service.get_top_movies, year_range, state["genres"], state["rating_range"], state["runtime_range"], self.top_n_movies, self.min_votes),
+                (self.data_service.get_genre_trends, year_range, state["genres"]),
+                (self.data_service.get_runtime_distribution, state["runtime_range"]),
+                (self.data_service.get_yearly_trends, year_range),
+            ]
+        return tasks
+
+    def run(self, filter_states: list[dict]) -> None:
+        """Run the prefetch calls for the given filter states, one after another."""
+        tasks = self._tasks(filter_states)
+        with self._lock:
+            self.status = "running"
+            self.total = len(tasks)
+        logging.info(f"Warming up cache with {len(tasks)} queries for {len(filter_states)} filter states")
+
+        try:
+            for func, *args in tasks:
+                try:
+                    # The get_* methods would otherwise hide failures behind an uncached empty result
+                    func(*args, raise_errors=True)
+                except Exception as e:
+                    logging.warning(f"Warm-up query {getattr(func, '__name__', func)} failed: {e}")
+                    with self._lock:
+                        self.failed += 1
+                with self._lock:
+                    self.completed += 1
+        finally:
+            with self._lock:
+                self.status = "ready"
+        logging.info(f"Cache warm-up finished ({self.failed} failed queries)")
+
+    def start(self, filter_states: list[dict]) -> threading.Thread:
+        """Run the warm-up in a background thread."""
+        thread = threading.Thread(target=self.run, args=(filter_states,), name="cache-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    @property
+    def is_ready(self) -> bool:
+        return self.status == "ready"
+
+    def progress(self) -> dict:
+        """Return the warm-up status and query counts."""
+        with self._lock:
+            return {"status": self.status, "completed": self.completed, "failed": self.failed, "total": self.total}
@@ -4,8 +4,8 @@ from dash import Input, Output, State
 from dash.exceptions import PreventUpdate
 from config import MIN_YEAR, MAX_YEAR
 
-def register_sidebar_callbacks(app, data_service):
-    """Register callbacks for sidebar components"""
+def register_sidebar_callbacks(app, data_service, use_async=False):
+    """Register callbacks for sidebar components (with async data fetching callbacks if use_async)"""
 
     # Callback to toggle navbar on mobile
     @app.callback(
@@ -20,37 +20,63 @@ def register_sidebar_callbacks(app, data_service):
     
     # ========== DATA FETCHING CALLBACKS (Cache in dcc.Store) =========
     
-    @app.callback(
+    year_range_callback = app.callback(
         Output("year-range-cache", "data"),
         [Input("url", "pathname")],
         [State("year-range-cache", "data")]
     )
-    def fetch_year_range(pathname, cached_data):
-        """Fetch year range and cache in local storage."""
-        # If cache exists, don't fetch again
-        if cached_data and cached_data.get("min") and cached_data.get("max"):
-            logging.info("Using cached year range data")
-            raise PreventUpdate
-        
-        logging.info("Fetching year range from database")
-        year_range = data_service.get_year_range()
-        return {"min": year_range[0], "max": year_range[1]}
-
-    @app.callback(
+    genres_callback = app.callback(
         Output("genres-cache", "data"),
         [Input("url", "pathname")],
         [State("genres-cache", "data")]
     )
-    def fetch_genres(pathname, cached_data):
-        """Fetch genres and cache in local storage."""
-        # If cache exists, don't fetch again
-        if cached_data and cached_data.get("genres"):
-            logging.info("Using cached genres data")
-            raise PreventUpdate
-        
-        logging.info("Fetching genres from database")
-        genres = data_service.get_unique_genres()
-        return {"genres": genres}
+
+    if use_async:
+        @year_range_callback
+        async def fetch_year_range(pathname, cached_data):
+            """Fetch year range and cache in local storage."""
+            if cached_data and cached_data.get("min") and cached_data.get("max"):
+                logging.info("Using cached year range data")
+                raise PreventUpdate
+
+            logging.info("Fetching year range from database")
+            year_range = await data_service.aget_year_range()
+            return {"min": year_range[0], "max": year_range[1]}
+
+        @genres_callback
+        async def fetch_genres(pathname, cached_data):
+            """Fetch genres and cache in local storage."""
+            if cached_data and cached_data.get("genres"):
+                logging.info("Using cached genres data")
+                raise PreventUpdate
+
+            logging.info("Fetching genres from database")
+            genres = await data_service.aget_unique_genres()
+            return {"genres": genres}
+    else:
+        @year_range_callback
+        def fetch_year_range(pathname, cached_data):
+            """Fetch year range and cache in local storage."""
+            # If cache exists, don't fetch again
+            if cached_data and cached_data.get("min") and cached_data.get("max"):
+                logging.info("Using cached year range data")
+                raise PreventUpdate
+            
+            logging.info("Fetching year range from database")
+            year_range = data_service.get_year_range()
+            return {"min": year_range[0], "max": year_range[1]}
+
+        @genres_callback
+        def fetch_genres(pathname, cached_data):
+            """Fetch genres and cache in local storage."""
+            # If cache exists, don't fetch again
+            if cached_data and cached_data.get("genres"):
+                logging.info("Using cached genres data")
+                raise PreventUpdate
+            
+            logging.info("Fetching genres from database")
+            genres = data_service.get_unique_genres()
+            return {"genres": genres}
     
     # ========== COMPONENT RENDERING CALLBACKS (Read from dcc.Store) =========
     
@@ -2,7 +2,7 @@ from dash import dcc
 import dash_mantine_components as dmc
 from config import (
     MIN_DATE, MAX_DATE, GENRES, MIN_RATING, MAX_RATING,
-    RUNTIME_MIN, RUNTIME_MAX, PRIMARY_COLOR
+    RUNTIME_MIN, RUNTIME_MAX, RATING_STEP, RUNTIME_STEP, PRIMARY_COLOR
 )
 from components.range_slider import create_range_slider
 from components.multi_select import create_multi_select
@@ -43,7 +43,7 @@ def create_sidebar():
                 min_value=RUNTIME_MIN,
                 max_value=RUNTIME_MAX,
                 title="Runtime Range (min)",
-                step=1,
+                step=RUNTIME_STEP,
                 mark_step=60
             ),
 
@@ -53,7 +53,7 @@ def create_sidebar():
                 min_value=MIN_RATING,
                 max_value=MAX_RATING,
                 title="Rating Range",
-                step=0.1,
+                step=RATING_STEP,
                 mark_step=1
             ),
         ],
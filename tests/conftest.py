@@ -4,3 +4,53 @@ from pathlib import Path
 # Add the App directory to Python path so we can import modules
 app_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(app_dir))
+
+import pytest
+import polars as pl
+
+
+@pytest.fixture
+def sample_tables():
+    """Small in-memory copies of the four warehouse tables."""
+    movies_details = pl.DataFrame({
+        'movie_title': ['The Godfather', 'Citizen Kane', 'Heat', 'Alien', 'Scream', 'Airplane!'],
+        'release_year': [1972, 1941, 1995, 1979, 1996, 1980],
+        'genres': ['Crime,Drama', 'Drama,Mystery', 'Action,Crime,Drama', 'Horror,Sci-Fi', 'Horror, Mystery', 'Comedy'],
+        'runtime_minutes': [175, 119, 170, 117, 111, 88],
+        'is_adult': [0, 0, 0, 0, 1, 0],
+        'average_rating': [9.2, 8.3, 8.3, 8.5, 7.4, None],
+        'total_votes': [2000000, 450000, 700000, 950000, 350000, 250000],
+    })
+    year_genre_aggregates = pl.DataFrame({
+        'release_year': [1972, 1972, 1979, 1995, 1995, 1996],
+        'genre': ['Crime', 'Drama', 'Horror', 'Action', 'Drama', 'Horror'],
+        'total_movies': [120, 300, 40, 150, 410, 55],
+        'average_rating': [6.4, 6.9, 5.8, 5.9, 6.7, 5.5],
+        'total_votes': [2500000, 3100000, 1200000, 2900000, 4000000, 800000],
+    })
+    yearly_aggregates = pl.DataFrame({
+        'release_year': [1972, 1979, 1995, 1996],
+        'total_movies': [900, 1100, 2400, 2500],
+        'average_rating': [6.5, 6.3, 6.2, 6.1],
+    })
+    runtime_distribution = pl.DataFrame({
+        'runtime_bin': ['0-60', '60-90', '90-120', '120-180'],
+        'total_movies': [500, 9000, 14000, 4000],
+        'average_rating': [6.8, 5.9, 6.2, 6.9],
+        'min_runtime': [0, 60, 90, 120],
+        'max_runtime': [60, 90, 120, 180],
+    })
+    return {
+        'movies_details': movies_details,
+        'year_genre_aggregates': year_genre_aggregates,
+        'yearly_aggregates': yearly_aggregates,
+        'runtime_distribution': runtime_distribution,
+    }
+
+
+@pytest.fixture
+def parquet_dir(tmp_path, sample_tables):
+    """Directory with Parquet snapshots of the sample tables."""
+    for table_name, df in sample_tables.items():
+        df.write_parquet(tmp_path / f"{table_name}.parquet")
+    return str(tmp_path)
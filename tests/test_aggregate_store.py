@@ -0,0 +1,91 @@
+import pytest
+import polars as pl
+from unittest.mock import Mock, patch
+from services.aggregate_store import AggregateStore
+from services.parquet_backend import ParquetBackend
+from services.data_service import DataService
+
+
+@pytest.fixture
+def load_table(sample_tables):
+    """Table loader serving shuffled copies of the sample tables."""
+    def _load(table_name, columns):
+        return sample_tables[table_name].select(columns).reverse()
+    return Mock(side_effect=_load)
+
+
+@pytest.fixture
+def store(load_table):
+    """AggregateStore over the sample tables."""
+    return AggregateStore(load_table, refresh_interval=3600)
+
+
+class TestAggregateStore:
+    """Test local slicing of the memory-resident aggregate tables."""
+
+    def test_yearly_trends_slice(self, store):
+        """Test slicing is inclusive and sorted by release year."""
+        assert store.get_yearly_trends((1979, 1995))["release_year"].to_list() == [1979, 1995]
+
+    def test_reversed_range_is_empty(self, store):
+        """Test a reversed year range returns no rows."""
+        assert store.get_yearly_trends((1995, 1979)).is_empty()
+
+    def test_genre_trends_matches_parquet_backend(self, store, parquet_dir):
+        """Test results match the backend query for the same filters."""
+        backend = ParquetBackend(parquet_dir, ['year_genre_aggregates'])
+
+        for year_range, genres in [((1970, 1995), ['Drama']), ((1900, 2025), []), ((1980, 1990), ['Drama'])]:
+            expected = backend.get_genre_trends(year_range, genres)
+            assert store.get_genre_trends(year_range, genres).equals(expected)
+
+    def test_runtime_distribution_requires_bin_inside_range(self, store):
+        """Test bins crossing the upper bound are excluded."""
+        result = store.get_runtime_distribution((60, 150))
+
+        assert result["runtime_bin"].to_list() == ['60-90', '90-120']
+
+    def test_tables_loaded_once_per_interval(self, store, load_table):
+        """Test the tables are only loaded again after the refresh interval."""
+        store.get_yearly_trends((1900, 2025))
+        store.get_runtime_distribution((0, 300))
+        assert load_table.call_count == 3
+
+        with patch('services.memory_store.time.monotonic', return_value=10 ** 9):
+            store.get_yearly_trends((1900, 2025))
+        assert load_table.call_count == 6
+
+    def test_failed_refresh_keeps_previous_tables(self, store, load_table):
+        """Test a failed reload keeps serving the tables already in memory."""
+        store.get_yearly_trends((1900, 2025))
+        load_table.side_effect = Exception("Warehouse down")
+
+        with patch('services.memory_store.time.monotonic', return_value=10 ** 9):
+            assert len(store.get_yearly_trends((1900, 2025))) == 4
+
+    def test_initial_load_failure_raises(self, load_table):
+        """Test queries fail when nothing could be loaded."""
+        load_table.side_effect = Exception("Warehouse down")
+
+        with pytest.raises(RuntimeError):
+            AggregateStore(load_table, refresh_interval=3600).get_yearly_trends((1900, 2025))
+
+
+class TestDataServiceAggregates:
+    """Test DataService answers aggregate queries from memory."""
+
+    def test_aggregates_skip_backend_queries(self, parquet_dir):
+        """Test repeated slider changes only load the tables once."""
+        with patch('services.data_service.get_bigquery_client', side_effect=RuntimeError("no credentials")):
+            service = DataService(
+                credentials={}, project_id="p", dataset_id="d",
+                tables_ids={name: name for name in ['movies_details', 'year_genre_aggregates', 'yearly_aggregates', 'runtime_distribution']},
+                backend="parquet", parquet_dir=parquet_dir, preload_aggregates=True
+            )
+
+        with patch.object(service.backend, 'get_yearly_trends') as mock_query:
+            for year in range(1970, 1980):
+                service.get_yearly_trends((year, 2000))
+            mock_query.assert_not_called()
+
+        assert service.get_yearly_trends((1979, 1979))["total_movies"].to_list() == [1100]
@@ -0,0 +1,123 @@
+import os
+import pytest
+import polars as pl
+from unittest.mock import patch
+from utils.arrow_file_cache import ArrowFileCache, PRUNE_TARGET
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ArrowFileCache(str(tmp_path), max_bytes=1024 ** 2, default_timeout=100)
+
+
+class TestArrowFileCache:
+    """Test the Arrow IPC file cache backend."""
+
+    def test_dataframe_roundtrip(self, cache):
+        """Test DataFrames are stored as Arrow files and read back unchanged."""
+        df = pl.DataFrame({"movie_title": ["A", "B"], "average_rating": [7.5, 8.0]})
+
+        assert cache.set("key", df)
+
+        assert cache.get("key").equals(df)
+        assert os.listdir(cache.cache_dir) == [os.path.basename(cache._path("key"))]
+
+    def test_other_values_roundtrip(self, cache):
+        """Test non-DataFrame results and markers are stored too."""
+        cache.set("year_range", (1900, 2025))
+        cache.set("genres", ["Action", "Drama"])
+        cache.set("fresh", True)
+
+        assert cache.get_many("year_range", "genres", "fresh", "missing") == [(1900, 2025), ["Action", "Drama"], True, None]
+
+    def test_entries_survive_new_instance(self, cache):
+        """Test another process (or a restart) reads the same entries."""
+        cache.set("key", pl.DataFrame({"a": [1]}))
+
+        assert ArrowFileCache(cache.cache_dir).get("key")["a"].to_list() == [1]
+
+    def test_expired_entry_is_removed(self, cache):
+        """Test entries expire after their timeout."""
+        cache.set("key", pl.DataFrame({"a": [1]}), timeout=10)
+
+        with patch("utils.arrow_file_cache.time.time", return_value=10 ** 12):
+            assert not cache.has("key")
+            assert cache.get("key") is None
+
+        assert not os.listdir(cache.cache_dir)
+
+    def test_size_limit_evicts_entries_closest_to_expiry(self, tmp_path):
+        """Test the directory is pruned to max_bytes, keeping the longest-lived entries."""
+        df = pl.DataFrame({"a": list(range(1000))})
+        cache = ArrowFileCache(str(tmp_path), max_bytes=20000)
+
+        cache.set("long", df, timeout=1000)
+        cache.set("short", df, timeout=10)
+        cache.set("medium", df, timeout=100)
+
+        assert cache.has("long")
+        assert not cache.has("short")
+        assert sum(entry.stat().st_size for entry in os.scandir(tmp_path)) <= 20000
+
+    def test_prunes_to_low_water_mark(self, tmp_path):
+        """Test pruning frees space below max_bytes, so the following writes don't prune again, without opening the files."""
+        df = pl.DataFrame({"a": list(range(1000))})
+        cache = ArrowFileCache(str(tmp_path), max_bytes=50000)
+        for i in range(5):
+            cache.set(f"key{i}", df, timeout=100 + i)
+
+        with patch.object(ArrowFileCache, "_open", side_effect=AssertionError("pruning opened a file")), \
+             patch.object(cache, "_prune", wraps=cache._prune) as prune:
+            cache.set("key5", df, timeout=200)
+            cache.set("key6", df, timeout=200)
+
+        assert prune.call_count == 1
+        assert cache.has("key0") is False and cache.has("key6")
+        assert sum(entry.stat().st_size for entry in os.scandir(tmp_path)) <= 50000 * PRUNE_TARGET + os.path.getsize(cache._path("key6"))
+
+    def test_overwrites_replace_the_size(self, cache):
+        """Test overwriting an entry doesn't count the replaced file's size."""
+        df = pl.DataFrame({"a": list(range(1000))})
+        for _ in range(5):
+            cache.set("key", df)
+
+        assert cache._size == os.path.getsize(cache._path("key"))
+
+    def test_counts_other_processes_writes(self, tmp_path):
+        """Test the directory size is rescanned, counting the entries other processes wrote."""
+        df = pl.DataFrame({"a": list(range(1000))})
+        cache = ArrowFileCache(str(tmp_path), max_bytes=30000)
+        other = ArrowFileCache(str(tmp_path), max_bytes=30000)
+        for i in range(3):
+            other.set(f"other{i}", df, timeout=10 + i)
+
+        with patch("utils.arrow_file_cache.time.monotonic", return_value=10 ** 12):
+            cache.set("key", df, timeout=1000)
+
+        assert cache.has("key") and not cache.has("other0")
+        assert sum(entry.stat().st_size for entry in os.scandir(tmp_path)) <= 30000
+
+    def test_unreadable_file_is_a_miss(self, cache):
+        """Test a corrupt file is treated as a miss and removed."""
+        with open(cache._path("key"), "wb") as f:
+            f.write(b"not arrow")
+
+        assert cache.get("key") is None
+        assert not os.path.exists(cache._path("key"))
+
+    def test_delete_and_clear(self, cache):
+        """Test entries can be deleted one by one or all at once."""
+        cache.set("first", 1)
+        cache.set("second", 2)
+
+        assert cache.delete("first")
+        assert not cache.delete("first")
+        assert cache.clear()
+        assert cache.get("second") is None
+
+    def test_add_keeps_existing_entry(self, cache):
+        """Test add doesn't overwrite a live entry."""
+        cache.set("key", 1)
+
+        assert not cache.add("key", 2)
+        assert cache.get("key") == 1
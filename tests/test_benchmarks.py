@@ -0,0 +1,72 @@
+import json
+import polars as pl
+import pytest
+from config import MIN_YEAR, MAX_YEAR
+from services.parquet_backend import ParquetBackend
+from benchmarks import run
+from benchmarks.synthetic import make_tables, write_tables
+
+
+class TestSyntheticTables:
+    """Test the synthetic warehouse tables."""
+
+    def test_aggregates_match_details(self):
+        """Test the aggregate tables are computed from the rated movies of movies_details, across chunks."""
+        tables = make_tables(1000, seed=1, chunk_size=300)
+        details = tables["movies_details"]
+        rated = details.filter(pl.col("average_rating").is_not_null())
+
+        assert len(details) == 1000
+        assert 0 < len(rated) < len(details)
+        assert tables["yearly_aggregates"]["total_movies"].sum() == len(rated)
+        assert tables["runtime_distribution"]["total_movies"].sum() == len(rated)
+        exploded = rated.select(pl.col("genres").str.split(",")).explode("genres")
+        assert tables["year_genre_aggregates"]["total_movies"].sum() == len(exploded)
+        assert tables["year_genre_aggregates"]["total_votes"].sum() == rated.select(
+            pl.col("total_votes").repeat_by(pl.col("genres").str.split(",").list.len()).explode().sum()
+        ).item()
+
+        year = rated["release_year"].mode()[0]
+        expected = round(rated.filter(pl.col("release_year") == year)["average_rating"].mean(), 2)
+        assert tables["yearly_aggregates"].filter(pl.col("release_year") == year)["average_rating"][0] == pytest.approx(expected, abs=0.01)
+
+    def test_columns(self):
+        """Test the tables have the columns the queries select."""
+        tables = make_tables(100)
+
+        assert tables["movies_details"].columns == ["movie_title", "release_year", "genres", "runtime_minutes", "is_adult", "average_rating", "total_votes"]
+        assert tables["year_genre_aggregates"].columns == ["release_year", "genre", "total_movies", "average_rating", "total_votes"]
+        assert tables["yearly_aggregates"].columns == ["release_year", "total_movies", "average_rating"]
+        assert tables["runtime_distribution"].columns == ["runtime_bin", "total_movies", "average_rating", "min_runtime", "max_runtime"]
+
+    def test_seeded(self):
+        """Test the same seed builds the same tables."""
+        assert make_tables(100, seed=3)["movies_details"].equals(make_tables(100, seed=3)["movies_details"])
+        assert not make_tables(100, seed=3)["movies_details"].equals(make_tables(100, seed=4)["movies_details"])
+
+    def test_write_tables(self, tmp_path):
+        """Test the Parquet snapshots written in chunks match the tables built in memory and can be queried."""
+        paths = write_tables(str(tmp_path), 1000, seed=2, chunk_size=300)
+        tables = make_tables(1000, seed=2, chunk_size=300)
+
+        for table_name, df in tables.items():
+            assert pl.read_parquet(paths[table_name]).equals(df)
+        backend = ParquetBackend(str(tmp_path), tables.keys())
+        assert not backend.get_genre_trends((MIN_YEAR, MAX_YEAR), ["Drama"]).is_empty()
+
+
+class TestBenchmarkRun:
+    """Test the benchmark runner end to end on a tiny scale."""
+
+    def test_writes_results(self, tmp_path, monkeypatch):
+        """Test every benchmark runs and the results are written as JSON."""
+        monkeypatch.setitem(run.SCALES, "10k", 1000)
+        output = tmp_path / "results.json"
+
+        run.main(["--scales", "10k", "--repeat", "1", "--output", str(output)])
+
+        report = json.loads(output.read_text())
+        names = {(result["group"], result["name"]) for result in report["results"]}
+        assert ("data_service.stand_in", "get_top_movies") in names
+        assert ("chart", "create_bar_chart") in names
+        assert all(result["median"] >= 0 for result in report["results"])
@@ -0,0 +1,85 @@
+import numpy as np
+import plotly.io as pio
+import polars as pl
+from components.area_chart import create_area_chart
+from components.bar_chart import create_bar_chart
+from components.combo_chart import create_combo_chart
+from config import ACCENT_COLOR, COLOR_DISCRETE_SEQUENCE, PRIMARY_COLOR
+from utils.chart_styles import CHART_TEMPLATE, custom_data
+
+
+class TestCustomData:
+    """Test building customdata column by column."""
+
+    def test_numeric_columns(self):
+        """Test numeric columns give a numeric array equal to the row-wise conversion."""
+        df = pl.DataFrame({"release_year": [2000, 2001], "average_rating": [6.5, 7.0]})
+
+        data = custom_data(df, ["release_year", "average_rating"])
+
+        assert data.dtype == np.float64
+        assert np.array_equal(data, df.to_numpy())
+
+    def test_mixed_columns(self):
+        """Test mixed columns give the same values as the row-wise conversion."""
+        df = pl.DataFrame({"movie_title": ["A", None], "total_votes": [10, 20], "average_rating": [6.5, None]})
+
+        data = custom_data(df, ["movie_title", "total_votes", "average_rating"])
+
+        assert data.dtype == object
+        assert data.tolist()[0] == ["A", 10, 6.5]
+        assert data[1, 0] is None and np.isnan(data[1, 2])
+
+
+class TestCharts:
+    """Test the chart factories."""
+
+    def setup_method(self):
+        self.trends = pl.DataFrame({
+            "release_year": [2000, 2000, 2001, 2001],
+            "genre": ["Drama", "Comedy", "Drama", "Comedy"],
+            "total_movies": [10, 5, 12, 6],
+        })
+
+    def test_template(self):
+        """Test figures use the registered template for the common styling."""
+        fig = create_combo_chart(pl.DataFrame({"runtime_bin": ["0-30"], "total_movies": [1], "average_rating": [7.0]}),
+                                 "runtime_bin", "total_movies", "average_rating")
+
+        assert fig.layout.template == pio.templates[CHART_TEMPLATE]
+        assert fig.layout.template.data.bar[0].marker.line.color == ACCENT_COLOR
+        assert fig.layout.yaxis2.title.text == "Average Rating"
+        assert fig.layout.yaxis2.overlaying == "y"
+
+    def test_bar_color_scale(self):
+        """Test a color column is mapped onto the color axis."""
+        df = pl.DataFrame({"movie_title": ["A", "B"], "average_rating": [8.0, 7.5], "total_votes": [100, 50]})
+
+        fig = create_bar_chart(df, "average_rating", "movie_title", color_col="total_votes", horizontal=True)
+
+        assert fig.data[0].orientation == "h"
+        assert list(fig.data[0].marker.color) == [100, 50]
+        assert fig.data[0].marker.coloraxis == "coloraxis"
+        assert fig.layout.xaxis.title.text == "Average Rating"
+
+    def test_bar_single_color(self):
+        """Test bars without a color column use the primary color."""
+        fig = create_bar_chart(pl.DataFrame({"x": ["a"], "y": [1]}), "x", "y")
+
+        assert fig.data[0].marker.color == PRIMARY_COLOR
+
+    def test_area_groups(self):
+        """Test one stacked trace per color group, in order of appearance."""
+        fig = create_area_chart(self.trends, "release_year", "total_movies", color_col="genre")
+
+        assert [trace.name for trace in fig.data] == ["Drama", "Comedy"]
+        assert [trace.line.color for trace in fig.data] == COLOR_DISCRETE_SEQUENCE[:2]
+        assert list(fig.data[1].y) == [5, 6]
+        assert all(trace.stackgroup == "1" for trace in fig.data)
+        assert fig.layout.legend.title.text == "genre"
+
+    def test_area_unstacked(self):
+        """Test grouped areas aren't stacked when stacked is False."""
+        fig = create_area_chart(self.trends, "release_year", "total_movies", color_col="genre", stacked=False)
+
+        assert all(trace.stackgroup is None for trace in fig.data)
@@ -1,9 +1,19 @@
+import asyncio
 import pytest
 import polars as pl
 from unittest.mock import Mock, patch
 import pandas as pd
+import pyarrow as pa
 from services.data_service import DataService
 
+
+def make_query_job(pandas_df):
+    """Mock a BigQuery QueryJob whose result downloads the given rows as Arrow."""
+    job = Mock()
+    job.result.return_value.total_rows = len(pandas_df)
+    job.result.return_value.to_arrow.return_value = pa.Table.from_pandas(pandas_df, preserve_index=False)
+    return job
+
 @pytest.fixture
 def mock_credentials():
     """Mock credentials for testing."""
@@ -78,9 +88,7 @@ class TestExecuteQuery:
         })
         
         # Mock query result
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service._execute_query("SELECT * FROM test_table")
         
@@ -96,6 +104,59 @@ class TestExecuteQuery:
         with pytest.raises(Exception, match="Query error"):
             data_service._execute_query("INVALID QUERY")
 
+    def test_execute_query_small_result_uses_rest(self, data_service):
+        """Test small results are downloaded without the Storage API."""
+        data_service.client.query.return_value = make_query_job(pd.DataFrame({'genre': ['Drama']}))
+        
+        with patch('services.data_service.get_bigquery_storage_client') as mock_storage:
+            data_service._execute_query("SELECT genre FROM test_table")
+        
+        rows = data_service.client.query.return_value.result.return_value
+        rows.to_arrow.assert_called_once_with(bqstorage_client=None, create_bqstorage_client=False)
+        mock_storage.assert_not_called()
+    
+    def test_execute_query_large_result_uses_storage_api(self, data_service):
+        """Test large results are downloaded through a reused Storage API client."""
+        job = make_query_job(pd.DataFrame({'genre': ['Drama']}))
+        job.result.return_value.total_rows = 10_000_000
+        data_service.client.query.return_value = job
+        
+        with patch('services.data_service.get_bigquery_storage_client') as mock_storage:
+            data_service._execute_query("SELECT genre FROM test_table")
+            data_service._execute_query("SELECT genre FROM test_table")
+        
+        mock_storage.assert_called_once()
+        job.result.return_value.to_arrow.assert_called_with(
+            bqstorage_client=mock_storage.return_value, create_bqstorage_client=False
+        )
+    
+    def test_execute_query_storage_api_unavailable(self, data_service):
+        """Test large results fall back to REST when the Storage client cannot be created."""
+        job = make_query_job(pd.DataFrame({'genre': ['Drama']}))
+        job.result.return_value.total_rows = 10_000_000
+        data_service.client.query.return_value = job
+        
+        with patch('services.data_service.get_bigquery_storage_client', side_effect=RuntimeError("denied")):
+            result = data_service._execute_query("SELECT genre FROM test_table")
+        
+        assert len(result) == 1
+        job.result.return_value.to_arrow.assert_called_once_with(bqstorage_client=None, create_bqstorage_client=False)
+
+    def test_execute_query_passes_parameters(self, data_service):
+        """Test parameterized queries are submitted with their parameters and fingerprint label."""
+        from services.query_builder import yearly_trends_query
+        data_service.client.query.return_value = make_query_job(pd.DataFrame({'release_year': [2000]}))
+        query = yearly_trends_query("test_table", (2000, 2010))
+        
+        data_service._execute_query(query)
+        
+        sql = data_service.client.query.call_args[0][0]
+        job_config = data_service.client.query.call_args.kwargs["job_config"]
+        assert sql == query.sql
+        assert {p.name: p.value for p in job_config.query_parameters} == {"year_min": 2000, "year_max": 2010}
+        assert job_config.labels == {"query_fingerprint": query.fingerprint}
+
+
 class TestGetTopMovies:
     """Test get_top_movies method."""
     
@@ -110,9 +171,7 @@ class TestGetTopMovies:
             'weighted_rating': [13800000, 3320000]
         })
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_top_movies(
             year_range=(1970, 1980),
@@ -136,9 +195,7 @@ class TestGetTopMovies:
             'average_rating': [7.5]
         })
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_top_movies(
             year_range=(2000, 2020),
@@ -146,10 +203,11 @@ class TestGetTopMovies:
             rating_threshold=(7.0, 10.0)
         )
         
-        # Verify genre filter was applied in query
+        # Verify genre filter was applied in query, with the genres passed as a parameter
         query_call = data_service.client.query.call_args[0][0]
-        assert "Action" in query_call
-        assert "Thriller" in query_call
+        params = {p.name: p for p in data_service.client.query.call_args.kwargs["job_config"].query_parameters}
+        assert "UNNEST(@genres)" in query_call
+        assert params["genres"].values == ["Action", "Thriller"]
         assert len(result) == 1
         assert isinstance(result, pl.DataFrame)
         assert 'primary_title' in result.columns
@@ -160,9 +218,7 @@ class TestGetTopMovies:
             'primary_title': ['Movie'],
             'average_rating': [7.5],
         })
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
 
         result = data_service.get_top_movies(
             year_range=(2000, 2020),
@@ -200,9 +256,7 @@ class TestGetYearRange:
             'max_year': [2023]
         })
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_year_range()
         
@@ -212,9 +266,7 @@ class TestGetYearRange:
         """Test year range with empty result."""
         mock_pandas_df = pd.DataFrame()
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_year_range()
         
@@ -238,9 +290,7 @@ class TestGetUniqueGenres:
             'genre': ['Action', 'Comedy', 'Drama']
         })
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_unique_genres()
         
@@ -250,9 +300,7 @@ class TestGetUniqueGenres:
         """Test unique genres with empty result."""
         mock_pandas_df = pd.DataFrame()
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_unique_genres()
         
@@ -280,9 +328,7 @@ class TestGetGenreTrends:
             'total_votes': [50000, 30000]
         })
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_genre_trends(
             year_range=(2020, 2021),
@@ -301,9 +347,7 @@ class TestGetGenreTrends:
         """Test genre trends without genre filter."""
         mock_pandas_df = pd.DataFrame({'genre': ['Action']})
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_genre_trends(
             year_range=(2020, 2021),
@@ -328,9 +372,7 @@ class TestGetRuntimeDistribution:
             'max_runtime': [90, 120]
         })
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_runtime_distribution(runtime_range=(60, 150))
         
@@ -351,9 +393,7 @@ class TestGetYearlyTrends:
             'total_votes': [500000, 480000, 520000]
         })
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_yearly_trends(year_range=(2020, 2022))
         
@@ -369,9 +409,7 @@ class TestEdgeCases:
         """Test with invalid year range."""
         mock_pandas_df = pd.DataFrame()
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         # Test with reversed year range
         result = data_service.get_top_movies(
@@ -386,9 +424,7 @@ class TestEdgeCases:
         """Test with negative rating threshold."""
         mock_pandas_df = pd.DataFrame()
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_top_movies(
             year_range=(2000, 2020),
@@ -402,9 +438,7 @@ class TestEdgeCases:
         """Test with very large limit."""
         mock_pandas_df = pd.DataFrame()
         
-        mock_query_result = Mock()
-        mock_query_result.to_dataframe.return_value = mock_pandas_df
-        data_service.client.query.return_value = mock_query_result
+        data_service.client.query.return_value = make_query_job(mock_pandas_df)
         
         result = data_service.get_top_movies(
             year_range=(2000, 2020),
@@ -414,3 +448,287 @@ class TestEdgeCases:
         )
         
         assert isinstance(result, pl.DataFrame)
+
+
+class TestStaleWhileRevalidate:
+    """Test stale results are served while refreshing in the background."""
+    
+    @pytest.fixture
+    def cached_service(self, mock_credentials, mock_tables_ids, mock_bigquery_client):
+        """DataService with an in-memory cache."""
+        from cachelib import SimpleCache
+        with patch('services.data_service.get_bigquery_client', return_value=mock_bigquery_client):
+            return DataService(
+                credentials=mock_credentials,
+                project_id="test-project",
+                dataset_id="test-dataset",
+                tables_ids=mock_tables_ids,
+                cache_instance=SimpleCache(),
+            )
+    
+    def test_fresh_hit_does_not_refresh(self, cached_service):
+        """Test fresh results are served without querying."""
+        cached_service.client.query.return_value = make_query_job(pd.DataFrame({'genre': ['Drama']}))
+        cached_service.get_unique_genres()
+        cached_service.get_unique_genres()
+        cached_service._refresh_executor.shutdown(wait=True)
+        
+        assert cached_service.client.query.call_count == 1
+    
+    def test_stale_hit_returns_old_value_and_refreshes(self, cached_service):
+        """Test a stale result is returned at once and replaced in the background."""
+        cached_service.client.query.return_value = make_query_job(pd.DataFrame({'genre': ['Drama']}))
+        cached_service.get_unique_genres()
+        
+        # Simulate the soft TTL passing
+        cache_key = cached_service._get_cache_key("get_unique_genres")
+        cached_service.cache.delete(cached_service._fresh_key(cache_key))
+        cached_service.client.query.return_value = make_query_job(pd.DataFrame({'genre': ['Comedy', 'Drama']}))
+        
+        generation = cached_service.data_generation
+        assert cached_service.get_unique_genres() == ['Drama']
+        cached_service._refresh_executor.shutdown(wait=True)
+        assert cached_service.get_unique_genres() == ['Comedy', 'Drama']
+        assert cached_service.data_generation == generation + 1
+    
+    def test_failed_refresh_keeps_stale_value(self, cached_service):
+        """Test a failing refresh doesn't replace the stale result."""
+        cached_service.client.query.return_value = make_query_job(pd.DataFrame({'release_year': [2000]}))
+        cached_service.get_yearly_trends((2000, 2000))
+        
+        cache_key = cached_service._get_cache_key("get_yearly_trends", (2000, 2000))
+        cached_service.cache.delete(cached_service._fresh_key(cache_key))
+        cached_service.client.query.side_effect = Exception("Database error")
+        
+        cached_service.get_yearly_trends((2000, 2000))
+        cached_service._refresh_executor.shutdown(wait=True)
+        
+        assert cached_service.cache.get(cache_key)["release_year"].to_list() == [2000]
+        assert cached_service.data_generation == 0
+
+    @pytest.mark.parametrize("method_name, rows, expected", [
+        ("get_unique_genres", {'genre': ['Drama']}, ['Drama']),
+        ("get_year_range", {'min_year': [1950], 'max_year': [2020]}, (1950, 2020)),
+    ])
+    def test_failed_refresh_keeps_stale_sidebar_value(self, cached_service, method_name, rows, expected):
+        """Test a failing refresh of a method without a DataFrame result doesn't replace the stale result with its fallback."""
+        cached_service.client.query.return_value = make_query_job(pd.DataFrame(rows))
+        getattr(cached_service, method_name)()
+
+        cache_key = cached_service._get_cache_key(method_name)
+        cached_service.cache.delete(cached_service._fresh_key(cache_key))
+        cached_service.client.query.side_effect = Exception("Database error")
+
+        assert getattr(cached_service, method_name)() == expected
+        cached_service._refresh_executor.shutdown(wait=True)
+
+        assert cached_service.cache.get(cache_key) == expected
+        assert not cached_service.cache.get(cached_service._fresh_key(cache_key))
+
+    def test_failures_are_not_cached(self, cached_service):
+        """Test the fallback of a failed query is returned but not cached."""
+        cached_service.client.query.side_effect = Exception("Database error")
+        assert cached_service.get_unique_genres() == []
+
+        cached_service.client.query.side_effect = None
+        cached_service.client.query.return_value = make_query_job(pd.DataFrame({'genre': ['Drama']}))
+        assert cached_service.get_unique_genres() == ['Drama']
+
+    def test_expiries_are_jittered(self, cached_service):
+        """Test soft and hard expiries are spread around the configured TTLs."""
+        cached_service.cache = Mock()
+        cached_service.semantic_cache.cache = cached_service.cache
+        
+        with patch('services.data_service.random.uniform', return_value=0.9):
+            cached_service._store("get_yearly_trends", "key", 1000, pl.DataFrame(), (2000, 2000))
+        
+        timeouts = {call.args[0]: call.kwargs["timeout"] for call in cached_service.cache.set.call_args_list}
+        assert timeouts["key:fresh"] == 900
+        assert timeouts["key"] > 900
+
+
+class TestMetrics:
+    """Test cache and query metrics are recorded per method."""
+
+    def test_lookups_and_queries_are_counted(self, mock_credentials, mock_tables_ids, mock_bigquery_client):
+        """Test misses query BigQuery once and hits are served from the cache."""
+        from cachelib import SimpleCache
+        from services.data_service import CACHE_LOOKUPS, BACKEND_QUERIES, BIGQUERY_JOBS, CALL_DURATION
+        with patch('services.data_service.get_bigquery_client', return_value=mock_bigquery_client):
+            service = DataService(mock_credentials, "test-project", "test-dataset", mock_tables_ids, cache_instance=SimpleCache())
+        service.client.query.return_value = make_query_job(pd.DataFrame({'genre': ['Drama']}))
+        before = (
+            CACHE_LOOKUPS.value("get_unique_genres", "miss"), CACHE_LOOKUPS.value("get_unique_genres", "hit"),
+            BACKEND_QUERIES.value("get_unique_genres", "BigQueryBackend", "ok"), BIGQUERY_JOBS.value("ok"),
+            CALL_DURATION.count("get_unique_genres"),
+        )
+
+        service.get_unique_genres()
+        service.get_unique_genres()
+
+        after = (
+            CACHE_LOOKUPS.value("get_unique_genres", "miss"), CACHE_LOOKUPS.value("get_unique_genres", "hit"),
+            BACKEND_QUERIES.value("get_unique_genres", "BigQueryBackend", "ok"), BIGQUERY_JOBS.value("ok"),
+            CALL_DURATION.count("get_unique_genres"),
+        )
+        assert [a - b for a, b in zip(after, before)] == [1, 1, 1, 1, 2]
+
+    def test_failed_query_is_counted_as_error(self, data_service):
+        """Test failing jobs are counted by outcome."""
+        from services.data_service import BIGQUERY_JOBS
+        data_service.client.query.side_effect = Exception("Database error")
+        before = BIGQUERY_JOBS.value("error")
+
+        data_service.get_yearly_trends((2000, 2000))
+
+        assert BIGQUERY_JOBS.value("error") == before + 1
+
+
+class TestJobLedger:
+    """Test BigQuery job statistics are recorded with the calling method."""
+
+    def test_jobs_are_recorded_with_method(self, data_service):
+        """Test each finished job is recorded with its DataService method and fingerprint."""
+        data_service.client.query.return_value = make_query_job(pd.DataFrame({'release_year': [2000]}))
+
+        data_service.get_yearly_trends((2000, 2000))
+
+        entry = data_service.job_ledger.entries()[-1]
+        assert entry["method"] == "get_yearly_trends"
+        job_config = data_service.client.query.call_args.kwargs["job_config"]
+        assert entry["fingerprint"] == job_config.labels["query_fingerprint"]
+        assert entry["rows"] == 1
+
+    def test_async_jobs_are_recorded_with_method(self, data_service):
+        """Test jobs of the async API are recorded with their method too."""
+        data_service.client.query.return_value = make_query_job(pd.DataFrame({'genre': ['Drama']}))
+
+        asyncio.run(data_service.aget_unique_genres())
+
+        assert data_service.job_ledger.entries()[-1]["method"] == "get_unique_genres"
+
+
+class TestGetDashboardBundle:
+    """Test fetching several charts concurrently."""
+    
+    FILTERS = {
+        "year_range": (2000, 2010),
+        "selected_genres": ["Drama"],
+        "rating_threshold": (5.0, 10.0),
+        "runtime_range": (60, 180),
+        "limit": 10,
+        "min_votes": 100,
+    }
+    
+    def test_bundle_returns_all_charts(self, data_service):
+        """Test every chart is fetched with its own filters."""
+        data_service.get_top_movies = Mock(return_value=pl.DataFrame({'movie_title': ['A']}))
+        data_service.get_genre_trends = Mock(return_value=pl.DataFrame({'genre': ['Drama']}))
+        data_service.get_runtime_distribution = Mock(return_value=pl.DataFrame({'runtime_bin': ['60-90']}))
+        data_service.get_yearly_trends = Mock(return_value=pl.DataFrame({'release_year': [2000]}))
+        
+        bundle = data_service.get_dashboard_bundle(self.FILTERS)
+        
+        assert set(bundle) == {"top_movies", "genre_trends", "runtime_distribution", "yearly_trends"}
+        data_service.get_top_movies.assert_called_once_with((2000, 2010), ["Drama"], (5.0, 10.0), (60, 180), 10, 100)
+        data_service.get_genre_trends.assert_called_once_with((2000, 2010), ["Drama"])
+        data_service.get_runtime_distribution.assert_called_once_with((60, 180))
+        data_service.get_yearly_trends.assert_called_once_with((2000, 2010))
+    
+    def test_bundle_only_fetches_requested_charts(self, data_service):
+        """Test charts that weren't requested are not queried."""
+        data_service.get_runtime_distribution = Mock(return_value=pl.DataFrame({'runtime_bin': ['60-90']}))
+        data_service.get_yearly_trends = Mock()
+        
+        bundle = data_service.get_dashboard_bundle({"runtime_range": (60, 180)}, charts=["runtime_distribution"])
+        
+        assert list(bundle) == ["runtime_distribution"]
+        data_service.get_yearly_trends.assert_not_called()
+    
+    def test_bundle_runs_queries_concurrently(self, data_service):
+        """Test the queries of a bundle overlap instead of running one after another."""
+        import threading
+        barrier = threading.Barrier(4, timeout=5)
+        
+        def wait_for_all(*args):
+            barrier.wait()
+            return pl.DataFrame({'value': [1]})
+        
+        data_service.get_top_movies = data_service.get_genre_trends = wait_for_all
+        data_service.get_runtime_distribution = data_service.get_yearly_trends = wait_for_all
+        
+        bundle = data_service.get_dashboard_bundle(self.FILTERS)
+        
+        assert len(bundle) == 4
+
+
+class TestAsyncApi:
+    """Test the async DataService methods."""
+    
+    def test_aget_genre_trends_polls_job(self, data_service):
+        """Test the job is polled until done before its results are downloaded."""
+        job = make_query_job(pd.DataFrame({'release_year': [2000], 'genre': ['Drama']}))
+        job.done.side_effect = [False, False, True]
+        data_service.client.query.return_value = job
+        
+        with patch('services.data_service.QUERY_POLL_INTERVAL', 0.001):
+            result = asyncio.run(data_service.aget_genre_trends((2000, 2000), ["Drama"]))
+        
+        assert result["genre"].to_list() == ["Drama"]
+        assert job.done.call_count == 3
+        query = data_service.client.query.call_args[0][0]
+        params = {p.name: p for p in data_service.client.query.call_args.kwargs["job_config"].query_parameters}
+        assert "genre IN UNNEST(@genres)" in query
+        assert params["genres"].values == ["Drama"]
+    
+    def test_aget_top_movies_error_returns_empty(self, data_service):
+        """Test a failing job returns an empty DataFrame like the sync method."""
+        data_service.client.query.side_effect = Exception("Database error")
+        
+        result = asyncio.run(data_service.aget_top_movies((2000, 2020), [], (5.0, 10.0)))
+        
+        assert result.is_empty()
+    
+    def test_aget_year_range(self, data_service):
+        """Test the async year range is converted like the sync one."""
+        data_service.client.query.return_value = make_query_job(pd.DataFrame({'min_year': [1920], 'max_year': [2024]}))
+        
+        assert asyncio.run(data_service.aget_year_range()) == (1920, 2024)
+    
+    def test_concurrent_awaits_share_query(self, mock_credentials, mock_tables_ids, mock_bigquery_client):
+        """Test concurrent awaits for the same uncached result run one job and cache it."""
+        from cachelib import SimpleCache
+        with patch('services.data_service.get_bigquery_client', return_value=mock_bigquery_client):
+            service = DataService(
+                credentials=mock_credentials,
+                project_id="test-project",
+                dataset_id="test-dataset",
+                tables_ids=mock_tables_ids,
+                cache_instance=SimpleCache(),
+            )
+        # Year filters are clamped to the cached year range, which takes one query of its own
+        service.client.query.side_effect = lambda sql, **kwargs: make_query_job(
+            pd.DataFrame({'min_year': [1894], 'max_year': [2025]}) if "min_year" in sql else pd.DataFrame({'release_year': [2000]})
+        )
+        
+        async def fetch_twice():
+            return await asyncio.gather(service.aget_yearly_trends((2000, 2000)), service.aget_yearly_trends((2000, 2000)))
+        
+        first, second = asyncio.run(fetch_twice())
+        
+        assert first.equals(second)
+        assert service.client.query.call_count == 2
+        assert service.get_yearly_trends((2000, 2000)).equals(first)
+        assert service.client.query.call_count == 2
+    
+    def test_aget_dashboard_bundle(self, data_service):
+        """Test the async bundle awaits the requested charts."""
+        data_service.aget_runtime_distribution = Mock(side_effect=lambda runtime_range: asyncio.sleep(0, pl.DataFrame({'runtime_bin': ['60-90']})))
+        data_service.aget_yearly_trends = Mock(side_effect=lambda year_range: asyncio.sleep(0, pl.DataFrame({'release_year': [2000]})))
+        
+        bundle = asyncio.run(data_service.aget_dashboard_bundle(
+            {"year_range": (2000, 2000), "runtime_range": (60, 180)}, charts=["runtime_distribution", "yearly_trends"]
+        ))
+        
+        assert list(bundle) == ["runtime_distribution", "yearly_trends"]
+        data_service.aget_yearly_trends.assert_called_once_with((2000, 2000))
@@ -0,0 +1,90 @@
+from unittest.mock import Mock, patch
+import plotly.graph_objects as go
+import pytest
+from cachelib import SimpleCache
+from dashboard.callbacks import CHART_FILTERS, _chart_filters, _filter_spec, _render_figure, _store_payload
+from services.data_service import DataService
+from services.figure_cache import FigureCache
+from services.result_store import ResultStore
+
+
+class TestFigureCache:
+    """Test the rendered figure cache."""
+
+    def setup_method(self):
+        self.cache = FigureCache(max_bytes=1024 ** 2)
+        self.handle = {"cache_key": "filters", "version": "v1"}
+        self.build = Mock(side_effect=lambda: go.Figure(go.Bar(x=[1, 2], y=["a", "b"], orientation="h")))
+
+    def test_builds_once(self):
+        """Test a figure is built on the first request and reused after."""
+        fig = self.cache.get_or_build("top_movies", self.handle, self.build)
+        cached = self.cache.get_or_build("top_movies", dict(self.handle), self.build)
+
+        self.build.assert_called_once()
+        assert fig["data"][0]["orientation"] == "h"
+        assert cached is fig
+
+    def test_keyed_by_chart_filters_and_version(self):
+        """Test other charts, filter states and data versions are built separately."""
+        self.cache.get_or_build("top_movies", self.handle, self.build)
+        self.cache.get_or_build("genre_trends", self.handle, self.build)
+        self.cache.get_or_build("top_movies", {**self.handle, "cache_key": "other"}, self.build)
+        self.cache.get_or_build("top_movies", {**self.handle, "version": "v2"}, self.build)
+
+        assert self.build.call_count == 4
+
+    def test_byte_budget(self):
+        """Test figures beyond the byte budget are evicted."""
+        cache = FigureCache(max_bytes=8 * 1024, shards=1)
+        build = lambda: go.Figure(go.Scatter(x=list(range(200)), y=list(range(200))))
+
+        for version in range(10):
+            cache.get_or_build("yearly_trends", {"cache_key": "filters", "version": version}, build)
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 8 * 1024
+        assert stats["entries"] < 10
+
+    def test_build_errors_propagate(self):
+        """Test a failed build isn't cached."""
+        build = Mock(side_effect=[ValueError("bad data"), go.Figure()])
+
+        with pytest.raises(ValueError):
+            self.cache.get_or_build("top_movies", self.handle, build)
+        self.cache.get_or_build("top_movies", self.handle, build)
+
+        assert build.call_count == 2
+
+
+class TestFigureReuse:
+    """Test figures are reused across filter changes in the dashboard."""
+
+    def test_back_and_forth_filters_hit(self, parquet_dir, sample_tables):
+        """Test going back to earlier filters (A -> B -> A) reuses A's figure until the data is refreshed."""
+        with patch('services.data_service.get_bigquery_client', side_effect=RuntimeError("no credentials")):
+            service = DataService(
+                credentials={}, project_id="p", dataset_id="d", tables_ids={name: name for name in sample_tables},
+                cache_instance=SimpleCache(), backend="parquet", parquet_dir=parquet_dir,
+            )
+        result_store = ResultStore()
+        figure_cache = FigureCache()
+        build = Mock(side_effect=lambda: go.Figure(go.Scatter(x=[1972], y=[900])))
+
+        def view(year_range):
+            spec = _filter_spec(service, year_range)
+            generation = service.data_generation
+            handle = _store_payload(
+                result_store, "yearly_trends", service.get_yearly_trends(spec.year_range),
+                spec.cache_key(*CHART_FILTERS["yearly_trends"]), _chart_filters(spec), None, generation
+            )
+            return _render_figure(figure_cache, "yearly_trends", handle, build)
+
+        first = view((1970, 1985))
+        view((1985, 2000))
+        assert view((1970, 1985)) is first
+        assert build.call_count == 2
+
+        service.clear_cache()
+        view((1970, 1985))
+        assert build.call_count == 3
@@ -0,0 +1,126 @@
+import pytest
+import pandas as pd
+import pyarrow as pa
+from unittest.mock import Mock, patch
+from cachelib import SimpleCache
+from config import MIN_YEAR, MAX_YEAR, MIN_RATING, MAX_RATING, RUNTIME_MIN, RUNTIME_MAX, GENRES, TOP_N_MOVIES, MIN_VOTES_THRESHOLD
+from dashboard.callbacks import _chart_filters, _filter_spec
+from services.data_service import CACHE_LOOKUPS, DataService
+from services.filter_spec import FilterSpec, canonical_args
+from services.warmup import CacheWarmer
+
+
+class TestFilterSpec:
+    """Test equivalent filter states share one canonical form."""
+
+    def test_genres_are_sorted_and_deduplicated(self):
+        """Test genre click order doesn't matter."""
+        first = FilterSpec.from_inputs((2000, 2010), ["Drama", "Action"], [0, 10], [0, 300])
+        second = FilterSpec.from_inputs((2000, 2010), ["Action", "Drama", "Drama"], [0, 10], [0, 300])
+
+        assert first == second
+        assert first.genres == ("Action", "Drama")
+
+    def test_ranges_are_quantized_to_slider_steps(self):
+        """Test integer/float spellings and float noise map to the same slider step."""
+        spec = FilterSpec.from_inputs(None, [], [0, 7.000000001], [60.0, 120.4])
+
+        assert spec.rating_range == (0.0, 7.0)
+        assert spec.runtime_range == (60, 120)
+        assert spec == FilterSpec.from_inputs(None, [], [0.0, 7], [60, 120])
+
+    def test_ranges_are_clamped_to_bounds(self):
+        """Test ranges wider than the data are clamped to its bounds."""
+        spec = FilterSpec.from_inputs((1850, 2030), [], [-1, 11], None, year_bounds=(1894, 2025))
+
+        assert spec.year_range == (1894, 2025)
+        assert spec.rating_range == (0.0, 10.0)
+
+    def test_disjoint_range_is_not_clamped(self):
+        """Test a range outside the bounds isn't clamped onto a bound year."""
+        spec = FilterSpec.from_inputs((1800, 1850), [], None, None, year_bounds=(1894, 2025))
+
+        assert spec.year_range == (1800, 1850)
+
+    def test_cache_key_of_chart_fields(self):
+        """Test cache keys only depend on the given fields."""
+        first = FilterSpec.from_inputs((2000, 2010), ["Drama"], [0, 10], [0, 300])
+        second = FilterSpec.from_inputs((2000, 2010), ["Comedy"], [5, 10], [0, 300])
+
+        assert first.cache_key("year_range") == second.cache_key("year_range")
+        assert first.cache_key("year_range", "genres") != second.cache_key("year_range", "genres")
+
+    def test_canonical_args(self):
+        """Test DataService arguments are normalized per method."""
+        assert canonical_args("get_top_movies", ([2000, 2010], ["Drama", "Action"], [0, 10], None, 20, 1000)) == (
+            (2000, 2010), ["Action", "Drama"], (0.0, 10.0), None, 20, 1000
+        )
+        assert canonical_args("get_year_range", ()) == ()
+
+    def test_canonical_args_clamp_years(self):
+        """Test years are clamped to the data bounds like FilterSpec does."""
+        spec = FilterSpec.from_inputs((1850, 2030), ["Drama"], None, None, year_bounds=(1941, 1996))
+
+        assert canonical_args("get_genre_trends", ((1850, 2030), ["Drama"]), year_bounds=(1941, 1996)) == (spec.year_range, list(spec.genres))
+
+
+class TestDataServiceCacheKeys:
+    """Test equivalent filters share one cache entry and query."""
+
+    def test_genre_order_shares_cache_entry(self):
+        """Test the same genres in another order are served from the cache."""
+        with patch('services.data_service.get_bigquery_client', return_value=Mock()):
+            service = DataService(
+                credentials={},
+                project_id="test-project",
+                dataset_id="test-dataset",
+                tables_ids={"year_genre_aggregates": "year_genre_aggregates_table"},
+                cache_instance=SimpleCache(),
+            )
+        job = Mock()
+        job.result.return_value.total_rows = 1
+        job.result.return_value.to_arrow.return_value = pa.Table.from_pandas(pd.DataFrame({'release_year': [2000], 'genre': ['Drama']}))
+        service.client.query.return_value = job
+
+        first = service.get_genre_trends([2000, 2010], ["Drama", "Action"])
+        second = service.get_genre_trends((2000, 2010), ["Action", "Drama"])
+
+        assert first.equals(second)
+        assert service.client.query.call_count == 1
+
+    def test_warmed_entries_serve_default_request(self, parquet_dir, sample_tables):
+        """Test the warm-up caches what the callbacks ask for by default, even though the data has fewer years than the sidebar."""
+        with patch('services.data_service.get_bigquery_client', side_effect=RuntimeError("no credentials")):
+            service = DataService({}, "test-project", "test-dataset", {name: name for name in sample_tables}, cache_instance=SimpleCache(), backend="parquet", parquet_dir=parquet_dir)
+        default_filters = {"year_range": [MIN_YEAR, MAX_YEAR], "rating_range": [MIN_RATING, MAX_RATING], "runtime_range": [RUNTIME_MIN, RUNTIME_MAX]}
+        CacheWarmer(service, top_n_movies=TOP_N_MOVIES, min_votes=MIN_VOTES_THRESHOLD).run([{**default_filters, "genres": GENRES}])
+
+        spec = _filter_spec(service, (MIN_YEAR, MAX_YEAR), GENRES, [MIN_RATING, MAX_RATING], [RUNTIME_MIN, RUNTIME_MAX])
+        methods = ("get_top_movies", "get_genre_trends", "get_runtime_distribution", "get_yearly_trends")
+        hits = {method: CACHE_LOOKUPS.value(method, "hit") for method in methods}
+        with patch.object(service, "_query_backend") as query_backend:
+            frames = service.get_dashboard_bundle(_chart_filters(spec))
+
+        assert spec.year_range == (1941, 1996)
+        query_backend.assert_not_called()
+        # Exact hits, not results derived from a wider cached entry
+        assert all(CACHE_LOOKUPS.value(method, "hit") == hits[method] + 1 for method in methods)
+        assert not frames["top_movies"].is_empty()
+
+    def test_year_bounds_kept_in_memory(self, parquet_dir, sample_tables):
+        """Test clamping reads the year bounds from memory instead of looking up get_year_range per query, until they're due again."""
+        with patch('services.data_service.get_bigquery_client', side_effect=RuntimeError("no credentials")):
+            service = DataService({}, "test-project", "test-dataset", {name: name for name in sample_tables}, cache_instance=SimpleCache(), backend="parquet", parquet_dir=parquet_dir)
+        service.get_yearly_trends((1900, 2000))
+        lookups = {result: CACHE_LOOKUPS.value("get_year_range", result) for result in ("hit", "miss")}
+
+        for year_range in [(1900, 2000), (1950, 1990), (1900, 1960)]:
+            _filter_spec(service, year_range)
+            service.get_yearly_trends(year_range)
+
+        assert {result: CACHE_LOOKUPS.value("get_year_range", result) for result in lookups} == lookups
+        assert service.year_bounds() == (1941, 1996)
+
+        with patch('services.data_service.time.monotonic', return_value=10 ** 12):
+            service.year_bounds()
+        assert CACHE_LOOKUPS.value("get_year_range", "hit") == lookups["hit"] + 1
@@ -0,0 +1,87 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from services.job_ledger import JobLedger
+
+
+def make_job(bytes_billed=0, slot_millis=0, cache_hit=False, queue_seconds=1, run_seconds=2):
+    """Mock a finished BigQuery QueryJob with statistics."""
+    created = datetime(2024, 1, 1)
+    job = Mock()
+    job.job_id = "job-1"
+    job.cache_hit = cache_hit
+    job.total_bytes_processed = bytes_billed
+    job.total_bytes_billed = bytes_billed
+    job.slot_millis = slot_millis
+    job.created = created
+    job.started = created + timedelta(seconds=queue_seconds)
+    job.ended = job.started + timedelta(seconds=run_seconds)
+    return job
+
+
+class TestJobLedger:
+    """Test recording and summarizing BigQuery job statistics."""
+
+    def test_record(self):
+        """Test the job statistics are recorded with the method and fingerprint."""
+        ledger = JobLedger()
+
+        entry = ledger.record("get_top_movies", "abc", make_job(bytes_billed=1000, slot_millis=50), rows=10)
+
+        assert ledger.entries() == [entry]
+        assert entry["method"] == "get_top_movies"
+        assert entry["fingerprint"] == "abc"
+        assert entry["total_bytes_billed"] == 1000
+        assert entry["slot_millis"] == 50
+        assert entry["queue_seconds"] == 1
+        assert entry["run_seconds"] == 2
+        assert entry["rows"] == 10
+
+    def test_missing_statistics(self):
+        """Test statistics the job doesn't report are recorded as None."""
+        job = Mock()  # Attributes aren't ints or datetimes
+        entry = JobLedger().record("get_year_range", "abc", job)
+
+        assert entry["total_bytes_billed"] is None
+        assert entry["queue_seconds"] is None
+        json.dumps(entry)
+
+    def test_ring_buffer(self):
+        """Test only the most recent jobs are kept in memory."""
+        ledger = JobLedger(max_entries=2)
+        for fingerprint in ("a", "b", "c"):
+            ledger.record("get_yearly_trends", fingerprint, make_job())
+
+        assert [entry["fingerprint"] for entry in ledger.entries()] == ["b", "c"]
+
+    def test_file(self, tmp_path):
+        """Test jobs are appended to the ledger file."""
+        path = tmp_path / "jobs.jsonl"
+        ledger = JobLedger(path=str(path))
+        ledger.record("get_top_movies", "a", make_job())
+        ledger.record("get_top_movies", "b", make_job())
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["fingerprint"] for line in lines] == ["a", "b"]
+
+    def test_summary(self):
+        """Test jobs are aggregated per query shape and ranked by cost."""
+        ledger = JobLedger()
+        ledger.record("get_top_movies", "top", make_job(bytes_billed=100, cache_hit=False))
+        ledger.record("get_top_movies", "top", make_job(bytes_billed=0, cache_hit=True))
+        ledger.record("get_yearly_trends", "yearly", make_job(bytes_billed=10, slot_millis=500))
+
+        summary = ledger.summary()
+        assert [shape["fingerprint"] for shape in summary] == ["top", "yearly"]
+        assert summary[0]["jobs"] == 2
+        assert summary[0]["total_bytes_billed"] == 100
+        assert summary[0]["cache_hit_ratio"] == 0.5
+        assert summary[0]["avg_run_seconds"] == 2
+        assert ledger.summary(by="slot_millis")[0]["fingerprint"] == "yearly"
+        assert len(ledger.summary(top_n=1)) == 1
+
+    def test_summary_unknown_metric(self):
+        """Test ranking by an unknown metric is rejected."""
+        with pytest.raises(ValueError):
+            JobLedger().summary(by="cost")
@@ -0,0 +1,225 @@
+import asyncio
+import threading
+import time
+import pytest
+import pandas as pd
+import flask
+import pyarrow as pa
+from unittest.mock import Mock, patch
+from cachelib import SimpleCache
+from dashboard.callbacks import _fetch_latest
+from dashboard.layout import create_dashboard
+from services.data_service import DataService
+from services.job_tracker import JobTracker, JobScope, QueryCancelledError, current_scope
+
+
+class TestJobTracker:
+    """Test superseding requests per session and chart."""
+
+    def test_newer_request_cancels_running_jobs(self):
+        """Test a newer request of the same session and chart cancels the older request's jobs."""
+        tracker = JobTracker()
+        job = Mock()
+
+        with tracker.track("session", "top_movies") as older:
+            older.attach(job)
+            with tracker.track("session", "top_movies") as newer:
+                assert older.superseded
+                assert not newer.superseded
+
+        job.cancel.assert_called_once()
+
+    def test_other_sessions_and_charts_are_independent(self):
+        """Test requests of other sessions or charts don't supersede each other."""
+        tracker = JobTracker()
+
+        with tracker.track("session", "top_movies") as scope:
+            with tracker.track("other-session", "top_movies"), tracker.track("session", "genre_trends"):
+                pass
+            assert not scope.superseded
+
+    def test_job_attached_after_supersede_is_cancelled(self):
+        """Test a job submitted by an already superseded request is cancelled immediately."""
+        scope = JobScope()
+        scope.supersede()
+        job = Mock()
+
+        assert not scope.attach(job)
+        job.cancel.assert_called_once()
+
+    def test_untracked_session(self):
+        """Test requests without a session ID run without a scope."""
+        tracker = JobTracker()
+
+        with tracker.track(None, "top_movies") as scope:
+            assert scope is None
+            assert current_scope() is None
+
+    def test_finished_requests_are_forgotten(self):
+        """Test the scope is released when the request finishes."""
+        tracker = JobTracker()
+
+        with tracker.track("session", "top_movies") as scope:
+            assert current_scope() is scope
+
+        assert current_scope() is None
+        assert not tracker._scopes
+
+
+
+class TestTabSessions:
+    """Test superseded queries are cancelled per browser tab."""
+
+    @staticmethod
+    def _load_tab():
+        """Session ID of a newly loaded tab, from its session-id store."""
+        store = next(child for child in create_dashboard().children if getattr(child, "id", None) == "session-id")
+        assert store.storage_type == "memory"
+        return store.data
+
+    def _fetch_concurrently(self, first_tab, second_tab):
+        """Fetch the top movies in the second tab while the first tab's fetch runs, returning whether the first was superseded."""
+        data_service = Mock(job_tracker=JobTracker())
+        superseded = []
+
+        def first_fetch():
+            _fetch_latest(data_service, second_tab, "top_movies", Mock())
+            superseded.append(current_scope().superseded)
+
+        # Both tabs send the same browser cookie
+        with flask.Flask(__name__).test_request_context(headers={"Cookie": "imdb_session_id=shared"}):
+            _fetch_latest(data_service, first_tab, "top_movies", first_fetch)
+        return superseded[0]
+
+    def test_tabs_do_not_cancel_each_other(self):
+        """Test two tabs of the same browser fetching the same chart don't supersede each other."""
+        first_tab, second_tab = self._load_tab(), self._load_tab()
+
+        assert first_tab != second_tab
+        assert not self._fetch_concurrently(first_tab, second_tab)
+
+    def test_newer_request_of_the_tab_supersedes(self):
+        """Test a newer request of the same tab still supersedes the older one."""
+        tab = self._load_tab()
+
+        assert self._fetch_concurrently(tab, tab)
+
+class TestDataServiceCancellation:
+    """Test superseded queries are cancelled through the BigQuery job API."""
+
+    @pytest.fixture
+    def service(self):
+        with patch('services.data_service.get_bigquery_client', return_value=Mock()):
+            return DataService(
+                credentials={},
+                project_id="test-project",
+                dataset_id="test-dataset",
+                tables_ids={"yearly_aggregates": "yearly_aggregates_table"},
+                cache_instance=SimpleCache(),
+            )
+
+    @staticmethod
+    def blocking_job():
+        """Mock a query job whose result blocks until the job is cancelled."""
+        job = Mock()
+        job.submitted = threading.Event()
+        cancelled = threading.Event()
+        job.cancel.side_effect = cancelled.set
+
+        def result():
+            job.submitted.set()
+            cancelled.wait(5)
+            raise Exception("Job execution was cancelled")
+
+        job.result.side_effect = result
+        return job
+
+    def test_superseded_query_is_cancelled_and_not_cached(self, service):
+        """Test a request superseded mid-query raises QueryCancelledError and caches nothing."""
+        job = self.blocking_job()
+        service.client.query.return_value = job
+        errors = []
+
+        def older_request():
+            try:
+                with service.job_tracker.track("session", "yearly_trends"):
+                    service.get_yearly_trends((2000, 2000))
+            except QueryCancelledError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=older_request)
+        thread.start()
+        assert job.submitted.wait(5)
+        with service.job_tracker.track("session", "yearly_trends"):
+            pass
+        thread.join(5)
+
+        job.cancel.assert_called_once()
+        assert len(errors) == 1
+        assert service.cache.get(service._get_cache_key("get_yearly_trends", (2000, 2000))) is None
+
+    def test_waiter_of_cancelled_query_runs_it_again(self, service):
+        """Test another session sharing a cancelled in-flight query gets a result of its own."""
+        job = self.blocking_job()
+        second_job = Mock()
+        second_job.result.return_value.total_rows = 1
+        second_job.result.return_value.to_arrow.return_value = pa.Table.from_pandas(pd.DataFrame({'release_year': [2000]}))
+        service.client.query.side_effect = [job, second_job]
+        results = {}
+
+        def request(session_id):
+            try:
+                with service.job_tracker.track(session_id, "yearly_trends"):
+                    results[session_id] = service.get_yearly_trends((2000, 2000))
+            except QueryCancelledError:
+                results[session_id] = None
+
+        leader = threading.Thread(target=request, args=("session",))
+        leader.start()
+        assert job.submitted.wait(5)
+        waiter = threading.Thread(target=request, args=("other-session",))
+        waiter.start()
+        time.sleep(0.1)  # let the waiter join the in-flight call
+        with service.job_tracker.track("session", "yearly_trends"):
+            leader.join(5)
+        waiter.join(5)
+
+        assert results["session"] is None
+        assert results["other-session"]["release_year"].to_list() == [2000]
+
+    def test_bundle_drops_superseded_charts(self, service):
+        """Test superseded charts are left out of a bundle."""
+        def get_yearly_trends(year_range):
+            raise QueryCancelledError("superseded")
+
+        service.get_yearly_trends = get_yearly_trends
+        service.get_runtime_distribution = Mock(return_value=pd.DataFrame())
+
+        bundle = service.get_dashboard_bundle(
+            {"year_range": (2000, 2000), "runtime_range": (0, 300)}, charts=["yearly_trends", "runtime_distribution"], session_id="session"
+        )
+
+        assert list(bundle) == ["runtime_distribution"]
+
+    def test_async_query_stops_polling_when_superseded(self, service):
+        """Test an async request superseded while its job is polled is cancelled."""
+        job = Mock()
+        job.done.return_value = False
+        service.client.query.return_value = job
+
+        async def main():
+            async def older_request():
+                with service.job_tracker.track("session", "yearly_trends"):
+                    return await service.aget_yearly_trends((2000, 2000))
+
+            task = asyncio.ensure_future(older_request())
+            while not job.done.called:
+                await asyncio.sleep(0.001)
+            with service.job_tracker.track("session", "yearly_trends"):
+                pass
+            with pytest.raises(QueryCancelledError):
+                await task
+
+        with patch('services.data_service.QUERY_POLL_INTERVAL', 0.001):
+            asyncio.run(main())
+        job.cancel.assert_called_once()
@@ -0,0 +1,124 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from benchmarks.load_test import Callback, layout_values, summarize, _percentile, _Pool
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class TestCallback:
+    """Test the callbacks read from /_dash-dependencies."""
+
+    def test_multi_output_payload(self):
+        """Test multi-output keys are split and the payload carries the current values."""
+        callback = Callback({
+            "output": "..chart.figure...chart-loading.visible..",
+            "inputs": [{"id": "store", "property": "data"}],
+            "state": [{"id": "chart", "property": "figure"}],
+        })
+
+        payload = callback.payload({("store", "data"): {"a": 1}}, {("store", "data")})
+
+        assert callback.outputs == [("chart", "figure"), ("chart-loading", "visible")]
+        assert callback.label == "chart.figure"
+        assert payload["outputs"] == [{"id": "chart", "property": "figure"}, {"id": "chart-loading", "property": "visible"}]
+        assert payload["inputs"] == [{"id": "store", "property": "data", "value": {"a": 1}}]
+        assert payload["state"] == [{"id": "chart", "property": "figure", "value": None}]
+        assert payload["changedPropIds"] == ["store.data"]
+
+    def test_single_output_payload(self):
+        """Test a single output is sent as an object."""
+        callback = Callback({"output": "store.data", "inputs": [{"id": "url", "property": "pathname"}], "state": []})
+
+        assert callback.payload({}, set())["outputs"] == {"id": "store", "property": "data"}
+
+
+class TestLayoutValues:
+    """Test reading the initial property values of a serialized layout."""
+
+    def test_nested_components(self):
+        """Test the props of nested components with IDs are collected, without their children."""
+        layout = {"type": "Div", "namespace": "dash_html_components", "props": {"children": [
+            {"type": "RangeSlider", "namespace": "dash_core_components", "props": {"id": "slider", "min": 0, "max": 10, "value": [0, 10]}},
+            {"type": "Div", "namespace": "dash_html_components", "props": {"children": "text"}},
+        ]}}
+
+        values = layout_values(layout)
+
+        assert values == {("slider", "id"): "slider", ("slider", "min"): 0, ("slider", "max"): 10, ("slider", "value"): [0, 10]}
+
+
+class TestSummary:
+    """Test the latency and saturation summary."""
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles."""
+        values = [float(i) for i in range(1, 101)]
+        assert _percentile(values, 50) == 50.0
+        assert _percentile(values, 99) == 99.0
+        assert _percentile([], 50) is None
+
+    def test_summarize(self):
+        """Test requests are counted per callback and status."""
+        records = [
+            {"callback": "a", "status": 200, "latency": 0.1, "wait": 0.0, "queued": False},
+            {"callback": "a", "status": 204, "latency": 0.2, "wait": 0.1, "queued": True},
+            {"callback": "b", "status": 500, "latency": 0.3, "wait": 0.0, "queued": False},
+        ]
+
+        summary = summarize(records, 1.5, _Pool(4, enforce=True))
+
+        assert summary["throughput"] == 2.0
+        assert summary["callbacks"]["a"]["updated"] == 1
+        assert summary["callbacks"]["a"]["prevented"] == 1
+        assert summary["callbacks"]["b"]["errors"] == 1
+        assert summary["pool"]["queued_ratio"] == 1 / 3
+
+
+class TestPool:
+    """Test the simulated server slots."""
+
+    def test_waits_for_free_slot(self):
+        """Test a request waits while all slots are busy."""
+        pool = _Pool(1, enforce=True)
+        released = threading.Event()
+        results = []
+
+        def _second():
+            with pool.slot() as (wait, queued):
+                results.append(queued)
+
+        with pool.slot() as (_, queued):
+            assert not queued
+            thread = threading.Thread(target=_second)
+            thread.start()
+            released.wait(0.05)
+        thread.join()
+
+        assert results == [True]
+        assert pool.max_in_flight == 1
+        assert pool.saturated_seconds > 0
+
+
+class TestLoadTest:
+    """Test the load test end to end against the stand-in app."""
+
+    def test_writes_report(self, tmp_path):
+        """Test the sessions load the dashboard and the report covers the callbacks."""
+        output = tmp_path / "report.json"
+        env = {**os.environ, "LOAD_TEST_MOVIES": "1000", "LOAD_TEST_LATENCY": "0", "LOAD_TEST_JITTER": "0"}
+
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.load_test", "--sessions", "2", "--actions", "2",
+             "--think-time", "0", "--ramp-up", "0", "--output", str(output)],
+            cwd=ROOT, env=env, check=True, capture_output=True, timeout=300,
+        )
+
+        report = json.loads(output.read_text())
+        assert report["requests"] > 0
+        assert "top-movies-cache.data" in report["callbacks"]
+        assert all(stats["errors"] == 0 for stats in report["callbacks"].values())
+        assert report["pool"]["capacity"] == 16
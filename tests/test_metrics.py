@@ -0,0 +1,54 @@
+from utils.metrics import Registry
+
+
+class TestRegistry:
+    """Test the Prometheus text rendering of the metrics registry."""
+
+    def test_counter(self):
+        """Test counters are rendered per label set."""
+        registry = Registry()
+        counter = registry.counter("lookups_total", "Cache lookups", ("method", "result"))
+
+        counter.inc("get_top_movies", "hit")
+        counter.inc("get_top_movies", "hit")
+        counter.inc("get_top_movies", "miss")
+
+        output = registry.render()
+        assert "# TYPE lookups_total counter" in output
+        assert 'lookups_total{method="get_top_movies",result="hit"} 2' in output
+        assert 'lookups_total{method="get_top_movies",result="miss"} 1' in output
+
+    def test_histogram(self):
+        """Test histogram buckets are cumulative and end with +Inf, sum and count."""
+        registry = Registry()
+        histogram = registry.histogram("duration_seconds", "Durations", ("method",), buckets=(0.1, 1.0))
+
+        histogram.observe(0.05, "m")
+        histogram.observe(0.5, "m")
+        histogram.observe(5, "m")
+
+        output = registry.render()
+        assert 'duration_seconds_bucket{method="m",le="0.1"} 1' in output
+        assert 'duration_seconds_bucket{method="m",le="1"} 2' in output
+        assert 'duration_seconds_bucket{method="m",le="+Inf"} 3' in output
+        assert 'duration_seconds_sum{method="m"} 5.55' in output
+        assert 'duration_seconds_count{method="m"} 3' in output
+
+    def test_callback_and_escaping(self):
+        """Test callback metrics are read at render time and label values are escaped."""
+        registry = Registry()
+        values = {"bytes": 10}
+        registry.callback("cache_bytes", "Cache bytes", lambda: values["bytes"])
+        registry.counter("labelled_total", "Labelled", ("name",)).inc('a"b')
+
+        values["bytes"] = 20
+        output = registry.render()
+        assert "cache_bytes 20" in output
+        assert 'labelled_total{name="a\\"b"} 1' in output
+
+    def test_registering_twice_returns_same_metric(self):
+        """Test a metric registered twice keeps its values."""
+        registry = Registry()
+        registry.counter("calls_total", "Calls").inc()
+
+        assert registry.counter("calls_total", "Calls").value() == 1
@@ -0,0 +1,132 @@
+import pytest
+import polars as pl
+from unittest.mock import Mock, patch
+from services.parquet_backend import ParquetBackend
+from services.data_service import DataService
+from services import bigquery_backend
+
+TABLE_NAMES = ['movies_details', 'year_genre_aggregates', 'yearly_aggregates', 'runtime_distribution']
+
+
+@pytest.fixture
+def backend(parquet_dir):
+    """ParquetBackend reading the sample snapshots."""
+    return ParquetBackend(parquet_dir, TABLE_NAMES)
+
+
+class TestParquetBackend:
+    """Test ParquetBackend queries against local snapshots."""
+
+    def test_top_movies_order_and_limit(self, backend):
+        """Test top movies are ordered by rating then votes and limited."""
+        result = backend.get_top_movies((1900, 2025), [], (0, 10), None, 3, 0)
+
+        assert result["movie_title"].to_list() == ['The Godfather', 'Alien', 'Heat']
+        assert result.columns == ['movie_title', 'release_year', 'genres', 'runtime_minutes', 'is_adult', 'average_rating', 'total_votes']
+
+    def test_top_movies_filters(self, backend):
+        """Test genre, runtime, votes and adult flag handling."""
+        result = backend.get_top_movies((1900, 2025), ['Mystery'], (7.0, 10.0), (100, 120), 10, 100000)
+
+        assert sorted(result["movie_title"].to_list()) == ['Citizen Kane', 'Scream']
+        assert result.filter(pl.col("movie_title") == 'Scream')["is_adult"][0] == 'Yes'
+
+    def test_year_range_ignores_unrated(self, backend):
+        """Test year range only considers rated movies."""
+        result = backend.get_year_range()
+
+        assert (result["min_year"][0], result["max_year"][0]) == (1941, 1996)
+
+    def test_unique_genres(self, backend):
+        """Test distinct sorted genres."""
+        assert backend.get_unique_genres()["genre"].to_list() == ['Action', 'Crime', 'Drama', 'Horror']
+
+    def test_genre_trends(self, backend):
+        """Test genre trends filtered by year and genre."""
+        result = backend.get_genre_trends((1970, 1995), ['Drama'])
+
+        assert result["release_year"].to_list() == [1972, 1995]
+
+    def test_runtime_distribution(self, backend):
+        """Test runtime bins fully inside the range."""
+        result = backend.get_runtime_distribution((60, 150))
+
+        assert result["runtime_bin"].to_list() == ['60-90', '90-120']
+
+    def test_yearly_trends(self, backend):
+        """Test yearly trends filtered by year."""
+        assert backend.get_yearly_trends((1979, 1995))["release_year"].to_list() == [1979, 1995]
+
+    def test_missing_snapshot(self, tmp_path):
+        """Test a missing snapshot raises instead of returning empty data."""
+        backend = ParquetBackend(str(tmp_path), TABLE_NAMES)
+
+        with pytest.raises(FileNotFoundError):
+            backend.get_yearly_trends((1990, 2000))
+
+
+class TestDataServiceBackendSelection:
+    """Test DataService backend configuration."""
+
+    def _create_service(self, parquet_dir, client=None, side_effect=None):
+        with patch('services.data_service.get_bigquery_client', return_value=client, side_effect=side_effect):
+            return DataService(
+                credentials={},
+                project_id="test-project",
+                dataset_id="test-dataset",
+                tables_ids={name: f"{name}_table" for name in TABLE_NAMES},
+                backend="parquet",
+                parquet_dir=parquet_dir,
+            )
+
+    def test_parquet_backend_without_credentials(self, parquet_dir):
+        """Test the local backend works when no BigQuery client can be created."""
+        service = self._create_service(parquet_dir, side_effect=RuntimeError("no credentials"))
+
+        assert service.client is None
+        assert service.get_year_range() == (1941, 1996)
+
+    def test_fallback_to_warehouse(self, tmp_path):
+        """Test missing snapshots fall back to BigQuery."""
+        client = Mock()
+        client.query.return_value.result.return_value.total_rows = 1
+        client.query.return_value.result.return_value.to_arrow.return_value = pl.DataFrame({'genre': ['Drama']}).to_arrow()
+        service = self._create_service(str(tmp_path), client=client)
+
+        assert service.get_unique_genres() == ['Drama']
+        assert client.query.called
+
+    def test_unknown_backend(self):
+        """Test an invalid backend name is rejected."""
+        with pytest.raises(ValueError):
+            DataService(credentials={}, project_id="p", dataset_id="d", tables_ids={}, backend="duckdb")
+
+
+class TestSnapshotExport:
+    """Test exporting the warehouse tables as Parquet snapshots."""
+
+    def test_export_command(self, tmp_path, sample_tables):
+        """Test the export command writes snapshots the ParquetBackend reads."""
+        def query(sql, job_config=None):
+            table_name = next(name for name in TABLE_NAMES if f"`p.d.{name}_table`" in sql)
+            job = Mock(job_id=table_name)
+            job.result.return_value.total_rows = len(sample_tables[table_name])
+            job.result.return_value.to_arrow.return_value = sample_tables[table_name].to_arrow()
+            return job
+
+        client = Mock()
+        client.query.side_effect = query
+        with patch('services.data_service.get_bigquery_client', return_value=client), \
+             patch.object(bigquery_backend, 'PROJECT_ID', "p"), patch.object(bigquery_backend, 'DATASET_ID', "d"), \
+             patch.object(bigquery_backend, 'TABLES_IDS', {name: f"{name}_table" for name in TABLE_NAMES}):
+            paths = bigquery_backend.main(["export", "--dir", str(tmp_path / "snapshots")])
+
+        assert paths == [str(tmp_path / "snapshots" / f"{name}.parquet") for name in TABLE_NAMES]
+        backend = ParquetBackend(str(tmp_path / "snapshots"), TABLE_NAMES)
+        assert backend.get_year_range().row(0) == (1941, 1996)
+        assert pl.read_parquet(paths[0]).equals(sample_tables['movies_details'])
+
+    def test_requires_command(self):
+        """Test running the module without a command is rejected."""
+        with pytest.raises(SystemExit):
+            bigquery_backend.main([])
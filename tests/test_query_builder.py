@@ -0,0 +1,53 @@
+from services.query_builder import Query, top_movies_query, genre_trends_query, table_query
+
+
+class TestQueryBuilder:
+    """Test parameterized statements and their fingerprints."""
+
+    def test_values_are_parameters(self):
+        """Test filter values are passed as parameters instead of SQL literals."""
+        query = top_movies_query("project.dataset.movies", (2000, 2010), ["Drama"], (5, 10), (60, 180), 20, 1000)
+
+        assert "2000" not in query.sql and "Drama" not in query.sql
+        assert query.params == {
+            "year_min": 2000, "year_max": 2010, "rating_min": 5.0, "rating_max": 10.0,
+            "min_votes": 1000, "limit": 20, "genres": ["Drama"], "runtime_min": 60, "runtime_max": 180,
+        }
+
+    def test_same_shape_same_fingerprint(self):
+        """Test statements differing only in values share a fingerprint."""
+        first = genre_trends_query("t", (2000, 2010), ["Drama"])
+        second = genre_trends_query("t", (1990, 2020), ["Comedy", "Action"])
+
+        assert first.fingerprint == second.fingerprint
+        assert first.params != second.params
+
+    def test_optional_filters_change_shape(self):
+        """Test applying an optional filter changes the fingerprint."""
+        assert genre_trends_query("t", (2000, 2010), []).fingerprint != genre_trends_query("t", (2000, 2010), ["Drama"]).fingerprint
+
+    def test_genres_are_canonical(self):
+        """Test genre click order and duplicates don't change the query."""
+        first = top_movies_query("t", (2000, 2010), ["Drama", "Action"], (5, 10), None, 20, 1000)
+        second = top_movies_query("t", (2000, 2010), ["Action", "Drama", "Action"], (5, 10), None, 20, 1000)
+
+        assert first == second
+        assert first.params["genres"] == ["Action", "Drama"]
+
+    def test_query_parameters_types(self):
+        """Test parameters map to BigQuery types."""
+        query = top_movies_query("t", (2000, 2010), ["Drama"], (5, 10), None, 20, 1000)
+        types = {
+            param.name: getattr(param, "type_", None) or param.array_type
+            for param in query.query_parameters()
+        }
+
+        assert types == {
+            "genres": "STRING", "limit": "INT64", "min_votes": "INT64",
+            "rating_max": "FLOAT64", "rating_min": "FLOAT64", "year_max": "INT64", "year_min": "INT64",
+        }
+
+    def test_fingerprint_ignores_whitespace(self):
+        """Test reformatting the SQL doesn't change the fingerprint."""
+        assert Query("SELECT  a\n FROM t").fingerprint == Query("SELECT a FROM t").fingerprint
+        assert table_query("t").params == {}
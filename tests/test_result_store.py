@@ -0,0 +1,97 @@
+from unittest.mock import Mock
+import polars as pl
+from services.result_store import ResultStore
+from dashboard.callbacks import _load_result
+
+
+class TestResultStore:
+    """Test the server-side store of chart results."""
+
+    def setup_method(self):
+        self.store = ResultStore()
+        self.df = pl.DataFrame({"release_year": [2000, 2001], "total_movies": [10, 20]})
+
+    def test_put_get(self):
+        """Test a stored frame is read back from its handle."""
+        handle = self.store.put("key", self.df)
+
+        assert handle["cache_key"] == "key"
+        assert self.store.get(handle).equals(self.df)
+
+    def test_frames_are_kept_by_reference(self):
+        """Test frames aren't serialized or copied into the store."""
+        handle = self.store.put("key", self.df)
+
+        assert self.store.get(handle) is self.df
+
+    def test_version_follows_data_generation(self):
+        """Test fetches of the same filters share a version until the data is refreshed, and an explicit version is kept."""
+        first = self.store.put("key", self.df)
+        second = self.store.put("key", self.df)
+        refreshed = self.store.put("key", self.df, generation=1)
+
+        assert first == second
+        assert refreshed["version"] != first["version"]
+        assert self.store.put("other", self.df)["version"] != first["version"]
+        assert self.store.put("key", self.df, version="v1")["version"] == "v1"
+
+    def test_handle_is_small(self):
+        """Test the handle doesn't carry the data."""
+        handle = self.store.put("key", pl.DataFrame({"movie_title": [f"Movie {i}" for i in range(10000)]}))
+
+        assert set(handle) == {"cache_key", "version"}
+
+    def test_byte_budget(self):
+        """Test frames beyond the byte budget are evicted."""
+        store = ResultStore(max_bytes=64 * 1024, shards=1)
+        df = pl.DataFrame({"total_movies": range(4096)})
+        handles = [store.put(f"key{i}", df) for i in range(10)]
+
+        assert store.stats()["bytes"] <= 64 * 1024
+        assert store.get(handles[0]) is None
+        assert store.get(handles[-1]) is df
+
+    def test_missing(self):
+        """Test unknown, empty and evicted handles read as None."""
+        handle = self.store.put("key", self.df)
+        self.store.cache.clear()
+
+        assert self.store.get(handle) is None
+        assert self.store.get({"cache_key": "key", "version": None}) is None
+        assert self.store.get(None) is None
+
+    def test_cache_errors(self):
+        """Test cache errors don't fail the callbacks."""
+        self.store.cache = Mock()
+        self.store.cache.set.side_effect = RuntimeError("down")
+        self.store.cache.get.side_effect = RuntimeError("down")
+
+        handle = self.store.put("key", self.df)
+        assert self.store.get(handle) is None
+
+
+class TestLoadResult:
+    """Test reading a chart's result in the render callbacks."""
+
+    def test_fetches_missing_result_again(self):
+        """Test a result the store doesn't have is fetched with the handle's filters and stored under the same handle."""
+        store = ResultStore()
+        df = pl.DataFrame({"release_year": [2000], "total_movies": [10]})
+        filters = {"year_range": [2000, 2010], "selected_genres": [], "rating_threshold": None, "runtime_range": None}
+        handle = {"cache_key": "key", "version": "v1", "chart": "yearly_trends", "filters": filters}
+        data_service = Mock()
+        data_service.get_dashboard_bundle.return_value = {"yearly_trends": df}
+
+        assert _load_result(store, data_service, handle).equals(df)
+        data_service.get_dashboard_bundle.assert_called_once_with(filters, charts=["yearly_trends"])
+        assert store.get(handle).equals(df)
+
+    def test_reads_stored_result(self):
+        """Test a stored result is read without fetching it."""
+        store = ResultStore()
+        df = pl.DataFrame({"release_year": [2000]})
+        handle = {**store.put("key", df), "chart": "yearly_trends", "filters": {}}
+        data_service = Mock()
+
+        assert _load_result(store, data_service, handle).equals(df)
+        data_service.get_dashboard_bundle.assert_not_called()
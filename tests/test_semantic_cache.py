@@ -0,0 +1,119 @@
+import pytest
+import polars as pl
+from unittest.mock import patch
+from cachelib import SimpleCache
+from services.data_service import DataService
+from services.parquet_backend import ParquetBackend
+from services.semantic_cache import SemanticCache, TopMoviesPredicate, GenreTrendsPredicate
+
+TABLE_NAMES = ['movies_details', 'year_genre_aggregates', 'yearly_aggregates', 'runtime_distribution']
+
+
+@pytest.fixture
+def backend(parquet_dir):
+    """ParquetBackend reading the sample snapshots."""
+    return ParquetBackend(parquet_dir, TABLE_NAMES)
+
+
+@pytest.fixture
+def data_service(parquet_dir):
+    """DataService over the sample snapshots with an in-memory cache."""
+    with patch('services.data_service.get_bigquery_client', side_effect=RuntimeError("no credentials")):
+        return DataService(
+            credentials={}, project_id="p", dataset_id="d",
+            tables_ids={name: name for name in TABLE_NAMES},
+            cache_instance=SimpleCache(), backend="parquet", parquet_dir=parquet_dir
+        )
+
+
+class TestPredicateContainment:
+    """Test predicate containment rules."""
+
+    def test_genre_trends_containment(self):
+        """Test narrower year ranges and genre subsets are contained."""
+        wide = GenreTrendsPredicate.from_args((1990, 2020), ['Action', 'Drama'])
+
+        assert wide.contains(GenreTrendsPredicate.from_args((2000, 2010), ['Drama']))
+        assert not wide.contains(GenreTrendsPredicate.from_args((1980, 2010), ['Drama']))
+        assert not wide.contains(GenreTrendsPredicate.from_args((2000, 2010), []))
+        assert GenreTrendsPredicate.from_args((1990, 2020), []).contains(wide)
+
+    def test_top_movies_containment(self):
+        """Test stricter rating, votes and runtime filters are contained."""
+        wide = TopMoviesPredicate.from_args((1900, 2025), [], [0, 10], None, 20, 1000)
+
+        assert wide.contains(TopMoviesPredicate.from_args((1990, 2000), ['Drama'], [5.0, 9.0], [60, 120], 20, 5000))
+        assert not wide.contains(TopMoviesPredicate.from_args((1990, 2000), [], [0, 10], None, 20, 500))
+        assert not TopMoviesPredicate.from_args((1900, 2025), [], [0, 10], [60, 120], 20, 1000).contains(wide)
+
+
+class TestTopMoviesAnswer:
+    """Test when a cached top-N answers a stricter request."""
+
+    def test_complete_result_answers_stricter_filter(self, backend):
+        """Test a cached result below its limit holds every matching row."""
+        wide = TopMoviesPredicate.from_args((1900, 2025), [], (0, 10), None, 10, 0)
+        narrow = TopMoviesPredicate.from_args((1900, 2025), ['Drama'], (0, 10), None, 10, 0)
+        cached = backend.get_top_movies((1900, 2025), [], (0, 10), None, 10, 0)
+
+        result = wide.answer(cached, narrow)
+        expected = backend.get_top_movies((1900, 2025), ['Drama'], (0, 10), None, 10, 0)
+
+        assert sorted(result["movie_title"].to_list()) == sorted(expected["movie_title"].to_list())
+
+    def test_truncated_result_with_enough_matches(self, backend):
+        """Test a truncated result answers when enough cached rows pass the filter."""
+        wide = TopMoviesPredicate.from_args((1900, 2025), [], (0, 10), None, 3, 0)
+        narrow = TopMoviesPredicate.from_args((1900, 2025), [], (8.4, 10), None, 2, 0)
+        cached = backend.get_top_movies((1900, 2025), [], (0, 10), None, 3, 0)
+
+        assert wide.answer(cached, narrow)["movie_title"].to_list() == ['Alien', 'The Godfather']
+
+    def test_truncated_result_with_too_few_matches(self, backend):
+        """Test a truncated result can't answer when rows below its cutoff may be missing."""
+        wide = TopMoviesPredicate.from_args((1900, 2025), [], (0, 10), None, 3, 0)
+        narrow = TopMoviesPredicate.from_args((1900, 2025), ['Horror'], (0, 10), None, 3, 0)
+        cached = backend.get_top_movies((1900, 2025), [], (0, 10), None, 3, 0)
+
+        assert wide.answer(cached, narrow) is None
+
+
+class TestDataServiceSemanticCache:
+    """Test DataService answers narrower filters from cached wider results."""
+
+    def test_narrower_genre_trends_not_queried(self, data_service):
+        """Test narrowing the year range and genres is answered locally."""
+        data_service.get_genre_trends((1900, 2025), [])
+
+        with patch.object(data_service.backend, 'get_genre_trends') as mock_query:
+            result = data_service.get_genre_trends((1970, 1995), ['Drama'])
+            mock_query.assert_not_called()
+
+        assert result["release_year"].to_list() == [1972, 1995]
+
+    def test_wider_request_queries_backend(self, data_service):
+        """Test widening the filter goes back to the backend."""
+        data_service.get_yearly_trends((1980, 1990))
+
+        with patch.object(data_service.backend, 'get_yearly_trends', return_value=pl.DataFrame()) as mock_query:
+            data_service.get_yearly_trends((1970, 1990))
+            mock_query.assert_called_once()
+
+    def test_top_movies_subset(self, data_service):
+        """Test a stricter top movies request is answered from cache."""
+        data_service.get_top_movies((1900, 2025), [], (0, 10), None, 20, 0)
+
+        with patch.object(data_service.backend, 'get_top_movies') as mock_query:
+            result = data_service.get_top_movies((1970, 2000), ['Horror'], (0, 10), (100, 200), 20, 0)
+            mock_query.assert_not_called()
+
+        assert result["movie_title"].to_list() == ['Scream', 'Alien']
+
+    def test_evicted_entry_is_forgotten(self):
+        """Test predicates of expired results are dropped."""
+        cache = SimpleCache()
+        semantic_cache = SemanticCache(cache)
+        semantic_cache.register("get_yearly_trends", ((1900, 2025),), "key", pl.DataFrame({'release_year': [1990]}))
+
+        assert semantic_cache.lookup("get_yearly_trends", ((1990, 2000),)) is None
+        assert not semantic_cache._entries["get_yearly_trends"]
@@ -0,0 +1,105 @@
+import polars as pl
+from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+from utils.sharded_lru_cache import ShardedLRUCache, estimate_size
+
+
+class TestShardedLRUCache:
+    """Test the byte-bounded in-process cache backend."""
+
+    def test_dataframes_stored_by_reference(self):
+        """Test cached DataFrames are returned as the same object, without pickling."""
+        cache = ShardedLRUCache(max_bytes=1024 ** 2, shards=4)
+        df = pl.DataFrame({"a": [1, 2, 3]})
+
+        cache.set("key", df)
+
+        assert cache.get("key") is df
+        assert cache.stats()["bytes"] == df.estimated_size()
+
+    def test_budget_evicts_least_recently_used(self):
+        """Test entries are evicted by bytes, least recently used first."""
+        df = pl.DataFrame({"a": list(range(1000))})  # 8000 bytes
+        cache = ShardedLRUCache(max_bytes=20000, shards=1)
+
+        cache.set("first", df)
+        cache.set("second", df)
+        cache.get("first")
+        cache.set("third", df)
+
+        assert cache.has("first") and cache.has("third")
+        assert not cache.has("second")
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= 20000
+
+    def test_small_values_count_less_than_large_frames(self):
+        """Test a two-value year range costs far less than a large result."""
+        assert estimate_size((1900, 2025)) < estimate_size(pl.DataFrame({"a": list(range(1000))}))
+
+    def test_oversized_value_is_not_cached(self):
+        """Test a value larger than a shard's budget doesn't flush the shard."""
+        cache = ShardedLRUCache(max_bytes=10000, shards=1)
+        cache.set("small", 1)
+
+        assert not cache.set("large", pl.DataFrame({"a": list(range(10000))}))
+        assert cache.get("small") == 1
+        assert cache.get("large") is None
+
+    def test_expiry(self):
+        """Test entries expire after their timeout."""
+        cache = ShardedLRUCache(default_timeout=10)
+        cache.set("key", 1)
+        cache.set("forever", 1, timeout=0)
+
+        with patch("utils.sharded_lru_cache.time.monotonic", return_value=10 ** 12):
+            assert cache.get("key") is None
+            assert cache.get("forever") == 1
+
+    def test_get_many_and_delete(self):
+        """Test the BaseCache helpers work on top of the shards."""
+        cache = ShardedLRUCache()
+        cache.set("key", "value")
+        cache.set("fresh", True)
+
+        assert cache.get_many("key", "fresh", "missing") == ["value", True, None]
+        assert cache.delete("key")
+        assert not cache.add("fresh", False)
+        assert cache.clear()
+        assert cache.stats()["entries"] == 0
+
+    def test_concurrent_access(self):
+        """Test concurrent writers keep the byte accounting consistent."""
+        cache = ShardedLRUCache(max_bytes=100000, shards=8)
+        frames = [pl.DataFrame({"a": list(range(i % 50 + 1))}) for i in range(400)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: (cache.set(f"key{i % 100}", frames[i]), cache.get(f"key{(i * 7) % 100}")), range(400)))
+
+        stats = cache.stats()
+        assert stats["bytes"] == sum(shard.size for shard in cache._shards)
+        assert stats["bytes"] == sum(entry[2] for shard in cache._shards for entry in shard.entries.values())
+        assert stats["bytes"] <= 100000
+
+    def test_compressed_entries(self):
+        """Test large DataFrames are stored compressed and read back intact."""
+        cache = ShardedLRUCache(max_bytes=10 * 1024 ** 2, shards=1, compression="zstd", compression_threshold=1000)
+        df = pl.DataFrame({"movie_title": ["The Movie"] * 10000, "genres": ["Drama,Comedy"] * 10000})
+        small = pl.DataFrame({"a": [1]})
+
+        cache.set("large", df)
+        cache.set("small", small)
+
+        assert cache.get("large").equals(df)
+        assert cache.get("small") is small
+        stats = cache.stats()
+        assert stats["raw_bytes"] == df.estimated_size() + small.estimated_size()
+        assert stats["bytes"] < df.estimated_size() / 10
+        assert stats["compression_ratio"] > 10
+
+    def test_compression_applies_to_budget(self):
+        """Test a frame too large uncompressed can be cached when it compresses into the budget."""
+        df = pl.DataFrame({"genres": ["Drama"] * 100000})
+        cache = ShardedLRUCache(max_bytes=df.estimated_size() // 2, shards=1, compression="lz4", compression_threshold=0)
+
+        assert cache.set("key", df)
+        assert cache.get("key").equals(df)
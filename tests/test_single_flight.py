@@ -0,0 +1,212 @@
+import asyncio
+import threading
+import time
+import pytest
+import polars as pl
+from unittest.mock import Mock, patch
+from cachelib import SimpleCache
+from concurrent.futures import ThreadPoolExecutor
+from services.data_service import DataService
+from utils.single_flight import SingleFlight, AsyncSingleFlight, InFlightTimeoutError
+
+
+def run_concurrently(n, func):
+    """Call func from n threads at once and return the results."""
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        futures = [executor.submit(func) for _ in range(n)]
+        return [future.result() for future in futures]
+
+
+class TestSingleFlight:
+    """Test per-key call deduplication."""
+
+    def test_concurrent_calls_share_result(self):
+        """Test concurrent callers with the same key run the function once."""
+        single_flight = SingleFlight(timeout=5)
+        calls = []
+
+        def slow_query():
+            calls.append(1)
+            time.sleep(0.2)
+            return "result"
+
+        results = run_concurrently(8, lambda: single_flight.do("key", slow_query))
+
+        assert results == ["result"] * 8
+        assert len(calls) == 1
+
+    def test_error_propagates_to_waiters(self):
+        """Test waiters receive the leader's exception instead of hanging."""
+        single_flight = SingleFlight(timeout=5)
+        started = threading.Event()
+
+        def failing_query():
+            started.set()
+            time.sleep(0.2)
+            raise ValueError("Query failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, "key", failing_query)
+            started.wait()
+            waiter = executor.submit(single_flight.do, "key", Mock())
+            with pytest.raises(ValueError):
+                leader.result()
+            with pytest.raises(ValueError):
+                waiter.result()
+
+    def test_waiter_timeout(self):
+        """Test waiters give up after the timeout."""
+        single_flight = SingleFlight(timeout=0.05)
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocked_query():
+            started.set()
+            release.wait()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(single_flight.do, "key", blocked_query)
+            started.wait()
+            with pytest.raises(InFlightTimeoutError):
+                single_flight.do("key", Mock())
+            release.set()
+            leader.result()
+
+    def test_key_released_after_call(self):
+        """Test a finished call doesn't affect later calls."""
+        single_flight = SingleFlight(timeout=5)
+
+        assert single_flight.do("key", lambda: 1) == 1
+        assert single_flight.do("key", lambda: 2) == 2
+
+
+class TestAsyncSingleFlight:
+    """Test per-key coroutine deduplication."""
+
+    def test_concurrent_awaits_share_result(self):
+        """Test concurrent awaits with the same key run the coroutine once."""
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow_query():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def main():
+            return await asyncio.gather(*(single_flight.do("key", slow_query) for _ in range(5)))
+
+        assert asyncio.run(main()) == ["result"] * 5
+        assert len(calls) == 1
+        assert not single_flight.flight._calls
+
+    def test_cancelled_waiter_does_not_cancel_call(self):
+        """Test the shared call keeps running when one waiter is cancelled."""
+        single_flight = AsyncSingleFlight()
+
+        async def slow_query():
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def main():
+            first = asyncio.ensure_future(single_flight.do("key", slow_query))
+            second = asyncio.ensure_future(single_flight.do("key", slow_query))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(main()) == "result"
+
+    def test_awaits_on_separate_loops_share_result(self):
+        """Test awaits from event loops on other threads, like Flask's per-request loops, run the coroutine once."""
+        single_flight = AsyncSingleFlight(SingleFlight(timeout=5))
+        calls = []
+
+        async def slow_query():
+            calls.append(1)
+            await asyncio.sleep(0.2)
+            return "result"
+
+        results = run_concurrently(4, lambda: asyncio.run(single_flight.do("key", slow_query)))
+
+        assert results == ["result"] * 4
+        assert len(calls) == 1
+
+    def test_sync_callers_share_async_call(self):
+        """Test synchronous callers of the shared SingleFlight wait for a running coroutine."""
+        flight = SingleFlight(timeout=5)
+        single_flight = AsyncSingleFlight(flight)
+        started = threading.Event()
+
+        async def slow_query():
+            started.set()
+            await asyncio.sleep(0.2)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(asyncio.run, single_flight.do("key", slow_query))
+            started.wait()
+            assert flight.do("key", Mock()) == "result"
+            assert leader.result() == "result"
+
+    def test_waiters_rerun_cancelled_call(self):
+        """Test waiters run the call again when the leader's loop cancels it."""
+        single_flight = AsyncSingleFlight(SingleFlight(timeout=5))
+        started = threading.Event()
+
+        async def blocked_query():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def cancelled_leader():
+            task = asyncio.ensure_future(single_flight.do("key", blocked_query))
+            await asyncio.to_thread(started.wait)
+            await asyncio.sleep(0.1)
+            task.cancel()
+
+        async def quick_query():
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(asyncio.run, cancelled_leader())
+            started.wait()
+            assert asyncio.run(single_flight.do("key", quick_query)) == "result"
+            leader.result()
+
+
+class TestDataServiceRequestCoalescing:
+    """Test DataService runs one query for concurrent cold requests."""
+
+    def test_cold_key_queried_once(self):
+        """Test concurrent misses on the same key issue a single backend query."""
+        with patch('services.data_service.get_bigquery_client', return_value=Mock()):
+            service = DataService(credentials={}, project_id="p", dataset_id="d", tables_ids={'yearly_aggregates': 't'}, cache_instance=SimpleCache())
+
+        def slow_query(year_range):
+            time.sleep(0.2)
+            return pl.DataFrame({'release_year': [2000]})
+
+        with patch.object(service.backend, 'get_yearly_trends', side_effect=slow_query) as mock_query:
+            results = run_concurrently(8, lambda: service.get_yearly_trends((2000, 2000)))
+
+        assert mock_query.call_count == 1
+        assert all(result["release_year"].to_list() == [2000] for result in results)
+
+    def test_cold_key_queried_once_across_loops(self):
+        """Test concurrent async requests, each on its own event loop, issue a single backend query."""
+        with patch('services.data_service.get_bigquery_client', return_value=Mock()):
+            service = DataService(credentials={}, project_id="p", dataset_id="d", tables_ids={'yearly_aggregates': 't'}, cache_instance=SimpleCache())
+        calls = []
+
+        async def slow_query(method_name, *args):
+            if method_name == "get_year_range":
+                return pl.DataFrame({'min_year': [1894], 'max_year': [2025]})
+            calls.append(args)
+            await asyncio.sleep(0.2)
+            return pl.DataFrame({'release_year': [2000]})
+
+        with patch.object(service, '_aquery_backend', side_effect=slow_query):
+            results = run_concurrently(8, lambda: asyncio.run(service.aget_yearly_trends((2000, 2000))))
+
+        assert calls == [((2000, 2000),)]
+        assert all(result["release_year"].to_list() == [2000] for result in results)
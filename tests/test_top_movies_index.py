@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+import polars as pl
+from unittest.mock import patch
+from services.parquet_backend import ParquetBackend
+from services.top_movies_index import TopMoviesIndex
+from services.data_service import DataService
+
+GENRES = ['Action', 'Comedy', 'Crime', 'Drama', 'Horror', 'Romance']
+
+
+@pytest.fixture(scope="module")
+def random_movies():
+    """Random movies with distinct vote counts so the ranking has no ties."""
+    rng = np.random.default_rng(7)
+    n = 3000
+    genres = [",".join(rng.choice(GENRES, size=rng.integers(1, 4), replace=False)) for _ in range(n)]
+    return pl.DataFrame({
+        'movie_title': [f"Movie {i}" for i in range(n)],
+        'release_year': rng.integers(1950, 2025, n),
+        'genres': genres,
+        'runtime_minutes': rng.integers(60, 200, n),
+        'is_adult': rng.integers(0, 2, n),
+        'average_rating': np.round(rng.uniform(1, 10, n), 1),
+        'total_votes': rng.permutation(n) * 37 + 10,
+    }).with_columns(
+        pl.when(pl.int_range(pl.len()) % 50 == 0).then(None).otherwise(pl.col("runtime_minutes")).alias("runtime_minutes"),
+        pl.when(pl.int_range(pl.len()) % 97 == 0).then(None).otherwise(pl.col("average_rating")).alias("average_rating"),
+    )
+
+
+@pytest.fixture(scope="module")
+def index(random_movies):
+    """TopMoviesIndex over the random movies."""
+    return TopMoviesIndex(lambda table_name, columns: random_movies.select(columns), refresh_interval=3600)
+
+
+@pytest.fixture(scope="module")
+def backend(random_movies, tmp_path_factory):
+    """ParquetBackend over the same movies, used as the reference implementation."""
+    data_dir = tmp_path_factory.mktemp("movies")
+    random_movies.write_parquet(data_dir / "movies_details.parquet")
+    return ParquetBackend(str(data_dir), ['movies_details'])
+
+
+class TestTopMoviesIndex:
+    """Test the top-K index returns the same rows as a full scan."""
+
+    @pytest.mark.parametrize("year_range, genres, rating, runtime, limit, min_votes", [
+        ((1894, 2025), [], (0, 10), None, 20, 0),
+        ((1990, 2000), ['Drama'], (0, 10), None, 20, 1000),
+        ((1960, 2010), ['Horror', 'Comedy'], (5.0, 8.5), (90, 120), 20, 50000),
+        ((2000, 2000), [], (9.5, 10), None, 5, 0),
+        ((1970, 2020), ['Romance'], (3.3, 7.7), (0, 300), 50, 10000),
+        ((2020, 1990), [], (0, 10), None, 20, 0),
+        ((1894, 2025), ['Unknown'], (0, 10), None, 20, 0),
+        ((1894, 2025), [], (0, 10), (60, 70), 1000, 0),
+    ])
+    def test_matches_full_scan(self, index, backend, year_range, genres, rating, runtime, limit, min_votes):
+        """Test index results match the Parquet backend for various filters."""
+        expected = backend.get_top_movies(year_range, genres, rating, runtime, limit, min_votes)
+        result = index.get_top_movies(year_range, genres, rating, runtime, limit, min_votes)
+
+        assert result.equals(expected)
+
+    def test_zero_limit(self, index):
+        """Test a zero limit returns an empty frame with the result columns."""
+        result = index.get_top_movies((1894, 2025), [], (0, 10), None, 0, 0)
+
+        assert result.is_empty()
+        assert 'movie_title' in result.columns
+
+    def test_data_service_uses_index(self, random_movies, tmp_path):
+        """Test DataService answers top movies from the index, sorted ascending for the chart."""
+        random_movies.write_parquet(tmp_path / "movies_details.parquet")
+        with patch('services.data_service.get_bigquery_client', side_effect=RuntimeError("no credentials")):
+            service = DataService(
+                credentials={}, project_id="p", dataset_id="d", tables_ids={'movies_details': 'movies_details'},
+                backend="parquet", parquet_dir=str(tmp_path), top_movies_index=True
+            )
+
+        with patch.object(service.backend, 'get_top_movies') as mock_query:
+            result = service.get_top_movies((1990, 2000), ['Drama'], (0, 10), None, 20, 1000)
+            mock_query.assert_not_called()
+
+        assert len(result) == 20
+        assert result["average_rating"].is_sorted()
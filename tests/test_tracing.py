@@ -0,0 +1,91 @@
+import asyncio
+import json
+import pytest
+from utils.tracing import Tracer, InMemoryExporter, FileExporter
+
+
+@pytest.fixture
+def exporter():
+    return InMemoryExporter()
+
+
+class TestTracer:
+    """Test span recording, linking and sampling."""
+
+    def test_spans_are_linked_to_request(self, exporter):
+        """Test nested spans share the request's trace ID and point to their parent."""
+        tracer = Tracer(exporter, sample_rate=1.0)
+        token = tracer.start_trace("request-1", path="/_dash-update-component")
+        with tracer.span("callback", chart="top_movies") as outer:
+            with tracer.span("cache_lookup"):
+                pass
+        tracer.end_trace(token)
+
+        lookup, callback, request = exporter.spans("request-1")
+        assert request["name"] == "request" and request["parent_id"] is None
+        assert callback["parent_id"] == request["span_id"]
+        assert lookup["parent_id"] == outer["span_id"]
+        assert callback["attributes"] == {"chart": "top_movies"}
+        assert all(span["duration"] >= 0 for span in (lookup, callback, request))
+
+    def test_unsampled_trace_records_nothing(self, exporter):
+        """Test spans of unsampled requests are not recorded."""
+        tracer = Tracer(exporter, sample_rate=0.0)
+        token = tracer.start_trace("request-1")
+        with tracer.span("callback") as span:
+            assert span is None
+        tracer.end_trace(token)
+
+        assert exporter.spans() == []
+
+    def test_span_outside_request_starts_trace(self, exporter):
+        """Test a span outside a request starts its own trace, followed by its children."""
+        tracer = Tracer(exporter, sample_rate=1.0)
+        with tracer.span("refresh"):
+            with tracer.span("backend_query"):
+                pass
+
+        child, root = exporter.spans()
+        assert child["trace_id"] == root["trace_id"]
+        assert child["parent_id"] == root["span_id"]
+
+    def test_errors_are_recorded(self, exporter):
+        """Test a span records the exception raised in it."""
+        tracer = Tracer(exporter, sample_rate=1.0)
+        with pytest.raises(ValueError):
+            with tracer.span("bigquery_job"):
+                raise ValueError("failed")
+
+        assert exporter.spans()[0]["error"] == "ValueError"
+
+    def test_traced_coroutine_function(self, exporter):
+        """Test the decorator keeps coroutine functions async."""
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        @tracer.traced("fetch")
+        async def fetch():
+            return 1
+
+        assert asyncio.iscoroutinefunction(fetch)
+        assert asyncio.run(fetch()) == 1
+        assert exporter.spans()[0]["name"] == "fetch"
+
+    def test_record_completed_span(self, exporter):
+        """Test a span measured elsewhere, e.g. a client round trip, is recorded in the current trace."""
+        tracer = Tracer(exporter, sample_rate=1.0)
+        token = tracer.start_trace("request-1")
+        tracer.record("dcc_store_round_trip", 0.0, chart="top_movies")
+        tracer.end_trace(token)
+
+        span = exporter.spans("request-1")[0]
+        assert span["name"] == "dcc_store_round_trip"
+        assert span["duration"] > 0
+
+    def test_file_exporter(self, tmp_path):
+        """Test spans are appended to the trace file."""
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(FileExporter(str(path)), sample_rate=1.0)
+        with tracer.span("a"):
+            pass
+
+        assert json.loads(path.read_text())["name"] == "a"
@@ -0,0 +1,106 @@
+import multiprocessing
+import pytest
+from unittest.mock import Mock, patch
+from cachelib import SimpleCache
+from services.data_service import DataService
+from services.warmup import AccessLog, CacheWarmer
+
+TABLES_IDS = {name: name for name in ("movies_details", "year_genre_aggregates", "yearly_aggregates", "runtime_distribution")}
+DEFAULT_STATE = {"year_range": [1894, 2025], "genres": [], "rating_range": [0, 10], "runtime_range": [0, 300]}
+
+
+class TestAccessLog:
+    """Test the persisted filter state log."""
+
+    def test_most_frequent(self, tmp_path):
+        """Test filter states are ranked by request count."""
+        access_log = AccessLog(str(tmp_path / "access.jsonl"))
+        for _ in range(3):
+            access_log.record((1990, 2000), ["Drama"], [0, 10], [0, 300])
+        access_log.record((1894, 2025), [], [0, 10], None)
+
+        top = access_log.most_frequent(1)
+
+        assert top == [{"year_range": [1990, 2000], "genres": ["Drama"], "rating_range": [0, 10], "runtime_range": [0, 300]}]
+
+    def test_compact_keeps_recent_entries(self, tmp_path):
+        """Test compaction keeps only the most recent entries and skips malformed lines."""
+        path = tmp_path / "access.jsonl"
+        access_log = AccessLog(str(path), max_entries=2)
+        access_log.record((1990, 2000), [], [0, 10], None)
+        with open(path, "a") as f:
+            f.write("not json\n")
+        access_log.record((2000, 2010), [], [0, 10], None)
+        access_log.record((2010, 2020), [], [0, 10], None)
+
+        access_log.compact()
+
+        assert [entry["year_range"] for entry in access_log.read()] == [[2000, 2010], [2010, 2020]]
+
+    def test_compact_skips_while_another_process_compacts(self, tmp_path):
+        """Test only one process compacts the log at a time."""
+        path = tmp_path / "access.jsonl"
+        access_log = AccessLog(str(path))
+        access_log.record((1990, 2000), [], [0, 10], None)
+
+        with access_log._file_lock():
+            assert not AccessLog(str(path)).compact()
+        assert access_log.compact()
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_concurrent_workers_keep_all_entries(self, tmp_path):
+        """Test workers compacting and appending at the same time don't lose or mangle entries."""
+        path = str(tmp_path / "access.jsonl")
+        processes = [multiprocessing.Process(target=_compact_and_record, args=(path, worker)) for worker in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        entries = AccessLog(path).read()
+        assert sorted(entry["year_range"][0] for entry in entries) == sorted(worker * 1000 + i for worker in range(4) for i in range(50))
+
+    def test_missing_log(self, tmp_path):
+        """Test a missing log has no entries."""
+        assert AccessLog(str(tmp_path / "missing.jsonl")).most_frequent(5) == []
+
+
+def _compact_and_record(path, worker):
+    access_log = AccessLog(path)
+    for i in range(50):
+        access_log.compact()
+        access_log.record((worker * 1000 + i, 2000), [], [0, 10], None)
+
+
+class TestCacheWarmer:
+    """Test cache warm-up progress tracking."""
+
+    def test_run_prefetches_all_charts(self):
+        """Test every chart and sidebar query runs once per distinct filter state."""
+        data_service = Mock()
+        warmer = CacheWarmer(data_service, top_n_movies=20, min_votes=1000)
+
+        warmer.run([DEFAULT_STATE, dict(DEFAULT_STATE)])
+
+        data_service.get_top_movies.assert_called_once_with((1894, 2025), [], [0, 10], [0, 300], 20, 1000, raise_errors=True)
+        data_service.get_genre_trends.assert_called_once_with((1894, 2025), [], raise_errors=True)
+        data_service.get_runtime_distribution.assert_called_once_with([0, 300], raise_errors=True)
+        data_service.get_yearly_trends.assert_called_once_with((1894, 2025), raise_errors=True)
+        data_service.get_year_range.assert_called_once_with(raise_errors=True)
+        data_service.get_unique_genres.assert_called_once_with(raise_errors=True)
+        assert warmer.progress() == {"status": "ready", "completed": 6, "failed": 0, "total": 6}
+
+    def test_failures_do_not_block_readiness(self):
+        """Test queries failing in a real DataService are counted, not cached, and warm-up still finishes."""
+        client = Mock()
+        client.query.side_effect = Exception("Warehouse down")
+        with patch("services.data_service.get_bigquery_client", return_value=client):
+            data_service = DataService({}, "project", "dataset", TABLES_IDS, cache_instance=SimpleCache())
+        warmer = CacheWarmer(data_service, top_n_movies=20, min_votes=1000)
+
+        assert not warmer.is_ready
+        warmer.start([DEFAULT_STATE]).join()
+
+        assert warmer.is_ready
+        assert warmer.progress() == {"status": "ready", "completed": 6, "failed": 6, "total": 6}
+        assert not data_service.cache.has(data_service._get_cache_key("get_year_range"))
@@ -0,0 +1,185 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+import polars as pl
+import pyarrow as pa
+import pyarrow.ipc
+from flask_caching.backends.base import BaseCache
+
+FILE_SUFFIX = ".arrow"
+PICKLE_KIND = b"pickle"
+FRAME_KIND = b"frame"
+PRUNE_TARGET = 0.8  # Pruning frees space down to this fraction of max_bytes, so the next writes don't prune again
+SCAN_INTERVAL = 60  # Seconds between rescans of the directory size, which counts the other processes' writes
+
+class ArrowFileCache(BaseCache):
+    """
+    Cache storing entries as Arrow IPC files in a local directory.
+
+    DataFrames are written as Arrow tables and read back memory-mapped, so all worker
+    processes on a host share one copy of each result through the page cache, and
+    entries survive restarts. Other values are pickled into a one-cell table.
+    Entries are written under a temporary name and renamed into place, so readers
+    never see a partial file. Expired entries are removed when read, and once the
+    directory grows past max_bytes, expired entries and then the entries closest to
+    expiry are removed until it is down to PRUNE_TARGET of it. Each file's modification
+    time is set to its expiry, so pruning finds them without opening the files.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1024 ** 3, default_timeout: int = 300):
+        """
+        Args:
+            cache_dir (str): Directory holding the cache files, shared by all processes using it
+            max_bytes (int): Approximate size limit of the directory
+            default_timeout (int): Timeout in seconds of entries set without one (0 never expires)
+        """
+        super().__init__(default_timeout=default_timeout)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self._size_lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+        self._size = 0
+        self._next_scan = 0.0
+        self._prune()
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        args.insert(0, config["CACHE_DIR"])
+        return cls(*args, **kwargs)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.md5(key.encode()).hexdigest() + FILE_SUFFIX)
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _open(path: str):
+        """Open a cache file memory-mapped and return its reader and expiry (0 for never)."""
+        reader = pa.ipc.open_file(pa.memory_map(path))
+        expires_at = float((reader.schema.metadata or {}).get(b"expires_at", 0))
+        return reader, expires_at
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            reader, expires_at = self._open(path)
+            if expires_at and expires_at <= time.time():
+                self._remove(path)
+                return None
+            table = reader.read_all()
+            if table.schema.metadata.get(b"kind") == PICKLE_KIND:
+                return pickle.loads(table.column(0)[0].as_py())
+            return pl.from_arrow(table, rechunk=False)
+        except FileNotFoundError:
+            return None
+        except (OSError, pa.ArrowInvalid, pickle.UnpicklingError) as e:
+            logging.warning(f"Removing unreadable cache file {path}: {e}")
+            self._remove(path)
+            return None
+
+    def set(self, key: str, value, timeout: int | None = None) -> bool:
+        timeout = self._normalize_timeout(timeout)
+        if isinstance(value, pl.DataFrame):
+            # String views map back into Polars without copying, unlike large strings
+            table, kind = value.to_arrow(compat_level=pl.CompatLevel.newest()), FRAME_KIND
+        else:
+            table = pa.table({"value": pa.array([pickle.dumps(value, pickle.HIGHEST_PROTOCOL)], pa.binary())})
+            kind = PICKLE_KIND
+        expires_at = time.time() + timeout if timeout > 0 else 0
+        table = table.replace_schema_metadata({b"kind": kind, b"expires_at": str(expires_at).encode()})
+
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            with pa.ipc.new_file(tmp_path, table.schema) as writer:
+                writer.write_table(table)
+            size = os.path.getsize(tmp_path)
+            os.utime(tmp_path, (time.time(), float(expires_at)))
+            try:
+                replaced = os.path.getsize(path)
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except (OSError, pa.ArrowException) as e:
+            logging.warning(f"Could not write cache entry {key}: {e}")
+            self._remove(tmp_path)
+            return False
+
+        with self._size_lock:
+            self._size += size - replaced
+            should_prune = self._size > self.max_bytes or time.monotonic() >= self._next_scan
+        if should_prune:
+            self._prune()
+        return True
+
+    def add(self, key: str, value, timeout: int | None = None) -> bool:
+        if self.has(key):
+            return False
+        return self.set(key, value, timeout)
+
+    def has(self, key: str) -> bool:
+        path = self._path(key)
+        try:
+            _, expires_at = self._open(path)
+        except (OSError, pa.ArrowInvalid):
+            return False
+        return not expires_at or expires_at > time.time()
+
+    def delete(self, key: str) -> bool:
+        return self._remove(self._path(key))
+
+    def clear(self) -> bool:
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith((FILE_SUFFIX, ".tmp")):
+                self._remove(entry.path)
+        with self._size_lock:
+            self._size = 0
+        return True
+
+    def _prune(self) -> None:
+        """
+        Rescan the directory size, and once it is past max_bytes remove the expired entries,
+        then the entries closest to expiry until it is down to PRUNE_TARGET of max_bytes.
+        """
+        if not self._prune_lock.acquire(blocking=False):
+            return  # Another thread is already pruning
+        try:
+            now = time.time()
+            entries = []
+            total = 0
+            for entry in os.scandir(self.cache_dir):
+                if not entry.name.endswith(FILE_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                # The modification time holds the expiry (0 for never)
+                entries.append((stat.st_mtime or float("inf"), stat.st_size, entry.path))
+                total += stat.st_size
+
+            if total > self.max_bytes:
+                entries.sort()
+                for expires_at, size, path in entries:
+                    if expires_at > now and total <= self.max_bytes * PRUNE_TARGET:
+                        break
+                    self._remove(path)
+                    total -= size
+
+            with self._size_lock:
+                self._size = total
+                self._next_scan = time.monotonic() + SCAN_INTERVAL
+        finally:
+            self._prune_lock.release()
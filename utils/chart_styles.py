@@ -1,77 +1,63 @@
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
+import polars as pl
 # Assuming THEME is available/imported here or passed as an argument
-from config import THEME, DARK_ACCENT_COLOR
+from config import THEME, DARK_ACCENT_COLOR, ACCENT_COLOR
+
+CHART_TEMPLATE = "imdb"
 
 def format_label(col_name: str) -> str:
     """Convert snake_case column names to Title Case for display."""
     return col_name.replace('_', ' ').title()
 
-def apply_common_styles(fig: go.Figure, title: str = "", x_col: str = "", y_col: str = "", y2_col: str = "") -> go.Figure:
+def _axis_style() -> dict:
+    return dict(
+        title=dict(font=dict(size=18, color=DARK_ACCENT_COLOR)),
+        showgrid=False,
+        linecolor=THEME["colors"]["gray"][5],
+        tickcolor=THEME["colors"]["gray"][5],
+        tickfont=dict(size=16, color=DARK_ACCENT_COLOR),
+    )
+
+def _build_template() -> go.layout.Template:
     """
-    Apply common styling to plotly figures for consistency across the application.
-    
-    Args:
-        fig (go.Figure): The plotly figure to style
-        title (str): Chart title (will be hidden as titles are handled by chart cards)
-        x_col (str): X-axis column name
-        y_col (str): Y-axis column name
-        y2_col (str): Secondary Y-axis column name (for dual-axis charts)
+    Plotly's default template with the app's common chart styling on top.
 
-    Returns:
-        go.Figure: The styled figure
+    Only the layout and trace defaults of the charts the app draws (cartesian bars and
+    scatters) are kept, since the template is copied into every figure.
     """
-    # Style title if provided
-    title_config = dict(
-        text=title,
-        font=dict(size=20, color=DARK_ACCENT_COLOR)
-    ) if title else dict(text="")
-    
-    # Format axis titles to Title Case if provided
-    xaxis_title = format_label(x_col) if x_col else ""
-    yaxis_title = format_label(y_col) if y_col else ""
+    base = pio.templates["plotly"]
+    template = go.layout.Template(
+        layout=base.layout.to_plotly_json(),
+        data=dict(bar=base.data.bar, scatter=base.data.scatter),
+    )
+    for subplot in ("polar", "ternary", "scene", "geo", "mapbox"):
+        template.layout[subplot] = None
 
-    fig.update_layout(
-        # Title
-        title=title_config,
+    template.layout.update(
+        # Title (hidden as titles are handled by chart cards)
+        title=dict(font=dict(size=20, color=DARK_ACCENT_COLOR)),
 
         # Background and paper styling
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)',
-        
+
         # Font styling
         font_color=DARK_ACCENT_COLOR,
         font_family=THEME["fontFamily"],
-        
-        # Axis styling
-        xaxis=dict(
-            title=dict(
-                text=xaxis_title,
-                font=dict(size=18, color=DARK_ACCENT_COLOR)
-            ),
-            showgrid=False,
-            linecolor=THEME["colors"]["gray"][5],
-            tickcolor=THEME["colors"]["gray"][5],
-            tickfont=dict(size=16, color=DARK_ACCENT_COLOR),
-        ),
-        yaxis=dict(
-            title=dict(
-                text=yaxis_title,
-                font=dict(size=18, color=DARK_ACCENT_COLOR)
-            ),
-            showgrid=False,
-            linecolor=THEME["colors"]["gray"][5],
-            tickcolor=THEME["colors"]["gray"][5],
-            tickfont=dict(size=16, color=DARK_ACCENT_COLOR),
-            rangemode='tozero',
-        ),
-    
-        
+
+        # Axis styling, yaxis also applies to the secondary y-axis
+        xaxis=_axis_style(),
+        yaxis=dict(_axis_style(), rangemode='tozero'),
+
         # Legend styling
         legend=dict(
             bgcolor=THEME["colors"]["gray"][3],
             bordercolor=THEME["colors"]["gray"][3],
             borderwidth=1,
             font_color=DARK_ACCENT_COLOR,
+            tracegroupgap=0,
         ),
 
         # Hide color axis scale if present
@@ -80,27 +66,64 @@ def apply_common_styles(fig: go.Figure, title: str = "", x_col: str = "", y_col:
         # Margin optimization
         margin=dict(l=40, r=40, t=40, b=40),
     )
-    
-    # Apply secondary y-axis styling if y2_col is provided
+
+    # Bar border style
+    template.data.bar[0].marker.line.update(color=ACCENT_COLOR, width=1)
+    return template
+
+pio.templates[CHART_TEMPLATE] = _build_template()
+
+def common_layout(title: str = "", x_col: str = "", y_col: str = "", y2_col: str = "", **kwargs) -> dict:
+    """
+    Build the layout of a chart using the app's registered template.
+
+    Figures get it at construction (go.Figure(traces, layout)), which is much cheaper than
+    styling them afterwards with update_layout.
+
+    Args:
+        title (str): Chart title
+        x_col (str): X-axis column name
+        y_col (str): Y-axis column name
+        y2_col (str): Secondary Y-axis column name (for dual-axis charts)
+        **kwargs: Additional layout properties
+
+    Returns:
+        dict: Layout properties
+    """
+    layout = dict(
+        template=CHART_TEMPLATE,
+        title_text=title,
+        xaxis_title_text=format_label(x_col) if x_col else "",
+        yaxis_title_text=format_label(y_col) if y_col else "",
+        **kwargs,
+    )
     if y2_col:
-        y2axis_title = format_label(y2_col)
-        fig.update_layout(
-            yaxis2=dict(
-                title=dict(
-                    text=y2axis_title,
-                    font=dict(size=18, color=DARK_ACCENT_COLOR)
-                ),
-                overlaying='y',
-                side='right',
-                showgrid=False,
-                linecolor=THEME["colors"]["gray"][5],
-                tickcolor=THEME["colors"]["gray"][5],
-                tickfont=dict(size=16, color=DARK_ACCENT_COLOR),
-                rangemode='tozero',
-            )
+        layout['yaxis2'] = dict(
+            title_text=format_label(y2_col),
+            overlaying='y',
+            side='right',
         )
-    
-    return fig
+    return layout
+
+def column_values(df: pl.DataFrame, col: str) -> np.ndarray:
+    """Return a DataFrame column as a NumPy array for a plotly trace."""
+    return df.get_column(col).to_numpy()
+
+def custom_data(df: pl.DataFrame, cols: list[str]) -> np.ndarray:
+    """
+    Build a trace's customdata from DataFrame columns, one column at a time.
+
+    Numeric columns stay a numeric array (sent as a typed array); mixed columns are
+    written into an object array column by column.
+    """
+    values = [column_values(df, col) for col in cols]
+    if all(df.schema[col].is_numeric() for col in cols):
+        return np.column_stack(values)
+
+    data = np.empty((df.height, len(cols)), dtype=object)
+    for i, column in enumerate(values):
+        data[:, i] = column
+    return data
 
 def format_hover_template(hover_name: str, hover_data: list[str]) -> tuple[str, list[str]]:
     """
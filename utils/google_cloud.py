@@ -1,4 +1,4 @@
-from google.cloud import bigquery
+from google.cloud import bigquery, bigquery_storage
 from google.oauth2 import service_account
 
 def get_bigquery_client(credentials_dict: dict, project_id: str) -> bigquery.Client:
@@ -17,4 +17,20 @@ def get_bigquery_client(credentials_dict: dict, project_id: str) -> bigquery.Cli
         client = bigquery.Client(credentials=credentials, project=project_id)
         return client
     except Exception as e:
-        raise RuntimeError(f"Failed to create BigQuery client: {e}")
\ No newline at end of file
+        raise RuntimeError(f"Failed to create BigQuery client: {e}")
+
+def get_bigquery_storage_client(credentials_dict: dict) -> bigquery_storage.BigQueryReadClient:
+    """
+    Creates and returns a BigQuery Storage Read API client using the provided service account credentials as a dict.
+
+    Args:
+        credentials_dict (dict): Dictionary containing service account credentials.
+
+    Returns:
+        bigquery_storage.BigQueryReadClient: An authenticated BigQuery Storage Read API client instance.
+    """
+    try:
+        credentials = service_account.Credentials.from_service_account_info(credentials_dict)
+        return bigquery_storage.BigQueryReadClient(credentials=credentials)
+    except Exception as e:
+        raise RuntimeError(f"Failed to create BigQuery Storage client: {e}")
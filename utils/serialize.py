@@ -1,15 +1,21 @@
 import base64
 import io
 import polars as pl
+from utils.tracing import span
 
 def df_to_base64_ipc(df: pl.DataFrame) -> str:
     """Serialize a Polars DF to IPC (Arrow) and return base64 string."""
-    buf = io.BytesIO()
-    df.write_ipc(buf)
-    buf.seek(0)
-    return base64.b64encode(buf.read()).decode("ascii")
+    with span("df_to_base64_ipc", rows=len(df)) as s:
+        buf = io.BytesIO()
+        df.write_ipc(buf)
+        buf.seek(0)
+        b64str = base64.b64encode(buf.read()).decode("ascii")
+        if s:
+            s["attributes"]["bytes"] = len(b64str)
+        return b64str
 
 def df_from_base64_ipc(b64str: str) -> pl.DataFrame:
     """Deserialize base64 IPC string back to a Polars DataFrame."""
-    raw = base64.b64decode(b64str)
-    return pl.read_ipc(io.BytesIO(raw))
\ No newline at end of file
+    with span("df_from_base64_ipc", bytes=len(b64str)):
+        raw = base64.b64decode(b64str)
+        return pl.read_ipc(io.BytesIO(raw))
\ No newline at end of file
@@ -0,0 +1,169 @@
+import io
+import sys
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+import polars as pl
+from flask_caching.backends.base import BaseCache
+
+def estimate_size(value) -> int:
+    """Approximate memory footprint of a cached value in bytes."""
+    if isinstance(value, pl.DataFrame):
+        return value.estimated_size()
+    if isinstance(value, np.ndarray):
+        return value.nbytes + (sum(sys.getsizeof(item) for item in value.flat) if value.dtype == object else 0)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+class _Shard:
+    """One LRU partition of the cache with its own lock and byte budget."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[str, tuple] = OrderedDict()  # key -> (value, expires_at, size, raw_size), least recently used first
+        self.size = 0
+        self.raw_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def pop(self, key: str):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+            self.raw_size -= entry[3]
+        return entry
+
+class _CompressedFrame:
+    """A DataFrame held as a compressed Arrow IPC buffer."""
+    __slots__ = ("buffer",)
+
+    def __init__(self, df: pl.DataFrame, compression: str):
+        buf = io.BytesIO()
+        df.write_ipc(buf, compression=compression)
+        self.buffer = buf.getvalue()
+
+    def load(self) -> pl.DataFrame:
+        return pl.read_ipc(io.BytesIO(self.buffer))
+
+class ShardedLRUCache(BaseCache):
+    """
+    In-process cache bounded by bytes instead of entry count.
+
+    Values are stored by reference (DataFrames are not pickled or copied) and sized
+    with DataFrame.estimated_size(). Keys are spread over shards, each with its own
+    lock and an equal part of the memory budget, evicting its least recently used
+    entries when it is over budget.
+
+    With compression set, DataFrames of at least compression_threshold bytes are kept
+    as compressed Arrow IPC buffers instead, trading a decompression on every hit for
+    several times more entries in the same budget.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 ** 2, shards: int = 16, default_timeout: int = 300, compression: str | None = None, compression_threshold: int = 64 * 1024):
+        """
+        Args:
+            max_bytes (int): Memory budget of all entries together
+            shards (int): Number of independently locked partitions
+            default_timeout (int): Timeout in seconds of entries set without one (0 never expires)
+            compression (str): Arrow IPC compression of large DataFrames ("lz4" or "zstd"), None to store them as they are
+            compression_threshold (int): Estimated size in bytes from which DataFrames are compressed
+        """
+        super().__init__(default_timeout=default_timeout)
+        self.max_bytes = max_bytes
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._shards = [_Shard(max_bytes // shards) for _ in range(shards)]
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        return cls(*args, **kwargs)
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: str):
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is not None and entry[1] and entry[1] <= time.monotonic():
+                shard.pop(key)
+                entry = None
+            if entry is None:
+                shard.misses += 1
+                return None
+            shard.entries.move_to_end(key)
+            shard.hits += 1
+            value = entry[0]
+        if isinstance(value, _CompressedFrame):
+            return value.load()
+        return value
+
+    def set(self, key: str, value, timeout: int | None = None) -> bool:
+        timeout = self._normalize_timeout(timeout)
+        expires_at = time.monotonic() + timeout if timeout > 0 else 0
+        size = raw_size = estimate_size(value)
+        if self.compression and isinstance(value, pl.DataFrame) and raw_size >= self.compression_threshold:
+            value = _CompressedFrame(value, self.compression)
+            size = len(value.buffer)
+        shard = self._shard(key)
+        if size > shard.max_bytes:
+            # Caching it would flush the whole shard
+            self.delete(key)
+            return False
+
+        with shard.lock:
+            shard.pop(key)
+            shard.entries[key] = (value, expires_at, size, raw_size)
+            shard.size += size
+            shard.raw_size += raw_size
+            while shard.size > shard.max_bytes:
+                shard.pop(next(iter(shard.entries)))
+                shard.evictions += 1
+        return True
+
+    def add(self, key: str, value, timeout: int | None = None) -> bool:
+        if self.has(key):
+            return False
+        return self.set(key, value, timeout)
+
+    def has(self, key: str) -> bool:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            return entry is not None and (not entry[1] or entry[1] > time.monotonic())
+
+    def delete(self, key: str) -> bool:
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.pop(key) is not None
+
+    def clear(self) -> bool:
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.size = 0
+                shard.raw_size = 0
+        return True
+
+    def stats(self) -> dict:
+        """
+        Return entry, byte, hit, miss and eviction counts summed over the shards, and the
+        compression ratio (uncompressed over stored bytes) of the entries held.
+        """
+        stats = {"entries": 0, "bytes": 0, "raw_bytes": 0, "max_bytes": self.max_bytes, "hits": 0, "misses": 0, "evictions": 0}
+        for shard in self._shards:
+            with shard.lock:
+                stats["entries"] += len(shard.entries)
+                stats["bytes"] += shard.size
+                stats["raw_bytes"] += shard.raw_size
+                stats["hits"] += shard.hits
+                stats["misses"] += shard.misses
+                stats["evictions"] += shard.evictions
+        stats["compression_ratio"] = stats["raw_bytes"] / stats["bytes"] if stats["bytes"] else 1.0
+        return stats
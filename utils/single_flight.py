@@ -0,0 +1,125 @@
+import asyncio
+import threading
+
+class InFlightTimeoutError(TimeoutError):
+    """Raised when a waiter gives up on an in-flight call."""
+
+class _Call:
+    """State of one in-flight call shared with its waiters."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.cancelled = False
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls by key.
+
+    The first caller for a key runs the function; callers arriving while it is
+    running wait for its result (or exception) instead of running it again.
+    """
+
+    def __init__(self, timeout: float | None = None):
+        """
+        Args:
+            timeout (float): Seconds a waiter waits for the running call before raising InFlightTimeoutError (None waits forever)
+        """
+        self.timeout = timeout
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def _join(self, key: str) -> tuple[_Call, bool]:
+        """Return the running call for key, or start one; and whether the caller leads it."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                return call, True
+            return call, False
+
+    def _finish(self, key: str, call: _Call):
+        """Release the key and wake the call's waiters."""
+        with self._lock:
+            del self._calls[key]
+        call.done.set()
+
+    def _wait(self, key: str, call: _Call) -> bool:
+        """Wait for a call led by another caller; return False if it was cancelled before finishing."""
+        if not call.done.wait(self.timeout):
+            raise InFlightTimeoutError(f"Timed out after {self.timeout}s waiting for in-flight call {key}")
+        if call.cancelled:
+            return False
+        if call.error is not None:
+            raise call.error
+        return True
+
+    def do(self, key: str, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) unless a call with the same key is already running, then share its outcome.
+
+        Raises:
+            InFlightTimeoutError: If the running call doesn't finish within the timeout
+            Exception: Whatever the running call raised
+        """
+        call, is_leader = self._join(key)
+        if not is_leader:
+            if self._wait(key, call):
+                return call.result
+            # The leading call was cancelled with its caller, run it again
+            return self.do(key, func, *args, **kwargs)
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+
+class AsyncSingleFlight:
+    """
+    Deduplicate concurrent coroutine calls by key.
+
+    Calls are shared through a thread-level SingleFlight, so awaits from other event loops
+    (Flask runs each async request in a new one) and synchronous callers of the same key
+    wait for the running call too. Waiters on other loops wait for it in a worker thread.
+    """
+
+    def __init__(self, flight: SingleFlight | None = None):
+        """
+        Args:
+            flight (SingleFlight): Calls to share, and the timeout of their waiters (a new SingleFlight by default)
+        """
+        self.flight = flight or SingleFlight()
+
+    async def do(self, key: str, func, *args, **kwargs):
+        """
+        Await func(*args, **kwargs) unless a call with the same key is already running, then share its outcome.
+
+        Raises:
+            InFlightTimeoutError: If the running call doesn't finish within the flight's timeout
+            Exception: Whatever the running call raised
+        """
+        call, is_leader = self.flight._join(key)
+        if not is_leader:
+            if await asyncio.to_thread(self.flight._wait, key, call):
+                return call.result
+            # The leading call was cancelled with its caller, run it again
+            return await self.do(key, func, *args, **kwargs)
+
+        def finish(task: asyncio.Task):
+            if task.cancelled():
+                call.cancelled = True
+            elif task.exception() is not None:
+                call.error = task.exception()
+            else:
+                call.result = task.result()
+            self.flight._finish(key, call)
+
+        task = asyncio.ensure_future(func(*args, **kwargs))
+        task.add_done_callback(finish)
+        # A cancelled caller must not cancel the call for the others
+        return await asyncio.shield(task)
@@ -0,0 +1,183 @@
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+
+class InMemoryExporter:
+    """Keeps the most recent finished spans in memory."""
+
+    def __init__(self, max_spans: int = 10000):
+        self._spans = deque(maxlen=max_spans)
+
+    def export(self, span: dict) -> None:
+        self._spans.append(span)
+
+    def spans(self, trace_id: str | None = None) -> list[dict]:
+        """Return the spans kept, oldest first, optionally only those of one trace."""
+        spans = list(self._spans)
+        return [span for span in spans if span["trace_id"] == trace_id] if trace_id else spans
+
+class FileExporter:
+    """Appends finished spans to a JSON lines file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: dict) -> None:
+        try:
+            with self._lock, open(self.path, "a") as f:
+                f.write(json.dumps(span, default=str) + "\n")
+        except OSError as e:
+            logging.warning(f"Could not write trace span: {e}")
+
+class _Trace:
+    __slots__ = ("trace_id", "sampled")
+
+    def __init__(self, trace_id: str, sampled: bool):
+        self.trace_id = trace_id
+        self.sampled = sampled
+
+class Tracer:
+    """
+    Lightweight span tracing linked by a request ID.
+
+    A trace is started per request and sampled as a whole, so the spans of a sampled
+    request are all kept. Outside a sampled trace, span() only reads a context variable.
+    """
+
+    def __init__(self, exporter=None, sample_rate: float = 0.0):
+        """
+        Args:
+            exporter: Object whose export(span) receives finished spans (InMemoryExporter by default)
+            sample_rate (float): Fraction of traces recorded, from 0 (off) to 1 (all)
+        """
+        self.exporter = exporter or InMemoryExporter()
+        self.sample_rate = sample_rate
+        self._trace = contextvars.ContextVar("trace", default=None)
+        self._parent = contextvars.ContextVar("parent_span", default=None)
+
+    def configure(self, exporter=None, sample_rate: float | None = None) -> None:
+        if exporter is not None:
+            self.exporter = exporter
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+
+    @property
+    def trace_id(self) -> str | None:
+        """ID of the sampled trace of the current context, None if it isn't recorded."""
+        trace = self._trace.get()
+        return trace.trace_id if trace and trace.sampled else None
+
+    def start_trace(self, request_id: str | None = None, name: str = "request", **attributes):
+        """
+        Start the trace of a request, deciding whether it is sampled.
+
+        Returns:
+            Token to pass to end_trace once the request is done
+        """
+        trace = _Trace(request_id or uuid.uuid4().hex, random.random() < self.sample_rate)
+        root = self._open(trace, name, attributes) if trace.sampled else None
+        return self._trace.set(trace), root
+
+    def end_trace(self, token) -> None:
+        """End the trace started by start_trace, exporting its root span."""
+        trace_token, root = token
+        if root is not None:
+            self._close(*root)
+        self._trace.reset(trace_token)
+
+    def _open(self, trace: _Trace, name: str, attributes: dict):
+        span = {
+            "trace_id": trace.trace_id,
+            "span_id": uuid.uuid4().hex[:16],
+            "parent_id": self._parent.get(),
+            "name": name,
+            "start": time.time(),
+            "duration": None,
+            "attributes": attributes,
+        }
+        return span, time.perf_counter(), self._parent.set(span["span_id"])
+
+    def _close(self, span: dict, start: float, parent_token) -> None:
+        span["duration"] = time.perf_counter() - start
+        self._parent.reset(parent_token)
+        self.exporter.export(span)
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """
+        Record a span around a block, as a child of the current span.
+
+        Outside a request, a span starts its own trace (sampled like requests). Yields the
+        span dict, whose "attributes" can be extended, or None when it isn't recorded.
+        """
+        trace = self._trace.get()
+        if trace is not None and not trace.sampled:
+            yield None
+            return
+
+        # Nested spans follow the sampling decision of the trace started here
+        trace_token = None
+        if trace is None:
+            trace = _Trace(uuid.uuid4().hex, random.random() < self.sample_rate)
+            trace_token = self._trace.set(trace)
+        try:
+            if not trace.sampled:
+                yield None
+                return
+            span, start, parent_token = self._open(trace, name, attributes)
+            try:
+                yield span
+            except BaseException as e:
+                span["error"] = type(e).__name__
+                raise
+            finally:
+                self._close(span, start, parent_token)
+        finally:
+            if trace_token is not None:
+                self._trace.reset(trace_token)
+
+    def record(self, name: str, start: float, **attributes) -> None:
+        """Record a span that started at the wall clock time start and ends now, e.g. a client round trip."""
+        trace = self._trace.get()
+        if trace is None or not trace.sampled:
+            return
+        self.exporter.export({
+            "trace_id": trace.trace_id,
+            "span_id": uuid.uuid4().hex[:16],
+            "parent_id": self._parent.get(),
+            "name": name,
+            "start": start,
+            "duration": time.time() - start,
+            "attributes": attributes,
+        })
+
+    def traced(self, name: str):
+        """Decorator recording a span around each call of a function or coroutine function."""
+        def decorator(func):
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+TRACER = Tracer()
+span = TRACER.span
+traced = TRACER.traced
+record = TRACER.record
@@ -1,5 +1,7 @@
 from dash.exceptions import PreventUpdate
+from utils.tracing import traced
 
+@traced("validate_date_range")
 def validate_date_range(date_range):
     """Validate that date range is complete and valid."""
     if not date_range or len(date_range) != 2: